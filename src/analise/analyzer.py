@@ -0,0 +1,353 @@
+"""
+Execução da análise léxica e sintática sem interface gráfica
+Usado pela GUI (em segundo plano) e por qualquer outro ponto de entrada
+"""
+import time
+from itertools import islice
+
+from ..lexico.lexico import TontoLexer, lexical_error
+from ..sintatico.events import SummaryCollector
+from ..sintatico.parser import TontoParser
+from .spans import LineIndex
+
+
+class AnalysisCancelled(Exception):
+    """Análise interrompida a pedido do usuário"""
+
+
+class _BudgetExceeded(Exception):
+    """Limite da análise atingido; tratado pelo próprio TontoAnalyzer"""
+
+    def __init__(self, limit, description, token):
+        super().__init__(description)
+        self.limit = limit              # 'tempo', 'tokens' ou 'diagnosticos'
+        self.description = description
+        self.token = token              # Onde a análise parou (ou None)
+
+
+class _Budget:
+    """Limites de uma análise (None desativa cada um), verificados a cada poucos tokens"""
+
+    def __init__(self, max_seconds=None, max_tokens=None, max_diagnostics=None):
+        self.max_seconds = max_seconds
+        self.max_tokens = max_tokens
+        self.max_diagnostics = max_diagnostics
+        self.deadline = None if max_seconds is None else time.perf_counter() + max_seconds
+
+    def check(self, diagnostics, token):
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise _BudgetExceeded('tempo', f"limite de tempo de {self.max_seconds:g} s", token)
+        if self.max_diagnostics is not None and diagnostics > self.max_diagnostics:
+            raise _BudgetExceeded('diagnosticos',
+                                  f"limite de {self.max_diagnostics} diagnóstico(s)", token)
+
+    def limited(self, tokens):
+        """Os tokens, interrompidos ao passar de max_tokens"""
+        if self.max_tokens is None:
+            return tokens
+        return self._limited(tokens)
+
+    def truncated(self, tokens):
+        """
+        Os primeiros max_tokens tokens, sem exceção: o token seguinte (que
+        passou do limite) fica em self.overflow, e a análise continua
+        com o que foi lido
+        """
+        self.overflow = None
+        if self.max_tokens is None:
+            return tokens
+        return self._truncated(iter(tokens))
+
+    def _truncated(self, tokens):
+        yield from islice(tokens, self.max_tokens)
+        self.overflow = next(tokens, None)
+
+    def _limited(self, tokens):
+        tokens = iter(tokens)
+        yield from islice(tokens, self.max_tokens)
+        tok = next(tokens, None)
+        if tok is not None:
+            raise _BudgetExceeded('tokens', f"limite de {self.max_tokens} tokens", tok)
+
+
+def budget_error(exceeded):
+    """Diagnóstico de análise interrompida por um limite"""
+    token = exceeded.token
+    return {
+        'linha': token.lineno if token is not None else -1,
+        'coluna': token.lexpos if token is not None else -1,
+        'tipo': 'Limite Excedido',
+        'token': 'BUDGET',
+        'valor': exceeded.limit,
+        'mensagem': f"Análise interrompida: {exceeded.description} excedido; "
+                    f"os resultados contêm só o que foi analisado até aqui",
+        'sugestao': "Divida o arquivo em arquivos menores, corrija os erros iniciais "
+                    "ou aumente o limite da análise",
+    }
+
+
+class TontoAnalyzer:
+    """
+    Agrupa um léxico e um parser já construídos para reutilização.
+
+    Construir léxico e parser (importar o PLY e carregar as tabelas) é a
+    parte cara da inicialização, então cada instância deve ser criada uma
+    vez e usada em várias análises. A construção só acontece no primeiro
+    uso, ou antes, em warm_up(). Uma instância não deve ser compartilhada
+    entre threads.
+
+    names: tabela de internação dos nomes (lexico.names.NameTable); por
+    padrão, a tabela NAMES do processo.
+    """
+
+    # A cada quantos tokens o progresso é reportado e o cancelamento e os
+    # limites (tempo e diagnósticos) são verificados
+    CHECK_INTERVAL = 2000
+
+    def __init__(self, names=None):
+        self.names = names
+        self._lexer = None
+        self._parser = None
+
+    @property
+    def lexer(self):
+        if self._lexer is None:
+            lexer = TontoLexer()
+            if self.names is not None:
+                lexer.names = self.names
+            lexer.build()
+            self._lexer = lexer
+        return self._lexer
+
+    @property
+    def parser(self):
+        if self._parser is None:
+            parser = TontoParser(self.lexer)
+            parser.build(debug=False, write_tables=False)
+            self._parser = parser
+        return self._parser
+
+    def warm_up(self):
+        """Constrói léxico e parser agora (ex.: em segundo plano), e não na primeira análise"""
+        return self.parser
+
+    def analyze(self, source, progress=None, cancel_event=None,
+                max_seconds=None, max_tokens=None, max_diagnostics=None):
+        """
+        Executa as análises léxica e sintática.
+
+        progress: função opcional (fase, fração) chamada periodicamente
+        cancel_event: threading.Event opcional; quando setado a análise
+                      é interrompida com AnalysisCancelled
+        max_seconds, max_tokens, max_diagnostics: limites opcionais da
+                      análise. Ao passar de um deles a análise para e
+                      devolve o que já tinha (tokens, erros e declarações
+                      reconhecidas), com um diagnóstico 'Limite Excedido'
+                      no fim de syn_errors e o limite atingido em
+                      'budget_exceeded'. Com max_tokens, os tokens lidos até
+                      o limite ainda passam pela análise sintática.
+        """
+        total_size = max(1, len(source))
+        budget = None
+        if max_seconds is not None or max_tokens is not None or max_diagnostics is not None:
+            budget = _Budget(max_seconds, max_tokens, max_diagnostics)
+
+        def checkpoint(phase, fraction):
+            if cancel_event is not None and cancel_event.is_set():
+                raise AnalysisCancelled()
+            if progress is not None:
+                progress(phase, fraction)
+
+        lexer = self.lexer
+        tokens = []
+        result = None
+        syn_errors = []
+        parsed = False
+        exceeded = None
+        try:
+            # ANÁLISE LÉXICA
+            checkpoint('lexico', 0.0)
+            self._tokenize(source, tokens, total_size, checkpoint, budget)
+
+            # ANÁLISE SINTÁTICA (reaproveita os tokens, sem lexar novamente)
+            checkpoint('sintatico', 0.0)
+            parsed = True
+            result, syn_errors = self.parser.parse_tokens(
+                self._monitored(tokens, checkpoint, budget))
+            if budget is not None:
+                # Erros do fim da análise (ou de arquivos menores que o intervalo)
+                budget.check(len(lexer.errors) + len(syn_errors), tokens[-1] if tokens else None)
+                if budget.overflow is not None:
+                    raise _BudgetExceeded('tokens', f"limite de {budget.max_tokens} tokens",
+                                          budget.overflow)
+            checkpoint('sintatico', 1.0)
+        except _BudgetExceeded as e:
+            exceeded = e
+            syn_errors = self.parser.errors if parsed else []
+        finally:
+            lexer.error_handler = None
+        lex_errors = lexer.errors
+        comments = lexer.comments
+
+        # Contagem de categorias para o resumo léxico
+        categories = {}
+        for token in tokens:
+            cat = lexer.get_token_category(token.type)
+            categories[cat] = categories.get(cat, 0) + 1
+
+        # Copiar as listas do parser: elas são limpas na próxima análise
+        summary = self.parser.get_analysis_summary() if parsed else SummaryCollector().summary(0)
+        summary = {key: list(value) if isinstance(value, list) else value
+                   for key, value in summary.items()}
+
+        syn_errors = list(syn_errors)
+        if exceeded is not None:
+            if max_diagnostics is not None:
+                lex_errors = lex_errors[:max_diagnostics]
+                del syn_errors[max(0, max_diagnostics - len(lex_errors)):]
+            syn_errors.append(budget_error(exceeded))
+            summary['total_errors'] = len(syn_errors)
+
+        return {
+            'result': result,
+            'tokens': tokens,
+            'lex_errors': lex_errors,
+            'syn_errors': syn_errors,
+            'comments': comments,
+            'categories': categories,
+            'summary': summary,
+            # Limite que interrompeu a análise ('tempo', 'tokens', 'diagnosticos')
+            'budget_exceeded': exceeded.limit if exceeded is not None else None,
+            # Converte os 'span' dos nós em linha/coluna sob demanda
+            'line_index': LineIndex(source)
+        }
+
+    def stream(self, source, handler, progress=None, cancel_event=None,
+               max_seconds=None, max_tokens=None, max_diagnostics=None):
+        """
+        Análise em streaming: declarações e erros (léxicos e sintáticos) vão
+        para handler (sintatico.events.ParseHandler) assim que reconhecidos.
+        Os tokens são entregues ao parser à medida que o léxico os produz e
+        nem eles, nem os nós, nem os comentários ficam guardados.
+
+        Retorna só as contagens: {'token_count', 'lex_errors', 'syn_errors',
+        'categories', 'budget_exceeded'}. Os demais parâmetros funcionam
+        como em analyze(); o diagnóstico de limite excedido vai para
+        handler.on_error. Como erros já entregues não podem ser desfeitos,
+        com max_diagnostics a verificação é feita a cada token (e ainda
+        assim o último erro sintático pode passar do limite).
+        """
+        total_size = max(1, len(source))
+        budget = None
+        if max_seconds is not None or max_tokens is not None or max_diagnostics is not None:
+            budget = _Budget(max_seconds, max_tokens, max_diagnostics)
+
+        def checkpoint(phase, fraction):
+            if cancel_event is not None and cancel_event.is_set():
+                raise AnalysisCancelled()
+            if progress is not None:
+                progress(phase, fraction)
+
+        lexer = self.lexer
+        parser = self.parser
+        counts = {'token_count': 0, 'lex_errors': 0}
+        types = {}
+
+        def on_lex_error(token):
+            if budget is not None:
+                budget.check(counts['lex_errors'] + parser.error_count + 1, token)
+            counts['lex_errors'] += 1
+            handler.on_error(lexical_error(token))
+
+        def tokens():
+            interval = self.CHECK_INTERVAL
+            every_token = budget is not None and budget.max_diagnostics is not None
+            count = 0
+            for tok in lexer.lexer if budget is None else budget.limited(lexer.lexer):
+                count += 1
+                counts['token_count'] = count
+                types[tok.type] = types.get(tok.type, 0) + 1
+                if count % interval == 0:
+                    lexer.comments.clear()
+                    checkpoint('sintatico', tok.lexpos / total_size)
+                    if budget is not None:
+                        budget.check(counts['lex_errors'] + parser.error_count, tok)
+                elif every_token:
+                    budget.check(counts['lex_errors'] + parser.error_count, tok)
+                yield tok
+
+        lexer.errors = []
+        lexer.comments = []
+        lexer.error_handler = on_lex_error
+        lexer.lexer.lineno = 1
+        lexer.lexer.input(source)
+        counts['budget_exceeded'] = None
+        checkpoint('sintatico', 0.0)
+        try:
+            parser.parse_tokens(tokens(), handler=handler)
+            checkpoint('sintatico', 1.0)
+        except _BudgetExceeded as e:
+            counts['budget_exceeded'] = e.limit
+            handler.on_error(budget_error(e))
+        finally:
+            lexer.error_handler = None
+            lexer.comments = []
+
+        categories = {}
+        for token_type, count in types.items():
+            cat = lexer.get_token_category(token_type)
+            categories[cat] = categories.get(cat, 0) + count
+
+        counts['syn_errors'] = parser.error_count
+        counts['categories'] = categories
+        return counts
+
+    def _tokenize(self, source, tokens, total_size, checkpoint, budget):
+        """
+        Tokeniza (em tokens) verificando progresso, cancelamento e limites
+        a cada CHECK_INTERVAL tokens; com limites, cada erro léxico também
+        é verificado, já que uma sequência de erros não produz tokens.
+        """
+        lexer = self.lexer
+        lexer.errors = []
+        lexer.comments = []
+        lexer.lexer.lineno = 1
+        lexer.lexer.input(source)
+
+        stream = lexer.lexer
+        if budget is not None:
+            errors = lexer.errors
+
+            def on_lex_error(token):
+                errors.append(token)
+                budget.check(len(errors), token)
+
+            lexer.error_handler = on_lex_error
+            stream = budget.truncated(stream)
+
+        interval = self.CHECK_INTERVAL
+        for tok in stream:
+            tokens.append(tok)
+            if len(tokens) % interval == 0:
+                checkpoint('lexico', tok.lexpos / total_size)
+                if budget is not None:
+                    budget.check(len(lexer.errors), tok)
+
+    def _monitored(self, tokens, checkpoint, budget):
+        """
+        Entrega os tokens ao parser verificando progresso, cancelamento e
+        limites; com max_diagnostics, os erros são conferidos a cada token
+        """
+        total = max(1, len(tokens))
+        interval = self.CHECK_INTERVAL
+        lex_errors = len(self.lexer.errors)
+        parser = self.parser
+        every_token = budget is not None and budget.max_diagnostics is not None
+        for index, tok in enumerate(tokens):
+            if index % interval == 0:
+                checkpoint('sintatico', index / total)
+                if budget is not None:
+                    budget.check(lex_errors + parser.error_count, tok)
+            elif every_token:
+                budget.check(lex_errors + parser.error_count, tok)
+            yield tok
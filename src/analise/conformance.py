@@ -0,0 +1,66 @@
+"""
+Corpus de conformidade do parser
+
+Cada arquivo .tonto da pasta do corpus tem o resultado esperado registrado
+em esperado.json: posições dos erros e um hash da árvore, dos erros e do
+resumo da análise. Mudanças na gramática ou no driver LR devem manter o
+corpus inalterado (ou atualizar esperado.json de forma consciente).
+"""
+import hashlib
+import json
+import os
+
+from .analyzer import TontoAnalyzer
+from .workspace import find_tonto_files
+
+
+EXPECTED_FILE = 'esperado.json'
+
+
+def snapshot(analysis):
+    """Resultado comparável de uma análise: erros (linha, coluna, token) e hash completo"""
+    content = json.dumps([analysis['result'], analysis['syn_errors'], analysis['summary']],
+                         sort_keys=True, ensure_ascii=False, default=str)
+    return {
+        'errors': [[error['linha'], error['coluna'], error['token']]
+                   for error in analysis['syn_errors']],
+        'digest': hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest(),
+    }
+
+
+def check_corpus(folder, update=False, analyzer=None):
+    """
+    Analisa o corpus e compara com esperado.json.
+
+    Retorna uma lista de (nome, situação) com situação 'ok', 'diferente',
+    'novo' (sem resultado esperado) ou 'atualizado' (com update=True,
+    que regrava esperado.json com os resultados atuais).
+    """
+    analyzer = analyzer or TontoAnalyzer()
+    expected_path = os.path.join(folder, EXPECTED_FILE)
+    try:
+        with open(expected_path, 'r', encoding='utf-8') as file:
+            expected = json.load(file)
+    except FileNotFoundError:
+        expected = {}
+
+    current = {}
+    report = []
+    for path in find_tonto_files(folder):
+        name = os.path.relpath(path, folder).replace(os.sep, '/')
+        with open(path, 'r', encoding='utf-8') as file:
+            current[name] = snapshot(analyzer.analyze(file.read()))
+
+        if update:
+            status = 'atualizado'
+        elif name not in expected:
+            status = 'novo'
+        else:
+            status = 'ok' if expected[name] == current[name] else 'diferente'
+        report.append((name, status))
+
+    if update:
+        with open(expected_path, 'w', encoding='utf-8', newline='\n') as file:
+            json.dump(current, file, indent=2, sort_keys=True, ensure_ascii=False)
+            file.write('\n')
+    return report
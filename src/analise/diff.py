@@ -0,0 +1,176 @@
+"""
+Diferença estrutural entre duas versões de uma ontologia
+
+As declarações são identificadas pelo nome qualificado (pacote.Classe,
+pacote.Classe.atributo, ...) e cada uma recebe um hash do seu conteúdo
+normalizado (sem números de linha) que inclui os hashes dos filhos.
+Subárvores com o mesmo hash nas duas versões são ignoradas sem serem
+percorridas.
+"""
+import hashlib
+import json
+
+
+# Campos próprios (sem filhos) de cada tipo de declaração
+OWN_FIELDS = {
+    'class': ('stereotype', 'parents', 'partition'),
+    'datatype': (),
+    'enum': ('instances',),
+    'genset': ('modifiers', 'general', 'specifics'),
+    'attribute': ('type', 'cardinality'),
+    'relation': ('stereotype', 'name', 'source', 'source_cardinality', 'arrow',
+                 'arrow2', 'target_cardinality', 'target'),
+    'package': (),
+}
+
+
+def _digest(value):
+    data = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _node(kind, name, item, children=None):
+    """Nó da árvore de declarações com hash do conteúdo e dos filhos"""
+    fields = {}
+    for field in OWN_FIELDS[kind]:
+        value = item.get(field)
+        if isinstance(value, dict):
+            value = value.get('text', value)     # Cardinalidade: só o texto
+        fields[field] = value
+    if kind == 'relation' and fields['name'] is None:
+        fields['name'] = item.get('relation_name')
+
+    children = children or {}
+    content = [kind, fields, sorted(child['hash'] for child in children.values())]
+    return {
+        'kind': kind,
+        'name': name,
+        'line': item.get('line'),
+        'fields': fields,
+        'children': children,
+        'hash': _digest(content),
+    }
+
+
+def _unique(names, name):
+    """Diferencia nomes repetidos (ex.: relações sem nome) pela ocorrência"""
+    count = names.get(name, 0)
+    names[name] = count + 1
+    return name if count == 0 else f"{name}#{count + 1}"
+
+
+def _relation_name(owner, relation):
+    label = relation.get('name') or relation.get('relation_name') or relation.get('stereotype') or ''
+    source = relation.get('source') or owner
+    return f"{source}-{label}->{relation.get('target')}"
+
+
+def build_declaration_tree(summary):
+    """
+    Árvore nome_qualificado -> nó a partir do resumo hierárquico por pacote.
+    Cada nó: kind, name, line, fields, children e hash.
+    """
+    packages = {}
+    package_names = {}
+
+    for entry in summary['package_tree']:
+        package = _unique(package_names, entry['package']['name'])
+        children = {}
+        names = {}
+
+        for group in entry['classes']:
+            cls = group['class']
+            qualified = _unique(names, f"{package}.{cls['name']}")
+            members = {}
+            member_names = {}
+            for attribute in group['attributes']:
+                name = _unique(member_names, f"{qualified}.{attribute['name']}")
+                members[name] = _node('attribute', name, attribute)
+            for relation in group['relations']:
+                name = _unique(member_names, f"{qualified}.{_relation_name(cls['name'], relation)}")
+                members[name] = _node('relation', name, relation)
+            children[qualified] = _node('class', qualified, cls, members)
+
+        for datatype in entry['datatypes']:
+            qualified = _unique(names, f"{package}.{datatype['name']}")
+            members = {}
+            member_names = {}
+            for attribute in datatype['attributes']:
+                name = _unique(member_names, f"{qualified}.{attribute['name']}")
+                members[name] = _node('attribute', name, attribute)
+            children[qualified] = _node('datatype', qualified, datatype, members)
+
+        for enum in entry['enums']:
+            qualified = _unique(names, f"{package}.{enum['name']}")
+            children[qualified] = _node('enum', qualified, enum)
+
+        for genset in entry['gensets']:
+            qualified = _unique(names, f"{package}.{genset['name']}")
+            children[qualified] = _node('genset', qualified, genset)
+
+        for relation in entry['external_relations']:
+            qualified = _unique(names, f"{package}.{_relation_name(None, relation)}")
+            children[qualified] = _node('relation', qualified, relation)
+
+        packages[package] = _node('package', package, entry['package'], children)
+
+    return packages
+
+
+def diff_trees(old, new):
+    """
+    Compara duas árvores de build_declaration_tree.
+
+    Retorna {'added': [...], 'removed': [...], 'modified': [...]}, com
+    entradas {'kind', 'name', 'line'} e, nas modificadas, 'changes':
+    campo -> {'old', 'new'}.
+    """
+    result = {'added': [], 'removed': [], 'modified': []}
+    _diff_children(old, new, result)
+    return result
+
+
+def _diff_children(old, new, result):
+    for name, node in old.items():
+        other = new.get(name)
+        if other is None:
+            _flatten(node, result['removed'])
+        elif other['hash'] != node['hash']:
+            _diff_node(node, other, result)
+        # Hashes iguais: subárvore idêntica, nada a percorrer
+
+    for name, node in new.items():
+        if name not in old:
+            _flatten(node, result['added'])
+
+
+def _diff_node(old, new, result):
+    if old['kind'] != new['kind']:
+        _flatten(old, result['removed'])
+        _flatten(new, result['added'])
+        return
+
+    changes = {field: {'old': value, 'new': new['fields'][field]}
+               for field, value in old['fields'].items()
+               if new['fields'][field] != value}
+    if changes:
+        result['modified'].append({'kind': new['kind'], 'name': new['name'],
+                                   'line': new['line'], 'changes': changes})
+    _diff_children(old['children'], new['children'], result)
+
+
+def _flatten(node, target):
+    """Registra um nó e todos os seus descendentes"""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        target.append({'kind': node['kind'], 'name': node['name'], 'line': node['line']})
+        stack.extend(reversed(list(node['children'].values())))
+
+
+def diff(old_summary, new_summary):
+    """Diferença estrutural entre os resumos de duas análises"""
+    result = diff_trees(build_declaration_tree(old_summary),
+                        build_declaration_tree(new_summary))
+    result['counts'] = {key: len(result[key]) for key in ('added', 'removed', 'modified')}
+    return result
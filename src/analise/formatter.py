@@ -0,0 +1,207 @@
+"""
+Formatador de código TONTO
+
+Reescreve o código a partir dos tokens da análise (e dos comentários
+registrados pelo léxico) com indentação e espaçamento canônicos. As quebras
+de linha do autor são mantidas; linhas em branco consecutivas viram uma só.
+A saída é escrita linha a linha no arquivo de destino.
+"""
+import os
+import shutil
+import tempfile
+
+from .analyzer import TontoAnalyzer
+
+
+INDENT = '    '
+
+# Tokens sem espaço antes / depois
+NO_SPACE_BEFORE = {'COMMA', 'COLON', 'RBRACKET', 'DOTDOT', 'RPAREN'}
+NO_SPACE_AFTER = {'AT', 'LBRACKET', 'DOTDOT', 'LPAREN'}
+
+# Analisador de cada processo do pool de formatação
+_process_analyzer = None
+
+
+class FormatError(Exception):
+    """O código tem erros léxicos ou sintáticos e não pode ser formatado com segurança"""
+
+
+def _token_text(token):
+    return str(token.value)
+
+
+def _sorted_enum_values(tokens):
+    """
+    Posição -> novo valor para as instâncias de cada enum em ordem alfabética.
+    As instâncias trocam de valor, mas o layout (vírgulas, linhas) é mantido.
+    """
+    replacements = {}
+    index = 0
+    while index < len(tokens):
+        if tokens[index].type == 'ENUM' and index + 2 < len(tokens) \
+                and tokens[index + 2].type == 'LBRACE':
+            positions = []
+            cursor = index + 3
+            while cursor < len(tokens) and tokens[cursor].type != 'RBRACE':
+                if tokens[cursor].type != 'COMMA':
+                    positions.append(cursor)
+                cursor += 1
+            values = sorted((tokens[position].value for position in positions),
+                            key=lambda value: (str(value).lower(), str(value)))
+            replacements.update(zip(positions, values))
+            index = cursor
+        index += 1
+    return replacements
+
+
+def _iter_lines(tokens, comments):
+    """Gera (número_da_linha, itens) com tokens e comentários agrupados por linha"""
+    items = [(token.lineno, token.lexpos, 'token', token) for token in tokens]
+    items.extend((line, position, 'comment', text) for line, position, text in comments)
+    items.sort(key=lambda item: (item[0], item[1]))
+
+    current_line = None
+    group = []
+    for line, _, kind, value in items:
+        if line != current_line and group:
+            yield current_line, group
+            group = []
+        current_line = line
+        group.append((kind, value))
+    if group:
+        yield current_line, group
+
+
+def format_tokens(tokens, comments, out, sort_enums=False):
+    """Escreve em out o código canônico correspondente aos tokens e comentários"""
+    replacements = _sorted_enum_values(tokens) if sort_enums else {}
+    positions = {id(token): position for position, token in enumerate(tokens)} \
+        if replacements else {}
+
+    depth = 0
+    previous_line = None
+    for line, group in _iter_lines(tokens, comments):
+        if previous_line is not None and line - previous_line > 1:
+            out.write('\n')     # Linhas em branco consecutivas viram uma só
+        previous_line = line
+
+        first_kind, first_value = group[0]
+        closes_first = first_kind == 'token' and first_value.type == 'RBRACE'
+        parts = [INDENT * max(0, depth - 1 if closes_first else depth)]
+
+        previous = None
+        for kind, value in group:
+            if kind == 'comment':
+                if previous is not None:
+                    parts.append('  ')
+                parts.append(value.rstrip())
+                previous = 'COMMENT'
+                continue
+
+            if previous is not None and previous not in NO_SPACE_AFTER \
+                    and value.type not in NO_SPACE_BEFORE:
+                parts.append(' ')
+
+            position = positions.get(id(value))
+            parts.append(str(replacements[position]) if position in replacements
+                         else _token_text(value))
+            previous = value.type
+
+            if value.type == 'LBRACE':
+                depth += 1
+            elif value.type == 'RBRACE':
+                depth = max(0, depth - 1)
+
+        out.write(''.join(parts))
+        out.write('\n')
+
+
+def format_source(source, out, analyzer=None, sort_enums=False):
+    """Analisa e formata um código; FormatError se houver erros"""
+    analysis = (analyzer or TontoAnalyzer()).analyze(source)
+    if analysis['lex_errors'] or analysis['syn_errors']:
+        total = len(analysis['lex_errors']) + len(analysis['syn_errors'])
+        raise FormatError(f"{total} erro(s) de análise")
+    format_tokens(analysis['tokens'], analysis['comments'], out, sort_enums)
+
+
+class _CompareWriter:
+    """Arquivo de saída que também compara o que é escrito com o texto original"""
+
+    def __init__(self, original, target=None):
+        self.original = original
+        self.target = target
+        self.position = 0
+        self.changed = False
+
+    def write(self, text):
+        if not self.changed:
+            end = self.position + len(text)
+            if self.original[self.position:end] != text:
+                self.changed = True
+            self.position = end
+        if self.target is not None:
+            self.target.write(text)
+
+    def finish(self):
+        """True se a saída completa é diferente do original"""
+        return self.changed or self.position != len(self.original)
+
+
+def format_file(path, check=False, sort_enums=False, analyzer=None):
+    """
+    Formata um arquivo no lugar (ou apenas verifica, com check=True).
+    Retorna True se o arquivo foi (ou seria) alterado.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        source = file.read()
+
+    if check:
+        writer = _CompareWriter(source)
+        format_source(source, writer, analyzer, sort_enums)
+        return writer.finish()
+
+    # Escrever em um arquivo temporário ao lado do original e trocar no final
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(suffix='.tonto', dir=directory)
+    try:
+        with os.fdopen(handle, 'w', encoding='utf-8', newline='\n') as temp:
+            writer = _CompareWriter(source, temp)
+            format_source(source, writer, analyzer, sort_enums)
+        changed = writer.finish()
+        if changed:
+            # mkstemp cria o temporário com 0600: manter as permissões do original
+            shutil.copymode(path, temp_path)
+            os.replace(temp_path, path)
+        return changed
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _init_process():
+    global _process_analyzer
+    _process_analyzer = TontoAnalyzer()
+
+
+def _format_in_process(path, check, sort_enums):
+    try:
+        return path, format_file(path, check, sort_enums, _process_analyzer), None
+    except (OSError, UnicodeDecodeError, FormatError) as e:
+        return path, False, str(e)
+
+
+def format_files(paths, check=False, sort_enums=False, max_workers=None):
+    """
+    Formata vários arquivos em um pool de processos.
+    Gera (caminho, alterado, erro) na ordem de paths (a saída não depende
+    de qual processo termina primeiro).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_process) as pool:
+        futures = [pool.submit(_format_in_process, path, check, sort_enums)
+                   for path in paths]
+        for future in futures:
+            yield future.result()
@@ -0,0 +1,211 @@
+"""
+Exportação do modelo analisado como grafo (DOT, GraphML ou JSON Graph)
+
+Nós são classes, tipos de dados e classes enumeradas; arestas são
+especializações, generalizações (genset) e relações internas e externas.
+O grafo é percorrido direto do resumo da análise e escrito elemento a
+elemento no arquivo de saída: a saída completa nunca fica em memória.
+"""
+import json
+
+
+EXPORT_FORMATS = ('dot', 'graphml', 'json')
+
+# Atributos opcionais de nós e arestas (na ordem das chaves do GraphML)
+NODE_FIELDS = ('kind', 'stereotype', 'line')
+EDGE_FIELDS = ('kind', 'stereotype', 'name', 'source_cardinality',
+               'target_cardinality', 'genset', 'line')
+
+
+def _cardinality(value):
+    return value['text'] if isinstance(value, dict) else value
+
+
+def iter_graph(summary):
+    """
+    Percorre o resumo gerando ('node', id, atributos) e
+    ('edge', origem, destino, atributos).
+
+    Classes referenciadas mas não declaradas (ex.: importadas) viram nós
+    com kind 'external', sempre gerados antes da primeira aresta que os usa.
+    Só os nomes já vistos ficam em memória.
+    """
+    seen = set()
+
+    def node(name, kind, stereotype=None, line=None):
+        seen.add(name)
+        return ('node', name, {'kind': kind, 'stereotype': stereotype, 'line': line})
+
+    def edge(source, target, attrs):
+        for name in (source, target):
+            if name not in seen:
+                yield node(name, 'external')
+        yield ('edge', source, target, attrs)
+
+    # Nós declarados primeiro, para que recebam o tipo correto
+    for cls in summary['classes']:
+        if cls['name'] not in seen:
+            yield node(cls['name'], 'class', cls['stereotype'], cls['line'])
+    for datatype in summary['datatypes']:
+        if datatype['name'] not in seen:
+            yield node(datatype['name'], 'datatype', None, datatype['line'])
+    for enum in summary['enums']:
+        if enum['name'] not in seen:
+            yield node(enum['name'], 'enum', None, enum['line'])
+
+    for cls in summary['classes']:
+        for parent in cls['parents']:
+            yield from edge(cls['name'], parent, {'kind': 'specializes', 'line': cls['line']})
+
+        # Relações internas: a origem é a classe que as declara
+        for member in cls['body']:
+            if isinstance(member, dict) and member.get('internal'):
+                yield from edge(cls['name'], member['target'], _relation_attrs(member))
+
+    for genset in summary['gensets']:
+        for specific in genset['specifics']:
+            yield from edge(specific, genset['general'],
+                            {'kind': 'genset', 'genset': genset['name'],
+                             'line': genset['line']})
+
+    for relation in summary['relations']:
+        if not relation['internal']:
+            yield from edge(relation['source'], relation['target'], _relation_attrs(relation))
+
+
+def _relation_attrs(relation):
+    return {
+        'kind': 'relation',
+        'stereotype': relation.get('stereotype'),
+        'name': relation.get('name') or relation.get('relation_name'),
+        'source_cardinality': _cardinality(relation.get('source_cardinality')),
+        'target_cardinality': _cardinality(relation.get('target_cardinality')),
+        'line': relation.get('line'),
+    }
+
+
+def export_graph(summary, out, fmt='dot'):
+    """Escreve o grafo do resumo em out (objeto de arquivo texto) no formato fmt"""
+    writers = {
+        'dot': _write_dot,
+        'graphml': _write_graphml,
+        'json': _write_json,
+    }
+    if fmt not in writers:
+        raise ValueError(f"Formato desconhecido: {fmt} (use {', '.join(EXPORT_FORMATS)})")
+    writers[fmt](summary, out)
+
+
+# ============================================================================
+# DOT
+# ============================================================================
+
+def _dot_id(value):
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def _write_dot(summary, out):
+    out.write("digraph ontology {\n")
+    out.write("  node [shape=box, fontname=\"Arial\"];\n")
+    for element in iter_graph(summary):
+        if element[0] == 'node':
+            _, name, attrs = element
+            label = name if attrs['stereotype'] is None else f"«{attrs['stereotype']}»\n{name}"
+            style = ', style=dashed' if attrs['kind'] == 'external' else ''
+            out.write(f"  {_dot_id(name)} [label={_dot_id(label)}{style}];\n")
+        else:
+            _, source, target, attrs = element
+            out.write(f"  {_dot_id(source)} -> {_dot_id(target)} [{_dot_edge_style(attrs)}];\n")
+    out.write("}\n")
+
+
+def _dot_edge_style(attrs):
+    if attrs['kind'] in ('specializes', 'genset'):
+        label = attrs.get('genset') or ''
+        return f"arrowhead=empty, label={_dot_id(label)}"
+
+    label = ' '.join(str(part) for part in (attrs['stereotype'], attrs['name']) if part)
+    style = f"label={_dot_id(label)}"
+    if attrs['source_cardinality']:
+        style += f", taillabel={_dot_id(attrs['source_cardinality'])}"
+    if attrs['target_cardinality']:
+        style += f", headlabel={_dot_id(attrs['target_cardinality'])}"
+    return style
+
+
+# ============================================================================
+# GRAPHML
+# ============================================================================
+
+def _write_graphml(summary, out):
+    # xml.sax.saxutils importa urllib: só é carregado quando o GraphML é pedido
+    from xml.sax.saxutils import escape, quoteattr
+
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    out.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+    for field in NODE_FIELDS:
+        out.write(f'  <key id="n_{field}" for="node" attr.name="{field}" attr.type="string"/>\n')
+    for field in EDGE_FIELDS:
+        out.write(f'  <key id="e_{field}" for="edge" attr.name="{field}" attr.type="string"/>\n')
+    out.write('  <graph id="ontology" edgedefault="directed">\n')
+
+    edge_count = 0
+    for element in iter_graph(summary):
+        if element[0] == 'node':
+            _, name, attrs = element
+            out.write(f'    <node id={quoteattr(name)}>')
+            out.write(_graphml_data('n', NODE_FIELDS, attrs, escape))
+            out.write('</node>\n')
+        else:
+            _, source, target, attrs = element
+            edge_count += 1
+            out.write(f'    <edge id="e{edge_count}" source={quoteattr(source)} '
+                      f'target={quoteattr(target)}>')
+            out.write(_graphml_data('e', EDGE_FIELDS, attrs, escape))
+            out.write('</edge>\n')
+
+    out.write('  </graph>\n')
+    out.write('</graphml>\n')
+
+
+def _graphml_data(prefix, fields, attrs, escape):
+    return ''.join(f'<data key="{prefix}_{field}">{escape(str(attrs[field]))}</data>'
+                   for field in fields if attrs.get(field) is not None)
+
+
+# ============================================================================
+# JSON GRAPH
+# ============================================================================
+
+def _write_json(summary, out):
+    """
+    JSON Graph Format (listas de nós e arestas). Nós e arestas ficam em
+    seções separadas, então o resumo é percorrido duas vezes em vez de
+    acumular um dos tipos em memória.
+    """
+    out.write('{"graph": {"directed": true, "nodes": [')
+    first = True
+    for element in iter_graph(summary):
+        if element[0] != 'node':
+            continue
+        _, name, attrs = element
+        out.write('\n  ' if first else ',\n  ')
+        json.dump({'id': name, 'label': name, 'metadata': _present(attrs)},
+                  out, ensure_ascii=False)
+        first = False
+
+    out.write('\n], "edges": [')
+    first = True
+    for element in iter_graph(summary):
+        if element[0] != 'edge':
+            continue
+        _, source, target, attrs = element
+        out.write('\n  ' if first else ',\n  ')
+        json.dump({'source': source, 'target': target, 'relation': attrs['kind'],
+                   'metadata': _present(attrs)}, out, ensure_ascii=False)
+        first = False
+    out.write('\n]}}\n')
+
+
+def _present(attrs):
+    return {key: value for key, value in attrs.items() if value is not None}
@@ -0,0 +1,208 @@
+"""
+Análise incremental para o modo "ao vivo" da interface gráfica
+
+O código é dividido em segmentos que começam em cada declaração de pacote.
+Cada segmento é analisado isoladamente e o resultado fica em cache pelo seu
+texto, então uma edição só reanalisa os segmentos que de fato mudaram.
+
+Limitação: o segmento é o pacote inteiro. A gramática só aceita
+declarações dentro de um pacote, então uma classe não pode ser analisada
+sozinha; um documento com um único pacote (o caso mais comum) é
+reanalisado por inteiro a cada edição. O ganho aparece em documentos com
+vários pacotes.
+"""
+import copy
+import re
+
+from .analyzer import TontoAnalyzer
+from .spans import LineIndex
+
+
+# Linha que inicia um pacote (o primeiro pacote fica junto com os imports)
+PACKAGE_LINE = re.compile(r'^[ \t]*package\b', re.MULTILINE)
+
+SUMMARY_LISTS = ('imports', 'packages', 'classes', 'datatypes',
+                 'enums', 'gensets', 'relations', 'attributes', 'package_tree')
+
+
+def split_segments(source):
+    """
+    Divide o código em segmentos iniciados por 'package' (não divide o
+    conteúdo de um pacote; ver a limitação no início do módulo).
+    Retorna lista de (linha_inicial, offset_inicial, texto).
+    """
+    starts = [match.start() for match in PACKAGE_LINE.finditer(source)]
+    boundaries = [0] + starts[1:]
+
+    segments = []
+    line = 1
+    for index, start in enumerate(boundaries):
+        end = boundaries[index + 1] if index + 1 < len(boundaries) else len(source)
+        text = source[start:end]
+        segments.append((line, start, text))
+        line += text.count('\n')
+    return segments
+
+
+def shift_lines(obj, delta, memo=None, offset=0):
+    """
+    Copia uma estrutura do resumo somando delta a todas as chaves 'line'
+    e offset aos dois extremos de cada 'span'.
+    memo preserva o compartilhamento: um mesmo dicionário referenciado em
+    várias listas (ex.: uma classe em 'classes' e nas declarações do pacote)
+    continua sendo um único objeto na cópia.
+    """
+    if memo is None:
+        memo = {}
+    if not isinstance(obj, (dict, list)):
+        return obj
+    if id(obj) in memo:
+        return memo[id(obj)]
+
+    if isinstance(obj, dict):
+        copied = {}
+        memo[id(obj)] = copied
+        for key, value in obj.items():
+            if key == 'line' and isinstance(value, int) and value > 0:
+                copied[key] = value + delta
+            elif key == 'span':
+                copied[key] = (value[0] + offset, value[1] + offset)
+            else:
+                copied[key] = shift_lines(value, delta, memo, offset)
+    else:
+        copied = []
+        memo[id(obj)] = copied
+        copied.extend(shift_lines(item, delta, memo, offset) for item in obj)
+    return copied
+
+
+class IncrementalAnalyzer:
+    """
+    Mantém o resultado de cada segmento entre análises sucessivas do mesmo documento.
+
+    Os resultados são guardados com linhas relativas ao segmento; o
+    deslocamento para linhas absolutas só é refeito quando o segmento muda
+    de posição no documento.
+    """
+
+    def __init__(self, analyzer=None):
+        self.analyzer = analyzer or TontoAnalyzer()
+        self._relative = {}     # texto -> resultado com linhas relativas
+        self._placed = {}       # (texto, linha, offset) -> resultado com linhas absolutas
+
+    def analyze(self, source, progress=None, cancel_event=None):
+        """
+        Analisa o documento reaproveitando os segmentos inalterados.
+
+        Retorna o mesmo formato agregado de TontoAnalyzer.analyze (sem a lista
+        de tokens) e, em 'segments', o resultado de cada segmento com uma
+        chave estável que identifica o segmento entre edições.
+        """
+        segments = split_segments(source)
+        relative = {}
+        placed = {}
+        occurrences = {}
+        results = []
+
+        for index, (line, offset, text) in enumerate(segments):
+            cached = self._relative.get(text)
+            reanalyzed = cached is None
+            if reanalyzed:
+                cached = self._analyze_segment(text, cancel_event)
+            relative[text] = cached
+
+            position = (text, line, offset)
+            segment = self._placed.get(position)
+            if segment is None:
+                segment = self._place(cached, line, offset)
+            placed[position] = segment
+
+            # Segmentos de texto idêntico são diferenciados pela ocorrência
+            occurrence = occurrences.get(text, 0)
+            occurrences[text] = occurrence + 1
+
+            results.append(dict(segment, key=(hash(text), occurrence),
+                                line=line, reanalyzed=reanalyzed))
+
+            if progress is not None:
+                progress('sintatico', (index + 1) / len(segments))
+
+        # Manter em cache apenas os segmentos do documento atual
+        self._relative = relative
+        self._placed = placed
+
+        merged = self._merge(results)
+        merged['line_index'] = LineIndex(source)
+        return merged
+
+    def reset(self):
+        """Descarta o cache (por exemplo, ao trocar de documento)"""
+        self._relative = {}
+        self._placed = {}
+
+    def _analyze_segment(self, text, cancel_event):
+        analysis = self.analyzer.analyze(text, cancel_event=cancel_event)
+        return {
+            'lex_errors': analysis['lex_errors'],
+            'syn_errors': analysis['syn_errors'],
+            'categories': analysis['categories'],
+            'token_count': len(analysis['tokens']),
+            'summary': analysis['summary'],
+        }
+
+    def _place(self, relative, line, offset):
+        """Converte um resultado relativo para a posição do segmento no documento"""
+        delta = line - 1
+        if delta == 0 and offset == 0:
+            return relative
+
+        lex_errors = []
+        for error in relative['lex_errors']:
+            error = copy.copy(error)
+            error.lineno += delta
+            error.lexpos += offset
+            lex_errors.append(error)
+
+        syn_errors = []
+        for error in relative['syn_errors']:
+            error = dict(error)
+            if error['linha'] > 0:
+                error['linha'] += delta
+                error['coluna'] += offset
+            syn_errors.append(error)
+
+        summary = dict(relative['summary'])
+        memo = {}
+        for key in SUMMARY_LISTS:
+            summary[key] = shift_lines(summary[key], delta, memo, offset)
+
+        return dict(relative, lex_errors=lex_errors, syn_errors=syn_errors,
+                    summary=summary)
+
+    def _merge(self, segments):
+        """Agrega os resultados dos segmentos no formato de uma análise completa"""
+        summary = {key: [] for key in SUMMARY_LISTS}
+        categories = {}
+        lex_errors = []
+        syn_errors = []
+        token_count = 0
+
+        for segment in segments:
+            for key in SUMMARY_LISTS:
+                summary[key].extend(segment['summary'][key])
+            for cat, count in segment['categories'].items():
+                categories[cat] = categories.get(cat, 0) + count
+            lex_errors.extend(segment['lex_errors'])
+            syn_errors.extend(segment['syn_errors'])
+            token_count += segment['token_count']
+
+        summary['total_errors'] = len(syn_errors)
+
+        return {
+            'segments': segments,
+            'lex_errors': lex_errors,
+            'syn_errors': syn_errors,
+            'categories': categories,
+            'token_count': token_count,
+            'summary': summary
+        }
@@ -0,0 +1,149 @@
+"""
+Índices de busca sobre o resultado de uma análise
+
+São construídos uma única vez por análise e respondem às consultas dos
+filtros da interface sem percorrer novamente tokens, declarações e erros.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+# Categorias do resumo cujas declarações entram na busca por nome
+DECLARATION_CATEGORIES = ('packages', 'classes', 'datatypes', 'enums',
+                          'gensets', 'relations')
+
+
+class TokenIndex:
+    """
+    Índice invertido dos tokens por tipo e por valor.
+
+    Cada entrada guarda as posições (em ordem crescente) dos tokens na
+    lista original, então o resultado de uma consulta já sai em ordem de
+    ocorrência no código.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.by_type = {}       # tipo -> posições
+        self.by_value = {}      # valor em minúsculas -> posições
+
+        for position, token in enumerate(tokens):
+            positions = self.by_type.get(token.type)
+            if positions is None:
+                positions = self.by_type[token.type] = array('l')
+            positions.append(position)
+
+            value = str(token.value).lower()
+            positions = self.by_value.get(value)
+            if positions is None:
+                positions = self.by_value[value] = array('l')
+            positions.append(position)
+
+    def types(self):
+        """Tipos de token presentes na análise, em ordem alfabética"""
+        return sorted(self.by_type)
+
+    def search(self, token_type=None, value=None):
+        """
+        Posições dos tokens do tipo e/ou valor informados (valor sem
+        diferenciar maiúsculas). Sem critérios, retorna None.
+        """
+        lists = []
+        if token_type:
+            lists.append(self.by_type.get(token_type.upper(), ()))
+        if value:
+            lists.append(self.by_value.get(value.lower(), ()))
+        if not lists:
+            return None
+        if len(lists) == 1:
+            return list(lists[0])
+
+        # Interseção: percorrer a lista menor consultando a maior
+        smaller, larger = sorted(lists, key=len)
+        larger = set(larger)
+        return [position for position in smaller if position in larger]
+
+    def select(self, positions):
+        """Converte posições em tokens"""
+        tokens = self.tokens
+        return [tokens[position] for position in positions]
+
+
+class PrefixTrie:
+    """
+    Trie de nomes (sem diferenciar maiúsculas) para busca por prefixo.
+
+    Cada nó é um dicionário caractere -> nó; os valores associados a um
+    nome completo ficam na chave '' do nó final.
+    """
+
+    TERMINAL = ''
+
+    def __init__(self):
+        self.root = {}
+        self.size = 0
+
+    def insert(self, name, value):
+        node = self.root
+        for char in name.lower():
+            node = node.setdefault(char, {})
+        node.setdefault(self.TERMINAL, []).append(value)
+        self.size += 1
+
+    def search(self, prefix, limit=None):
+        """Valores de todos os nomes que começam com prefix"""
+        node = self.root
+        for char in prefix.lower():
+            node = node.get(char)
+            if node is None:
+                return []
+
+        results = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char == self.TERMINAL:
+                    results.extend(child)
+                    if limit is not None and len(results) >= limit:
+                        return results[:limit]
+                else:
+                    stack.append(child)
+        return results
+
+
+def declaration_name(item):
+    """Nome pelo qual uma declaração do resumo é encontrada"""
+    return item.get('name') or item.get('relation_name')
+
+
+def build_declaration_trie(summary):
+    """Trie com (categoria, declaração) de todas as declarações nomeadas do resumo"""
+    trie = PrefixTrie()
+    for category in DECLARATION_CATEGORIES:
+        for item in summary[category]:
+            name = declaration_name(item)
+            if name:
+                trie.insert(name, (category, item))
+    return trie
+
+
+class LineIndex:
+    """
+    Entradas ordenadas por linha, com consulta por faixa em O(log n).
+
+    line_of: função entrada -> número da linha
+    """
+
+    def __init__(self, entries, line_of):
+        self.entries = sorted(entries, key=line_of)
+        self.lines = array('l', (line_of(entry) for entry in self.entries))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def between(self, first=None, last=None):
+        """Entradas com first <= linha <= last (limites opcionais)"""
+        start = 0 if first is None else bisect_left(self.lines, first)
+        end = len(self.lines) if last is None else bisect_right(self.lines, last)
+        return self.entries[start:end]
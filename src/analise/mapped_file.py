@@ -0,0 +1,60 @@
+"""
+Acesso a arquivos TONTO grandes diretamente do disco via mmap
+"""
+import mmap
+import re
+from array import array
+
+
+NEWLINE = re.compile(rb'\n')
+
+
+class MappedFile:
+    """
+    Arquivo mapeado em memória com índice de início de linhas.
+
+    Permite ler qualquer faixa de linhas sem carregar o arquivo inteiro
+    em um widget, e entregar o conteúdo completo à análise sem passar
+    pela interface gráfica.
+    """
+
+    ENCODING = 'utf-8'
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self.size = self._file.seek(0, 2)
+            # Arquivos vazios não podem ser mapeados
+            self.data = (mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                         if self.size else b'')
+        except Exception:
+            self._file.close()
+            raise
+
+        # Offset de início de cada linha (linha 1 começa no offset 0)
+        self.line_offsets = array('q', [0])
+        self.line_offsets.extend(match.end() for match in NEWLINE.finditer(self.data))
+
+    @property
+    def line_count(self):
+        return len(self.line_offsets)
+
+    def read_lines(self, first, last):
+        """Lê as linhas first..last (1-based, inclusive) como texto"""
+        first = max(1, first)
+        last = min(self.line_count, last)
+        if first > last:
+            return ""
+        start = self.line_offsets[first - 1]
+        end = self.line_offsets[last] if last < self.line_count else self.size
+        return self.data[start:end].decode(self.ENCODING, errors='replace')
+
+    def read_text(self):
+        """Conteúdo completo do arquivo, para a análise"""
+        return self.data[:].decode(self.ENCODING, errors='replace')
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self._file.close()
@@ -0,0 +1,209 @@
+"""
+Consultas sobre o modelo resultante da análise sintática
+
+Exemplo:
+    model = ModelQuery(analysis['summary'])
+    model.relations(stereotype='mediation', target='Contract')
+    model.classes(stereotype='relator').filter(
+        lambda c: model.relation_count(c['name'], 'mediation') > 2)
+    model.attributes(type='AddressDataType')
+
+Os índices (valor do campo -> construtos) são montados na primeira
+consulta que usa o campo e reaproveitados nas seguintes. As consultas são
+encadeáveis e devolvem iteradores: nenhum resultado é materializado.
+"""
+from itertools import islice
+
+
+# Coleções do resumo que podem ser consultadas
+COLLECTIONS = ('packages', 'classes', 'datatypes', 'enums', 'gensets',
+               'relations', 'attributes')
+
+
+def _relation_name(model, item):
+    return item.get('name') or item.get('relation_name')
+
+
+def _relation_source(model, item):
+    # Relações internas não guardam a origem: é a classe que as declara
+    if item.get('internal'):
+        owner = model.owner(item)
+        return owner['name'] if owner is not None else None
+    return item.get('source')
+
+
+# Campos calculados: (coleção, campo) -> função (modelo, item) -> valor
+DERIVED_FIELDS = {
+    ('relations', 'name'): _relation_name,
+    ('relations', 'source'): _relation_source,
+}
+
+
+def _keys(value):
+    """Chaves de índice de um valor: listas indexam cada elemento"""
+    if isinstance(value, list):
+        return list(dict.fromkeys(element for element in value
+                                  if not isinstance(element, (dict, list))))
+    if isinstance(value, dict):
+        return []       # Ex.: cardinalidades; não indexáveis
+    return [value]
+
+
+class Query:
+    """
+    Consulta encadeável sobre uma coleção do modelo.
+
+    Cada método devolve uma nova Query; nada é avaliado até a iteração.
+    """
+
+    def __init__(self, model, collection, criteria=(), predicates=()):
+        self.model = model
+        self.collection = collection
+        self.criteria = tuple(criteria)         # (campo, valor) comparados por igualdade
+        self.predicates = tuple(predicates)     # funções item -> bool
+
+    def where(self, **criteria):
+        """Restringe por igualdade de campos (em campos lista, por pertinência)"""
+        return Query(self.model, self.collection,
+                     self.criteria + tuple(criteria.items()), self.predicates)
+
+    def filter(self, predicate):
+        """Restringe por uma função item -> bool"""
+        return Query(self.model, self.collection, self.criteria,
+                     self.predicates + (predicate,))
+
+    def __iter__(self):
+        model = self.model
+        if self.criteria:
+            # O critério de menor bucket define os candidatos; os demais filtram
+            buckets = [(model.lookup(self.collection, field, value), field, value)
+                       for field, value in self.criteria]
+            candidates, field, value = min(buckets, key=lambda bucket: len(bucket[0]))
+            remaining = [(f, v) for f, v in self.criteria if (f, v) != (field, value)]
+        else:
+            candidates = model.summary[self.collection]
+            remaining = []
+
+        for item in candidates:
+            if all(model.matches(self.collection, item, f, v) for f, v in remaining) \
+                    and all(predicate(item) for predicate in self.predicates):
+                yield item
+
+    def first(self):
+        """Primeiro resultado ou None"""
+        return next(iter(self), None)
+
+    def limit(self, count):
+        """Iterador com no máximo count resultados"""
+        return islice(self, count)
+
+    def count(self):
+        """Número de resultados (percorre a consulta sem guardá-los)"""
+        return sum(1 for _ in self)
+
+    def names(self):
+        """Iterador com o nome de cada resultado"""
+        for item in self:
+            yield self.model.field(self.collection, item, 'name')
+
+
+class ModelQuery:
+    """
+    Ponto de entrada das consultas sobre o resumo de uma análise
+    (TontoAnalyzer.analyze(...)['summary']).
+    """
+
+    def __init__(self, summary):
+        self.summary = summary
+        self._indexes = {}          # (coleção, campo) -> valor -> lista de itens
+        self._owners = None         # id(atributo/relação interna) -> classe ou tipo de dado
+        self._relation_counts = None
+
+    # ========================================================================
+    # CONSULTAS
+    # ========================================================================
+
+    def query(self, collection, **criteria):
+        if collection not in COLLECTIONS:
+            raise ValueError(f"Coleção desconhecida: {collection}")
+        return Query(self, collection).where(**criteria)
+
+    def packages(self, **criteria):
+        return self.query('packages', **criteria)
+
+    def classes(self, **criteria):
+        return self.query('classes', **criteria)
+
+    def datatypes(self, **criteria):
+        return self.query('datatypes', **criteria)
+
+    def enums(self, **criteria):
+        return self.query('enums', **criteria)
+
+    def gensets(self, **criteria):
+        return self.query('gensets', **criteria)
+
+    def relations(self, **criteria):
+        return self.query('relations', **criteria)
+
+    def attributes(self, **criteria):
+        return self.query('attributes', **criteria)
+
+    def owner(self, item):
+        """Classe (ou tipo de dado) que declara um atributo ou relação interna"""
+        if self._owners is None:
+            owners = {}
+            for cls in self.summary['classes']:
+                for member in cls['body']:
+                    if isinstance(member, dict):
+                        owners[id(member)] = cls
+            for datatype in self.summary['datatypes']:
+                for attribute in datatype['attributes']:
+                    owners[id(attribute)] = datatype
+            self._owners = owners
+        return self._owners.get(id(item))
+
+    def relation_count(self, class_name, stereotype=None):
+        """Relações cuja origem é a classe (opcionalmente de um estereótipo)"""
+        if self._relation_counts is None:
+            counts = {}
+            for relation in self.summary['relations']:
+                source = _relation_source(self, relation)
+                counts[(source, None)] = counts.get((source, None), 0) + 1
+                relation_stereotype = relation.get('stereotype')
+                if relation_stereotype is not None:
+                    key = (source, relation_stereotype)
+                    counts[key] = counts.get(key, 0) + 1
+            self._relation_counts = counts
+        return self._relation_counts.get((class_name, stereotype), 0)
+
+    # ========================================================================
+    # ÍNDICES
+    # ========================================================================
+
+    def field(self, collection, item, name):
+        """Valor de um campo, incluindo os campos calculados"""
+        getter = DERIVED_FIELDS.get((collection, name))
+        if getter is not None:
+            return getter(self, item)
+        return item.get(name)
+
+    def matches(self, collection, item, name, value):
+        current = self.field(collection, item, name)
+        if isinstance(current, list):
+            return value in current
+        return current == value
+
+    def lookup(self, collection, name, value):
+        """Itens da coleção cujo campo tem o valor, pelo índice do campo"""
+        index = self._indexes.get((collection, name))
+        if index is None:
+            index = {}
+            for item in self.summary[collection]:
+                for key in _keys(self.field(collection, item, name)):
+                    index.setdefault(key, []).append(item)
+            self._indexes[(collection, name)] = index
+        try:
+            return index.get(value, ())
+        except TypeError:
+            return ()       # Valor não indexável nunca casa
@@ -0,0 +1,312 @@
+"""
+Serviço HTTP local de análise (somente biblioteca padrão)
+
+Endpoints:
+    POST /analyze        corpo: código TONTO (text/plain) ou {"source": "..."}
+    POST /analyze/batch  corpo: {"sources": ["...", ...]} ou a lista diretamente
+    GET  /metrics        contadores no formato texto do Prometheus
+    GET  /health         {"status": "ok"}
+
+Cada análise devolve {"hash", "summary", "diagnostics", "categories",
+"token_count", "budget_exceeded"}. Os arquivos são analisados em um pool de processos com
+léxico e parser já construídos; o processo devolve o JSON pronto (bytes),
+que fica em um cache LRU pelo hash do conteúdo. Pedidos simultâneos do
+mesmo conteúdo esperam a mesma análise.
+
+Exemplo (porta 0 escolhe uma porta livre, útil em testes):
+    server = AnalysisServer(('127.0.0.1', 0)).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/analyze"
+    ...
+    server.close()
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ..lexico.lexico import lexical_error
+from .workspace import analyze_for_pickle, content_digest, init_process
+
+
+# Maior corpo aceito por requisição
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+def analysis_report(analysis, digest):
+    """Resultado de uma análise no formato das respostas do serviço"""
+    diagnostics = [lexical_error(error) for error in analysis['lex_errors']]
+    diagnostics.extend(analysis['syn_errors'])
+
+    return {
+        'hash': digest,
+        'summary': analysis['summary'],
+        'diagnostics': diagnostics,
+        'categories': analysis['categories'],
+        'token_count': len(analysis['tokens']),
+        'budget_exceeded': analysis['budget_exceeded'],
+    }
+
+
+def _report_in_process(source, digest, limits):
+    """
+    Executada no pool: o JSON é montado no processo e volta como bytes,
+    junto com o limite que interrompeu a análise (ou None)
+    """
+    report = analysis_report(analyze_for_pickle(source, limits), digest)
+    body = json.dumps(report, ensure_ascii=False, default=str).encode('utf-8')
+    return body, report['budget_exceeded']
+
+
+class ResultCache:
+    """Cache LRU hash do conteúdo -> resposta JSON (bytes), limitado em entradas e bytes"""
+
+    def __init__(self, max_entries=1024, max_bytes=256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, digest):
+        with self._lock:
+            body = self._items.get(digest)
+            if body is not None:
+                self._items.move_to_end(digest)
+            return body
+
+    def put(self, digest, body):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._items.pop(digest, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self._items[digest] = body
+            self.size += len(body)
+            while len(self._items) > self.max_entries or self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+
+
+class AnalysisService:
+    """
+    Pool de processos, cache e métricas, independentes do HTTP.
+
+    limits: limites de cada análise (ver workspace.analyze_for_pickle).
+    Resultados interrompidos por tempo não vão para o cache, já que
+    dependem da carga da máquina; os de tokens e diagnósticos, sim.
+    """
+
+    def __init__(self, max_workers=None, cache_entries=1024, cache_bytes=256 * 1024 * 1024,
+                 limits=None):
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.limits = limits
+        # Código de terceiros: sem internar nomes, que cresceriam sem limite
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                            initializer=init_process, initargs=(False,))
+        # Uma tarefa vazia por processo: o pool sobe (e constrói léxico e
+        # parser) já na inicialização, e não na primeira requisição
+        for _ in range(self.max_workers):
+            self.executor.submit(os.getpid)
+        self.cache = ResultCache(cache_entries, cache_bytes)
+        self._pending = {}          # hash -> Future da análise em andamento
+        self._lock = threading.Lock()
+
+        self.metrics = {
+            'requests_total': 0,
+            'request_errors_total': 0,
+            'analyses_total': 0,
+            'analysis_failures_total': 0,
+            'analysis_seconds_total': 0.0,
+            'cache_hits_total': 0,
+            'cache_misses_total': 0,
+            'merged_total': 0,
+            'budget_exceeded_total': 0,
+        }
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.metrics[name] += amount
+
+    def submit(self, source):
+        """
+        Agenda (ou reaproveita) a análise de um código.
+        Retorna (hash, bytes da resposta ou None, Future ou None); o
+        resultado do Future é (bytes, limite excedido ou None).
+        """
+        digest = content_digest(source.encode('utf-8'))
+        body = self.cache.get(digest)
+        if body is not None:
+            self.count('cache_hits_total')
+            return digest, body, None
+
+        with self._lock:
+            self.metrics['cache_misses_total'] += 1
+            future = self._pending.get(digest)
+            if future is not None:
+                self.metrics['merged_total'] += 1
+                return digest, None, future
+            future = self.executor.submit(_report_in_process, source, digest, self.limits)
+            self._pending[digest] = future
+            self.metrics['analyses_total'] += 1
+
+        started = time.perf_counter()
+        future.add_done_callback(
+            lambda done: self._finished(digest, done, time.perf_counter() - started))
+        return digest, None, future
+
+    def _finished(self, digest, future, elapsed):
+        failed = future.cancelled() or future.exception() is not None
+        exceeded = None
+        if not failed:
+            body, exceeded = future.result()
+            # No cache antes de sair de _pending: um pedido nesse meio-tempo
+            # acha um dos dois e não reenvia a análise
+            if exceeded != 'tempo':
+                self.cache.put(digest, body)
+        with self._lock:
+            self._pending.pop(digest, None)
+            self.metrics['analysis_seconds_total'] += elapsed
+            if failed:
+                self.metrics['analysis_failures_total'] += 1
+            if exceeded is not None:
+                self.metrics['budget_exceeded_total'] += 1
+
+    def analyze(self, source):
+        """Resposta JSON (bytes) da análise de um código"""
+        _, body, future = self.submit(source)
+        return body if body is not None else future.result()[0]
+
+    def analyze_many(self, sources):
+        """Respostas de vários códigos, na ordem; todos são enviados ao pool antes da espera"""
+        submitted = [self.submit(source) for source in sources]
+        return [body if body is not None else future.result()[0]
+                for _, body, future in submitted]
+
+    def metrics_text(self):
+        """Métricas no formato texto de exposição do Prometheus"""
+        with self._lock:
+            values = dict(self.metrics)
+            values['in_flight'] = len(self._pending)
+        values['cache_entries'] = len(self.cache)
+        values['cache_bytes'] = self.cache.size
+        values['workers'] = self.max_workers
+
+        lines = []
+        for name, value in values.items():
+            kind = 'counter' if name.endswith('_total') else 'gauge'
+            lines.append(f"# TYPE tonto_{name} {kind}")
+            lines.append(f"tonto_{name} {value}")
+        return '\n'.join(lines) + '\n'
+
+    def close(self):
+        """Descarta as análises na fila e espera o pool encerrar"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'TontoAnalyzer/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        service = self.server.service
+        if self.path == '/metrics':
+            service.count('requests_total')
+            self._send(200, service.metrics_text().encode('utf-8'),
+                       'text/plain; version=0.0.4; charset=utf-8')
+        elif self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        else:
+            self._send_json(404, {'erro': f"Caminho desconhecido: {self.path}"})
+
+    def do_POST(self):
+        service = self.server.service
+        service.count('requests_total')
+        if self.path not in ('/analyze', '/analyze/batch'):
+            self._send_json(404, {'erro': f"Caminho desconhecido: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            service.count('request_errors_total')
+            self._send_json(413 if length > 0 else 400,
+                            {'erro': f"Corpo ausente ou maior que {MAX_BODY_BYTES} bytes"})
+            return
+
+        try:
+            payload = self._read_payload(length)
+            if self.path == '/analyze':
+                source = payload['source'] if isinstance(payload, dict) else payload
+                if not isinstance(source, str):
+                    raise ValueError("'source' deve ser um texto")
+                self._send(200, service.analyze(source), 'application/json; charset=utf-8')
+            else:
+                sources = payload.get('sources') if isinstance(payload, dict) else payload
+                if not isinstance(sources, list) or not all(isinstance(s, str) for s in sources):
+                    raise ValueError("'sources' deve ser uma lista de textos")
+                body = b'{"results":[' + b','.join(service.analyze_many(sources)) + b']}'
+                self._send(200, body, 'application/json; charset=utf-8')
+        except (ValueError, KeyError, UnicodeDecodeError) as e:
+            service.count('request_errors_total')
+            self._send_json(400, {'erro': f"Requisição inválida: {e}"})
+        except Exception as e:
+            service.count('request_errors_total')
+            self._send_json(500, {'erro': f"Falha na análise: {e}"})
+
+    def _read_payload(self, length):
+        """JSON quando o Content-Type pede; senão o corpo é o próprio código"""
+        data = self.rfile.read(length).decode('utf-8')
+        if self.headers.get('Content-Type', '').startswith('application/json'):
+            return json.loads(data)
+        return data
+
+    def _send_json(self, status, value):
+        self._send(status, json.dumps(value, ensure_ascii=False).encode('utf-8'),
+                   'application/json; charset=utf-8')
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class AnalysisServer(ThreadingHTTPServer):
+    """Servidor HTTP do serviço de análise; cada requisição roda em uma thread"""
+
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 8765), service=None, verbose=False):
+        super().__init__(address, _Handler)
+        self.service = service or AnalysisService()
+        self.verbose = verbose
+        self._thread = None
+
+    def start(self):
+        """Atende em uma thread de fundo (ex.: em testes); retorna o próprio servidor"""
+        self._thread = threading.Thread(target=self.serve_forever, name="tonto-http",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        if self._thread is not None:
+            self.shutdown()
+            self._thread = None
+        self.server_close()
+        self.service.close()
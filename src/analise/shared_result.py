@@ -0,0 +1,568 @@
+"""
+Resultados do pool de processos em memória compartilhada, sem pickle
+
+O processo do pool codifica o resultado de uma análise em colunas (arrays
+de inteiros e uma tabela de strings) e as grava em um bloco de
+multiprocessing.shared_memory. Pelo pool volta só o nome do bloco e as
+partes pequenas (erros, categorias). O processo principal copia o bloco de
+uma vez para a memória local (sem desserializar nada), remove o bloco e lê
+as colunas direto dessa cópia: os nós do resumo só viram dicionários
+quando acessados, e contagens como len(summary['classes']) não decodificam
+nada.
+
+Formato do bloco: MAGIC, o número de itens de cada coluna (int64) e as
+colunas de COLUMNS, cada uma alinhada em 8 bytes. Dicionários, listas e
+tuplas são guardados uma vez só (por identidade), então um nó referenciado
+pela lista do resumo, pelo pacote e pelo package_tree continua sendo um
+único objeto depois de decodificado.
+"""
+import os
+from array import array
+from collections.abc import Sequence
+from itertools import accumulate
+
+from ..lexico.names import NAMES
+
+
+MAGIC = b'TNC1'
+
+# Tipo de cada valor (coluna 'tags'); o conteúdo fica em 'payloads'
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3             # payload: o próprio inteiro
+TAG_BIGINT = 4          # payload: id da string com os dígitos (não cabe em 64 bits)
+TAG_STR = 5             # payload: id da string
+TAG_DICT = 6            # payload: índice do nó
+TAG_LIST = 7            # payload: índice da sequência
+TAG_TUPLE = 8           # payload: índice da sequência
+TAG_PAIR = 9            # payload: (a << 32) | b, tupla de dois inteiros de 32 bits (spans)
+
+# Colunas do bloco, na ordem em que são gravadas: (nome, typecode do array)
+COLUMNS = (
+    ('text', 'B'),              # strings em UTF-8, concatenadas
+    ('text_offsets', 'q'),      # início de cada string, mais o fim da última
+    ('shape_offsets', 'i'),     # início das chaves de cada formato de dicionário
+    ('shape_keys', 'i'),        # ids das chaves, formato após formato
+    ('node_shapes', 'i'),       # formato de cada dicionário
+    ('node_starts', 'i'),       # primeiro valor de cada dicionário
+    ('sequence_starts', 'i'),   # primeiro valor de cada lista ou tupla
+    ('sequence_sizes', 'i'),
+    ('tags', 'B'),
+    ('payloads', 'q'),
+    ('token_types', 'i'),       # tokens: id do tipo
+    ('token_tags', 'B'),        # tokens: tipo e conteúdo do valor, como em tags/payloads
+    ('token_values', 'q'),
+    ('token_lines', 'i'),
+    ('token_positions', 'q'),
+    ('root', 'q'),              # índice da lista [summary, result]
+)
+
+_INT64 = (-2 ** 63, 2 ** 63)
+_UINT32 = 2 ** 32
+_HEADER_SIZE = 8 + 8 * len(COLUMNS)
+
+
+def _aligned(offset):
+    return (offset + 7) & ~7
+
+
+class _Encoder:
+    """
+    Monta as colunas de um resultado; cada objeto composto é gravado uma
+    vez. As colunas crescem como listas e só viram arrays em columns().
+    """
+
+    def __init__(self):
+        self.strings = {}           # string -> id
+        self.shapes = {}            # tupla de chaves -> id do formato
+        self.memo = {}              # id(objeto) -> (tag, índice)
+        self.shape_offsets = [0]
+        self.shape_keys = []
+        self.node_shapes = []
+        self.node_starts = []
+        self.sequence_starts = []
+        self.sequence_sizes = []
+        self.tags = []
+        self.payloads = []
+
+    def string(self, text):
+        number = self.strings.get(text)
+        if number is None:
+            number = self.strings[text] = len(self.strings)
+        return number
+
+    def value(self, obj):
+        """(tag, payload) de um valor do resultado"""
+        cls = obj.__class__
+        if cls is str:
+            return TAG_STR, self.string(obj)
+        if cls is int:
+            if _INT64[0] <= obj < _INT64[1]:
+                return TAG_INT, obj
+            return TAG_BIGINT, self.string(str(obj))
+        if cls is dict:
+            return self.node(obj)
+        if obj is None:
+            return TAG_NONE, 0
+        if cls is bool:
+            return (TAG_TRUE if obj else TAG_FALSE), 0
+        if cls is tuple:
+            if (len(obj) == 2 and obj[0].__class__ is int and obj[1].__class__ is int
+                    and 0 <= obj[0] < _UINT32 and 0 <= obj[1] < _UINT32):
+                return TAG_PAIR, (obj[0] << 32) | obj[1]
+            return self.sequence(obj, TAG_TUPLE)
+        if cls is list:
+            return self.sequence(obj, TAG_LIST)
+        raise TypeError(f"Valor sem codificação: {cls.__name__}")
+
+    def _fill(self, values):
+        """
+        Grava valores contíguos; os filhos compostos são gravados depois
+        deles, nas posições seguintes. Retorna a posição do primeiro.
+        """
+        tags = self.tags
+        payloads = self.payloads
+        strings = self.strings
+        start = len(tags)
+        count = len(values)
+        tags.extend([0] * count)
+        payloads.extend([0] * count)
+        for slot, value in enumerate(values, start):
+            # Caminho rápido para nomes e palavras reservadas, os mais comuns
+            if value.__class__ is str:
+                number = strings.get(value)
+                if number is None:
+                    number = strings[value] = len(strings)
+                tags[slot] = TAG_STR
+                payloads[slot] = number
+            else:
+                tags[slot], payloads[slot] = self.value(value)
+        return start
+
+    def node(self, obj):
+        known = self.memo.get(id(obj))
+        if known is not None:
+            return known
+        keys = tuple(obj)
+        shape = self.shapes.get(keys)
+        if shape is None:
+            shape = self.shapes[keys] = len(self.shapes)
+            self.shape_keys.extend(self.string(key) for key in keys)
+            self.shape_offsets.append(len(self.shape_keys))
+
+        index = len(self.node_shapes)
+        known = self.memo[id(obj)] = (TAG_DICT, index)
+        self.node_shapes.append(shape)
+        self.node_starts.append(0)
+        self.node_starts[index] = self._fill(obj.values())
+        return known
+
+    def sequence(self, obj, tag):
+        known = self.memo.get(id(obj))
+        if known is not None:
+            return known
+        index = len(self.sequence_starts)
+        known = self.memo[id(obj)] = (tag, index)
+        self.sequence_starts.append(0)
+        self.sequence_sizes.append(len(obj))
+        self.sequence_starts[index] = self._fill(obj)
+        return known
+
+    def tokens(self, tokens):
+        """Colunas dos tokens (tipo, valor, linha, posição)"""
+        strings = self.strings
+        types = [token.type for token in tokens]
+        values = [token.value for token in tokens]
+        # Registra cada string distinta uma vez; depois é só consulta
+        for text in dict.fromkeys(types):
+            self.string(text)
+        for text in dict.fromkeys(value for value in values if value.__class__ is str):
+            self.string(text)
+
+        pairs = [(TAG_STR, strings[value]) if value.__class__ is str else self.value(value)
+                 for value in values]
+        return (array('i', map(strings.__getitem__, types)),
+                bytes(tag for tag, _ in pairs),
+                array('q', [payload for _, payload in pairs]),
+                array('i', [token.lineno for token in tokens]),
+                array('q', [token.lexpos for token in tokens]))
+
+    def columns(self, root, token_columns):
+        """Todas as colunas, na ordem de COLUMNS"""
+        encoded = [text.encode('utf-8') for text in self.strings]
+        offsets = array('q', [0])
+        offsets.extend(accumulate(len(item) for item in encoded))
+        return ((b''.join(encoded), offsets,
+                 array('i', self.shape_offsets), array('i', self.shape_keys),
+                 array('i', self.node_shapes), array('i', self.node_starts),
+                 array('i', self.sequence_starts), array('i', self.sequence_sizes),
+                 bytes(self.tags), array('q', self.payloads))
+                + token_columns + (array('q', [root]),))
+
+
+def encode_columns(analysis):
+    """Colunas (na ordem de COLUMNS) do resumo, da árvore e dos tokens de uma análise"""
+    encoder = _Encoder()
+    token_columns = encoder.tokens(analysis['tokens'])
+    _, root = encoder.sequence([analysis['summary'], analysis['result']], TAG_LIST)
+    return encoder.columns(root, token_columns)
+
+
+def _column_bytes(column):
+    return memoryview(column).cast('B')
+
+
+def encoded_size(columns):
+    size = _HEADER_SIZE
+    for column in columns:
+        size = _aligned(size + _column_bytes(column).nbytes)
+    return size
+
+
+def write_columns(columns, buffer):
+    """Grava as colunas em buffer (com pelo menos encoded_size(columns) bytes)"""
+    with memoryview(buffer) as target:
+        target[:4] = MAGIC
+        target[8:_HEADER_SIZE] = _column_bytes(array('q', [len(column) for column in columns]))
+        offset = _HEADER_SIZE
+        for column in columns:
+            data = _column_bytes(column)
+            target[offset:offset + data.nbytes] = data
+            offset = _aligned(offset + data.nbytes)
+
+
+def encode_analysis(analysis):
+    """Resultado codificado em bytes (o mesmo formato do bloco compartilhado)"""
+    columns = encode_columns(analysis)
+    buffer = bytearray(encoded_size(columns))
+    write_columns(columns, buffer)
+    return bytes(buffer)
+
+
+class _Block:
+    """
+    Colunas de um resultado codificado, lidas no próprio buffer.
+
+    Strings, nós e sequências são decodificados sob demanda e guardados:
+    o mesmo índice devolve sempre o mesmo objeto. As strings passam pela
+    tabela de nomes do processo, como as dos resultados vindos por pickle
+    depois de intern_result.
+    """
+
+    def __init__(self, buffer, size):
+        view = memoryview(buffer)[:size]
+        if view[:4] != MAGIC:
+            raise ValueError("Bloco sem o formato de resultado codificado")
+        counts = view[8:_HEADER_SIZE].cast('q')
+        offset = _HEADER_SIZE
+        for (name, code), count in zip(COLUMNS, counts):
+            end = offset + count * array(code).itemsize
+            setattr(self, name, view[offset:end].cast(code))
+            offset = _aligned(end)
+
+        self._strings = {}
+        self._shapes = {}
+        self._nodes = {}
+        self._sequences = {}
+
+    def string(self, number):
+        text = self._strings.get(number)
+        if text is None:
+            offsets = self.text_offsets
+            text = NAMES.intern(str(self.text[offsets[number]:offsets[number + 1]], 'utf-8'))
+            self._strings[number] = text
+        return text
+
+    def value(self, tag, payload):
+        if tag == TAG_STR:
+            return self.string(payload)
+        if tag == TAG_DICT:
+            return self.node(payload)
+        if tag == TAG_INT:
+            return payload
+        if tag == TAG_PAIR:
+            return payload >> 32, payload & 0xFFFFFFFF
+        if tag == TAG_LIST:
+            return self.sequence(payload)
+        if tag == TAG_TUPLE:
+            return self.sequence(payload, tuple)
+        if tag == TAG_NONE:
+            return None
+        if tag == TAG_BIGINT:
+            return int(self.string(payload))
+        return tag == TAG_TRUE
+
+    def _values(self, start, count):
+        tags = self.tags
+        payloads = self.payloads
+        value = self.value
+        return [value(tags[slot], payloads[slot]) for slot in range(start, start + count)]
+
+    def keys(self, shape):
+        keys = self._shapes.get(shape)
+        if keys is None:
+            string = self.string
+            first, last = self.shape_offsets[shape], self.shape_offsets[shape + 1]
+            keys = self._shapes[shape] = tuple(string(self.shape_keys[position])
+                                               for position in range(first, last))
+        return keys
+
+    def node(self, index):
+        node = self._nodes.get(index)
+        if node is None:
+            keys = self.keys(self.node_shapes[index])
+            node = self._nodes[index] = dict(zip(keys, self._values(self.node_starts[index],
+                                                                    len(keys))))
+        return node
+
+    def sequence(self, index, kind=list):
+        sequence = self._sequences.get(index)
+        if sequence is None:
+            sequence = kind(self._values(self.sequence_starts[index],
+                                         self.sequence_sizes[index]))
+            self._sequences[index] = sequence
+        return sequence
+
+    def entries(self):
+        """(summary, result): o resumo com listas preguiçosas e a árvore (ou None)"""
+        start = self.sequence_starts[self.root[0]]
+        summary_tag, summary_node = self.tags[start], self.payloads[start]
+        assert summary_tag == TAG_DICT
+        keys = self.keys(self.node_shapes[summary_node])
+        first = self.node_starts[summary_node]
+        summary = {}
+        for slot, key in enumerate(keys, first):
+            tag, payload = self.tags[slot], self.payloads[slot]
+            summary[key] = (LazyList(self, payload) if tag == TAG_LIST
+                            else self.value(tag, payload))
+        return summary, (self.tags[start + 1], self.payloads[start + 1])
+
+
+class LazyList(Sequence):
+    """
+    Lista do resumo lida direto do bloco: len() não decodifica nada e cada
+    item vira dicionário no primeiro acesso (sempre o mesmo objeto depois).
+    list(lazy) devolve uma lista comum com os mesmos objetos.
+    """
+
+    __slots__ = ('_block', '_start', '_size')
+
+    def __init__(self, block, index):
+        self._block = block
+        self._start = block.sequence_starts[index]
+        self._size = block.sequence_sizes[index]
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[item] for item in range(*position.indices(self._size))]
+        if position < 0:
+            position += self._size
+        if not 0 <= position < self._size:
+            raise IndexError("índice fora da lista")
+        slot = self._start + position
+        return self._block.value(self._block.tags[slot], self._block.payloads[slot])
+
+    def __iter__(self):
+        block = self._block
+        tags = block.tags
+        payloads = block.payloads
+        value = block.value
+        for slot in range(self._start, self._start + self._size):
+            yield value(tags[slot], payloads[slot])
+
+    def __repr__(self):
+        return f"LazyList({len(self)} itens)"
+
+
+class TokenColumns(Sequence):
+    """Tokens lidos das colunas do bloco; cada acesso cria um LexToken"""
+
+    __slots__ = ('_block',)
+
+    def __init__(self, block):
+        self._block = block
+
+    def __len__(self):
+        return len(self._block.token_types)
+
+    def _token(self, position):
+        # Importado aqui para não pesar no import de src.cli
+        from ply.lex import LexToken
+
+        block = self._block
+        token = LexToken()
+        token.type = block.string(block.token_types[position])
+        token.value = block.value(block.token_tags[position], block.token_values[position])
+        token.lineno = block.token_lines[position]
+        token.lexpos = block.token_positions[position]
+        return token
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._token(item) for item in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("índice fora dos tokens")
+        return self._token(position)
+
+    def __iter__(self):
+        return map(self._token, range(len(self)))
+
+    def __repr__(self):
+        return f"TokenColumns({len(self)} tokens)"
+
+
+class SharedAnalysis(dict):
+    """
+    Resultado de análise sobre um bloco codificado, com as chaves de
+    TontoAnalyzer.analyze. 'tokens' é um TokenColumns e as listas de
+    'summary' são LazyList; 'result', 'token_index', 'declaration_trie' e
+    'line_index' (só quando o código foi informado) são montados no
+    primeiro acesso por analysis[chave] ou get().
+    """
+
+    LAZY = ('result', 'token_index', 'declaration_trie', 'line_index')
+
+    def __init__(self, block, small, source=None):
+        summary, self._result = block.entries()
+        super().__init__(small, tokens=TokenColumns(block), summary=summary)
+        self._block = block
+        self._source = source
+
+    def __missing__(self, key):
+        if key == 'result':
+            value = self._block.value(*self._result)
+        elif key == 'token_index':
+            from .indexes import TokenIndex
+            value = TokenIndex(self['tokens'])
+        elif key == 'declaration_trie':
+            from .indexes import build_declaration_trie
+            value = build_declaration_trie(self['summary'])
+        elif key == 'line_index' and self._source is not None:
+            from .spans import LineIndex
+            source = self._source
+            value = LineIndex(source.decode('utf-8') if isinstance(source, bytes) else source)
+        else:
+            raise KeyError(key)
+        self[key] = value
+        return value
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or (
+            key in self.LAZY and (key != 'line_index' or self._source is not None))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def materialize(self):
+        """
+        Dicionário comum, sem referências ao bloco: listas no resumo, tokens
+        em lista e 'result' decodificado (os índices não são copiados)
+        """
+        analysis = {key: value for key, value in self.items()
+                    if key not in ('token_index', 'declaration_trie')}
+        analysis['result'] = self['result']
+        analysis['tokens'] = list(self['tokens'])
+        analysis['summary'] = {key: list(value) if isinstance(value, LazyList) else value
+                               for key, value in self['summary'].items()}
+        return analysis
+
+    def __reduce__(self):
+        # O bloco não vai por pickle: a cópia é o resultado materializado
+        return dict, (self.materialize(),)
+
+
+# Chaves pequenas que voltam pelo pickle, junto com o nome do bloco
+SMALL_KEYS = ('lex_errors', 'syn_errors', 'comments', 'categories', 'budget_exceeded')
+
+
+def ensure_tracker():
+    """
+    Inicia o resource_tracker no processo principal antes de criar o pool:
+    os processos do pool herdam o mesmo tracker, e um bloco que o processo
+    principal não chegou a abrir é removido quando ele termina.
+    """
+    from multiprocessing import resource_tracker
+    resource_tracker.ensure_running()
+
+
+def share_analysis(analysis):
+    """
+    No processo do pool: grava o resultado em um bloco de memória
+    compartilhada e retorna o que volta pelo pool, (nome, tamanho, partes
+    pequenas). Sem memória compartilhada POSIX (ex.: no Windows, onde o
+    bloco sumiria ao ser fechado aqui), o nome é None e o bloco vai em
+    bytes no lugar do tamanho. Quem recebe deve chamar open_shared
+    exatamente uma vez: é ele quem remove o bloco.
+    """
+    from multiprocessing import shared_memory
+
+    columns = encode_columns(analysis)
+    size = encoded_size(columns)
+    small = {key: analysis[key] for key in SMALL_KEYS}
+    try:
+        if os.name != 'posix':
+            raise OSError("Memória compartilhada POSIX indisponível")
+        shm = shared_memory.SharedMemory(create=True, size=size)
+    except OSError:
+        buffer = bytearray(size)
+        write_columns(columns, buffer)
+        return None, bytes(buffer), small
+    try:
+        write_columns(columns, shm.buf)
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    return shm.name, size, small
+
+
+def open_shared(shared, source=None):
+    """
+    No processo principal: SharedAnalysis sobre o bloco devolvido por
+    share_analysis. O bloco é removido na hora, mesmo se a abertura
+    falhar. source (texto ou bytes do arquivo) habilita 'line_index'.
+    """
+    name, size, small = shared
+    if name is None:
+        return SharedAnalysis(_Block(size, len(size)), small, source)
+    data = _take_block(name, size)
+    return SharedAnalysis(_Block(data, size), small, source)
+
+
+def _take_block(name, size):
+    """
+    Copia para a memória local o bloco criado por share_analysis e o
+    remove. Nenhum descritor fica aberto (o mmap guarda uma cópia do
+    descritor enquanto existir): com milhares de resultados em cache, um
+    por bloco esgotaria o limite do processo.
+    """
+    import mmap
+    from multiprocessing import resource_tracker
+
+    import _posixshmem
+
+    path = '/' + name
+    try:
+        fd = _posixshmem.shm_open(path, os.O_RDONLY, mode=0o600)
+    finally:
+        # Remover o nome sempre: um bloco que não abriu não fica para trás
+        try:
+            _posixshmem.shm_unlink(path)
+        except OSError:
+            pass
+        resource_tracker.unregister(path, 'shared_memory')
+    try:
+        with mmap.mmap(fd, size, prot=mmap.PROT_READ) as mapping:
+            return mapping[:size]
+    finally:
+        os.close(fd)
@@ -0,0 +1,47 @@
+"""
+Conversão de spans (offsets de início e fim) em linha e coluna
+
+O parser anota cada nó com 'span': (início, fim) em offsets do código,
+o que não custa quase nada durante a análise. Linha e coluna só são
+calculadas quando alguém pede, por busca binária em um índice de início
+de linhas montado na primeira consulta.
+"""
+import re
+from array import array
+from bisect import bisect_right
+
+
+NEWLINE = re.compile(r'\n')
+
+
+class LineIndex:
+    """Índice de início de linhas de um código, construído sob demanda"""
+
+    def __init__(self, source):
+        self.source = source
+        self._starts = None
+
+    @property
+    def line_starts(self):
+        """Offset de início de cada linha (linha 1 começa no offset 0)"""
+        if self._starts is None:
+            starts = array('q', [0])
+            starts.extend(match.end() for match in NEWLINE.finditer(self.source))
+            self._starts = starts
+        return self._starts
+
+    def position(self, offset):
+        """(linha, coluna) de um offset, ambas começando em 1"""
+        starts = self.line_starts
+        line = bisect_right(starts, offset)
+        return line, offset - starts[line - 1] + 1
+
+    def range(self, span):
+        """((linha, coluna) do início, (linha, coluna) do fim) de um span"""
+        start, end = span
+        return self.position(start), self.position(end)
+
+    def text(self, span):
+        """Trecho do código coberto por um span"""
+        start, end = span
+        return self.source[start:end]
@@ -0,0 +1,263 @@
+"""
+Análise de uma pasta inteira de arquivos TONTO
+
+Os arquivos são analisados em um pool de processos (cada processo constrói
+léxico e parser uma única vez) e os resultados ficam em cache pelo hash do
+conteúdo: reabrir a pasta ou alternar entre arquivos não reanalisa nada
+que não tenha mudado. Os resultados voltam do pool em memória
+compartilhada (ver shared_result), sem pickle do resumo e dos tokens.
+"""
+import hashlib
+import os
+import queue
+import threading
+
+from ..lexico.lexico import lexical_error
+from ..lexico.names import NAMES, NameTable
+from .analyzer import TontoAnalyzer
+from .incremental import SUMMARY_LISTS
+from .indexes import TokenIndex, build_declaration_trie
+from .shared_result import ensure_tracker, open_shared, share_analysis
+
+
+TONTO_EXTENSION = '.tonto'
+
+# Analisador de cada processo do pool, criado pelo inicializador
+_process_analyzer = None
+
+
+def find_tonto_files(folder):
+    """Caminhos de todos os arquivos .tonto da pasta (recursivo), em ordem"""
+    found = []
+    for root, dirs, files in os.walk(folder):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        for name in sorted(files):
+            if name.lower().endswith(TONTO_EXTENSION):
+                found.append(os.path.join(root, name))
+    return found
+
+
+def content_digest(data):
+    """Hash do conteúdo de um arquivo (bytes), usado como chave do cache"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def init_process(intern_names=True):
+    """
+    Inicializador do pool: as tabelas do PLY são montadas uma vez por processo.
+    intern_names=False: os nomes não são internados (processos que recebem
+    código de terceiros e não guardam resultados, como o serviço HTTP)
+    """
+    global _process_analyzer
+    _process_analyzer = TontoAnalyzer(None if intern_names else NameTable(max_names=0))
+    _process_analyzer.warm_up()
+
+
+def analyze_for_pickle(source, limits=None):
+    """
+    Análise em um processo do pool, pronta para voltar por pickle.
+    Também funciona em pools criados sem init_process.
+
+    limits: dicionário opcional com os limites de TontoAnalyzer.analyze
+            (max_seconds, max_tokens, max_diagnostics)
+    """
+    if _process_analyzer is None:
+        init_process()
+    analysis = _process_analyzer.analyze(source, **(limits or {}))
+
+    # Tokens do PLY guardam o léxico (que não é serializável)
+    for token in analysis['tokens']:
+        token.__dict__.pop('lexer', None)
+    for token in analysis['lex_errors']:
+        token.__dict__.pop('lexer', None)
+    return analysis
+
+
+def _analyze_in_process(source, limits=None):
+    """Executada no processo do pool; o resultado volta por pickle"""
+    analysis = analyze_for_pickle(source, limits)
+    analysis['token_index'] = TokenIndex(analysis['tokens'])
+    analysis['declaration_trie'] = build_declaration_trie(analysis['summary'])
+    return analysis
+
+
+def _analyze_to_shared(source, limits=None):
+    """Executada no processo do pool; o resultado volta em memória compartilhada"""
+    return share_analysis(analyze_for_pickle(source, limits))
+
+
+def intern_result(analysis):
+    """
+    Troca as strings de um resultado vindo do pool pelas canônicas do processo:
+    o pickle cria cópias, e sem isso cada arquivo teria os próprios nomes
+    """
+    NAMES.intern_tokens(analysis['tokens'])
+    memo = set()
+    NAMES.intern_tree(analysis['summary'], memo)
+    NAMES.intern_tree(analysis['result'], memo)
+    return analysis
+
+
+def aggregate_results(results):
+    """
+    Resumo do projeto a partir de caminho -> resultado.
+
+    Retorna contagens totais e a lista de erros de todos os arquivos como
+    (caminho, linha, tipo, mensagem, sugestão), em ordem de caminho (os
+    resultados chegam do pool em qualquer ordem). Arquivos interrompidos por
+    um limite de análise são contados à parte, em files_over_budget (por
+    limite em budget_hits), e só entram em files_with_errors se tiverem
+    outros erros além do diagnóstico de limite excedido.
+    """
+    totals = {key: 0 for key in SUMMARY_LISTS}
+    categories = {}
+    errors = []
+    token_count = 0
+    files_with_errors = 0
+    budget_hits = {}
+
+    for path in sorted(results):
+        analysis = results[path]
+        token_count += len(analysis['tokens'])
+        for key in SUMMARY_LISTS:
+            totals[key] += len(analysis['summary'][key])
+        for cat, count in analysis['categories'].items():
+            categories[cat] = categories.get(cat, 0) + count
+
+        exceeded = analysis.get('budget_exceeded')
+        if exceeded is not None:
+            budget_hits[exceeded] = budget_hits.get(exceeded, 0) + 1
+        if analysis['lex_errors'] or len(analysis['syn_errors']) > (exceeded is not None):
+            files_with_errors += 1
+        for error in map(lexical_error, analysis['lex_errors']):
+            errors.append((path, error['linha'], error['tipo'],
+                           error['mensagem'], error['sugestao']))
+        for error in analysis['syn_errors']:
+            errors.append((path, error['linha'], error['tipo'],
+                           error['mensagem'], error['sugestao']))
+
+    return {
+        'files': len(results),
+        'files_with_errors': files_with_errors,
+        'files_over_budget': sum(budget_hits.values()),
+        'budget_hits': budget_hits,
+        'token_count': token_count,
+        'categories': categories,
+        'totals': totals,
+        'errors': errors,
+    }
+
+
+class WorkspaceAnalyzer:
+    """
+    Coordena a análise de uma pasta em segundo plano.
+
+    Uma thread coordenadora lê cada arquivo, consulta o cache pelo hash e
+    envia ao pool apenas os que mudaram. limits são os limites de cada
+    arquivo (ver analyze_for_pickle), para que um arquivo patológico não
+    prenda um processo do pool. Com shared_memory (padrão), os resultados
+    são SharedAnalysis lidos no bloco escrito pelo processo do pool; sem,
+    voltam por pickle como dicionários comuns. Mensagens publicadas em
+    self.messages:
+        (geração, 'arquivo', caminho, 'cache' | 'concluido', resultado)
+        (geração, 'arquivo', caminho, 'erro', exceção)
+        (geração, 'fim')
+    """
+
+    def __init__(self, max_workers=None, limits=None, shared_memory=True):
+        self.max_workers = max_workers
+        self.limits = limits
+        self.shared_memory = shared_memory
+        self.messages = queue.Queue()
+        self.cache = {}             # hash do conteúdo -> resultado
+        self.results = {}           # caminho -> resultado da última análise
+        self.generation = 0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def analyze_folder(self, paths):
+        """Agenda a análise dos arquivos; uma chamada nova substitui a anterior"""
+        with self._lock:
+            self.generation += 1
+            generation = self.generation
+            self.results = {}
+        if self._executor is None:
+            # Importado só aqui: concurrent.futures e multiprocessing pesam
+            # na abertura da interface
+            from concurrent.futures import ProcessPoolExecutor
+            if self.shared_memory:
+                ensure_tracker()
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 initializer=init_process)
+        threading.Thread(target=self._coordinate, args=(generation, list(paths)),
+                         name="tonto-workspace", daemon=True).start()
+
+    def cancel(self):
+        """Descarta a análise em andamento (mensagens pendentes deixam de valer)"""
+        with self._lock:
+            self.generation += 1
+
+    def shutdown(self, wait=False):
+        """
+        Encerra o pool. A interface não espera (wait=False); scripts e a
+        linha de comando esperam, para o pool não ser desmontado durante a
+        saída do interpretador.
+        """
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def _current(self, generation):
+        return generation == self.generation
+
+    def _coordinate(self, generation, paths):
+        from concurrent.futures import as_completed
+
+        task = _analyze_to_shared if self.shared_memory else _analyze_in_process
+        pending = {}                # future -> (caminho, hash, conteúdo)
+        for path in paths:
+            if not self._current(generation):
+                return
+            try:
+                with open(path, 'rb') as file:
+                    data = file.read()
+                digest = content_digest(data)
+                cached = self.cache.get(digest)
+                if cached is not None:
+                    self._publish(generation, path, 'cache', cached)
+                    continue
+                future = self._executor.submit(task, data.decode('utf-8'), self.limits)
+            except Exception as e:
+                self.messages.put((generation, 'arquivo', path, 'erro', e))
+                continue
+            pending[future] = (path, digest, data)
+
+        # Publicar cada arquivo assim que ele termina, em qualquer ordem.
+        # Mesmo de uma geração descartada, todo bloco compartilhado é aberto
+        # (open_shared remove o bloco; senão ele ficaria até o fim do processo)
+        for future in as_completed(pending):
+            path, digest, data = pending.pop(future)
+            if future.cancelled():
+                continue            # Pool encerrado
+            try:
+                result = future.result()
+                if self.shared_memory:
+                    result = open_shared(result, data)
+                else:
+                    result = intern_result(result)
+            except Exception as e:
+                self.messages.put((generation, 'arquivo', path, 'erro', e))
+                continue
+            self.cache[digest] = result
+            self._publish(generation, path, 'concluido', result)
+
+        if self._current(generation):
+            self.messages.put((generation, 'fim'))
+
+    def _publish(self, generation, path, status, result):
+        with self._lock:
+            if generation != self.generation:
+                return
+            self.results[path] = result
+        self.messages.put((generation, 'arquivo', path, status, result))
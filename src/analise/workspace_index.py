@@ -0,0 +1,498 @@
+"""
+Índice persistente (SQLite) de uma pasta de arquivos TONTO
+
+Guarda, por arquivo, o hash do conteúdo e as declarações, relações,
+especializações (specializes e gensets), atributos e imports extraídos
+da análise. Consultas entre arquivos ("onde Contrato é usado?", "quais
+relators e o que eles mediam") são respondidas pelo banco, sem abrir
+nem analisar os arquivos.
+
+Exemplo:
+    with WorkspaceIndex('modelos/.tonto-index.sqlite') as index:
+        index.update('modelos')             # só reanalisa o que mudou
+        index.usages('Contract')
+        index.relations(stereotype='mediation')
+        index.subclasses('Person', transitive=True)
+
+A atualização é incremental: tamanho e data de modificação iguais aos
+registrados dispensam até a leitura do arquivo; se mudaram, o hash do
+conteúdo decide se ele é reanalisado. A extração usa a análise em
+streaming (sintatico/events.py), sem montar a árvore nem guardar tokens.
+Um arquivo que não pode ser lido ou cuja análise falha não interrompe a
+atualização: ele fica registrado em files com a mensagem em failure.
+"""
+import os
+import sqlite3
+
+from ..sintatico.events import ParseHandler
+from .analyzer import TontoAnalyzer
+from .spans import LineIndex
+from .workspace import content_digest, find_tonto_files
+
+
+DEFAULT_INDEX = '.tonto-index.sqlite'
+
+# Incrementado a cada mudança do esquema: um índice antigo é recriado
+SCHEMA_VERSION = 2
+
+SCHEMA = '''
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    budget_exceeded TEXT,
+    failure TEXT
+);
+CREATE TABLE declarations (
+    file_id INTEGER NOT NULL,
+    package TEXT,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    stereotype TEXT,
+    line INTEGER
+);
+CREATE TABLE relations (
+    file_id INTEGER NOT NULL,
+    package TEXT,
+    stereotype TEXT,
+    name TEXT,
+    source TEXT,
+    target TEXT,
+    source_cardinality TEXT,
+    target_cardinality TEXT,
+    internal INTEGER NOT NULL,
+    line INTEGER
+);
+CREATE TABLE specializations (
+    file_id INTEGER NOT NULL,
+    package TEXT,
+    child TEXT NOT NULL,
+    parent TEXT NOT NULL,
+    genset TEXT,
+    line INTEGER
+);
+CREATE TABLE attributes (
+    file_id INTEGER NOT NULL,
+    package TEXT,
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT,
+    cardinality TEXT,
+    line INTEGER
+);
+CREATE TABLE imports (
+    file_id INTEGER NOT NULL,
+    module TEXT NOT NULL,
+    line INTEGER
+);
+CREATE INDEX declarations_name ON declarations (name);
+CREATE INDEX declarations_stereotype ON declarations (stereotype);
+CREATE INDEX declarations_file ON declarations (file_id);
+CREATE INDEX relations_source ON relations (source);
+CREATE INDEX relations_target ON relations (target);
+CREATE INDEX relations_stereotype ON relations (stereotype);
+CREATE INDEX relations_file ON relations (file_id);
+CREATE INDEX specializations_parent ON specializations (parent);
+CREATE INDEX specializations_child ON specializations (child);
+CREATE INDEX specializations_file ON specializations (file_id);
+CREATE INDEX attributes_type ON attributes (type);
+CREATE INDEX attributes_file ON attributes (file_id);
+CREATE INDEX imports_module ON imports (module);
+CREATE INDEX imports_file ON imports (file_id);
+'''
+
+# Tabelas com linhas por arquivo, na ordem das colunas de extract_rows
+ROW_TABLES = {
+    'declarations': ('package', 'kind', 'name', 'stereotype', 'line'),
+    'relations': ('package', 'stereotype', 'name', 'source', 'target',
+                  'source_cardinality', 'target_cardinality', 'internal', 'line'),
+    'specializations': ('package', 'child', 'parent', 'genset', 'line'),
+    'attributes': ('package', 'owner', 'name', 'type', 'cardinality', 'line'),
+    'imports': ('module', 'line'),
+}
+
+
+def _cardinality(value):
+    return value['text'] if value else None
+
+
+class _RowExtractor(ParseHandler):
+    """
+    Monta as linhas do índice a partir dos eventos do parser. O pacote de
+    uma declaração só é conhecido no on_package, que chega depois dela:
+    as linhas ficam pendentes (com o pacote na primeira coluna) até lá.
+    """
+
+    def __init__(self, source):
+        self.rows = {table: [] for table in ROW_TABLES}
+        self._pending = []
+        self._lines = LineIndex(source)
+
+    def _line(self, info):
+        """Linha do nó; regras que começam por não terminal registram 'line' 0"""
+        return info['line'] or self._lines.position(info['span'][0])[0]
+
+    def _add(self, table, *row):
+        row = [None, *row]
+        self.rows[table].append(row)
+        self._pending.append(row)
+
+    def on_import(self, info):
+        self.rows['imports'].append((info['module'], self._line(info)))
+
+    def on_package(self, info):
+        for row in self._pending:
+            row[0] = info['name']
+        self._pending = []
+        self.rows['declarations'].append((info['name'], 'package', info['name'], None,
+                                          self._line(info)))
+
+    def on_class(self, info):
+        name = info['name']
+        line = self._line(info)
+        self._add('declarations', 'class', name, info['stereotype'], line)
+        for parent in info['parents']:
+            self._add('specializations', name, parent, None, line)
+        # Atributos e relações internas chegam antes da classe: a origem
+        # de cada um só é conhecida aqui
+        for member in info['body']:
+            if not isinstance(member, dict):
+                continue
+            if member.get('internal'):
+                self._add('relations', member['stereotype'], member['name'], name,
+                          member['target'], _cardinality(member['source_cardinality']),
+                          _cardinality(member['target_cardinality']), 1, self._line(member))
+            elif 'type' in member:
+                self._add('attributes', name, member['name'], member['type'],
+                          _cardinality(member['cardinality']), self._line(member))
+
+    def on_datatype(self, info):
+        self._add('declarations', 'datatype', info['name'], None, self._line(info))
+        for attribute in info['attributes']:
+            self._add('attributes', info['name'], attribute['name'], attribute['type'],
+                      _cardinality(attribute['cardinality']), self._line(attribute))
+
+    def on_enum(self, info):
+        self._add('declarations', 'enum', info['name'], None, self._line(info))
+
+    def on_genset(self, info):
+        line = self._line(info)
+        self._add('declarations', 'genset', info['name'], None, line)
+        for specific in info['specifics']:
+            self._add('specializations', specific, info['general'], info['name'], line)
+
+    def on_relation(self, info):
+        if info['internal']:
+            return      # Registrada no on_class, que conhece a origem
+        self._add('relations', info['stereotype'], info.get('relation_name'),
+                  info['source'], info['target'], _cardinality(info['source_cardinality']),
+                  _cardinality(info['target_cardinality']), 0, self._line(info))
+
+
+# Analisador do processo (no pool ou no próprio processo do índice)
+_analyzer = None
+
+
+def extract_rows(source, limits=None):
+    """
+    Linhas do índice de um código: (linhas por tabela, erros, limite excedido).
+    Executada nos processos do pool; o resultado tem só tuplas pequenas.
+    """
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = TontoAnalyzer()
+    extractor = _RowExtractor(source)
+    counts = _analyzer.stream(source, extractor, **(limits or {}))
+    rows = {table: [tuple(row) for row in table_rows]
+            for table, table_rows in extractor.rows.items()}
+    return rows, counts['lex_errors'] + counts['syn_errors'], counts['budget_exceeded']
+
+
+def _extract_in_process(source, limits=None):
+    """
+    extract_rows de um arquivo, isolando falhas: (linhas, erros, limite
+    excedido, falha). Uma exceção vira a mensagem de falha do arquivo, sem
+    derrubar a atualização dos outros.
+    """
+    try:
+        return (*extract_rows(source, limits), None)
+    except Exception as e:
+        return {table: [] for table in ROW_TABLES}, 0, None, f"{type(e).__name__}: {e}"
+
+
+class WorkspaceIndex:
+    """
+    Índice SQLite de declarações e referências de uma pasta.
+
+    limits: limites de cada análise (ver TontoAnalyzer.analyze); um
+            arquivo interrompido é indexado com o que foi reconhecido
+    """
+
+    def __init__(self, path=DEFAULT_INDEX, limits=None):
+        self.path = path
+        self.limits = limits
+        self.db = sqlite3.connect(path)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        if self.db.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+            self._create_schema()
+
+    def _create_schema(self):
+        with self.db:
+            for (table,) in self.db.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+                self.db.execute(f'DROP TABLE {table}')
+            self.db.executescript(SCHEMA)
+            self.db.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ========================================================================
+    # ATUALIZAÇÃO
+    # ========================================================================
+
+    def update(self, folder, max_workers=None):
+        """
+        Sincroniza o índice com os arquivos .tonto da pasta: reanalisa os
+        novos e os que mudaram e remove os que não existem mais.
+        Retorna {'indexados', 'inalterados', 'removidos', 'falhas'}; falhas
+        lista (caminho, mensagem) dos arquivos que não puderam ser
+        analisados (registrados em files) ou lidos (ignorados).
+        """
+        folder = os.path.abspath(folder)
+        paths = [os.path.abspath(path) for path in find_tonto_files(folder)]
+        known = {row[0]: row[1:] for row in self.db.execute(
+            'SELECT path, id, hash, size, mtime_ns FROM files')}
+
+        changed = []                # (caminho, hash, stat, código)
+        failures = []
+        unchanged = 0
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                entry = known.get(path)
+                if entry is not None and entry[2:] == (stat.st_size, stat.st_mtime_ns):
+                    unchanged += 1
+                    continue
+                with open(path, 'rb') as file:
+                    data = file.read()
+            except OSError as e:
+                # Ex.: removido ou sem permissão entre a listagem e a leitura
+                failures.append((path, str(e)))
+                continue
+            digest = content_digest(data)
+            if entry is not None and entry[1] == digest:
+                # Só a data mudou (ex.: checkout): basta atualizá-la
+                with self.db:
+                    self.db.execute('UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?',
+                                    (stat.st_size, stat.st_mtime_ns, entry[0]))
+                unchanged += 1
+                continue
+            changed.append((path, digest, stat, data.decode('utf-8', errors='replace')))
+
+        # Arquivos da pasta que sumiram do disco
+        prefix = os.path.join(folder, '')
+        present = set(paths)
+        removed = [(entry[0],) for path, entry in known.items()
+                   if path.startswith(prefix) and path not in present]
+
+        with self.db:
+            self._delete_rows(removed)
+            self.db.executemany('DELETE FROM files WHERE id = ?', removed)
+            for (path, digest, stat, _), extracted in zip(changed,
+                                                         self._extract(changed, max_workers)):
+                self._store(path, digest, stat, known.get(path), *extracted)
+                if extracted[3] is not None:
+                    failures.append((path, extracted[3]))
+
+        return {'indexados': len(changed), 'inalterados': unchanged,
+                'removidos': len(removed), 'falhas': failures}
+
+    def _extract(self, changed, max_workers):
+        """Linhas de cada arquivo alterado, em ordem; em um pool se forem vários"""
+        sources = [source for _, _, _, source in changed]
+        if len(sources) < 2 or max_workers == 1:
+            return [_extract_in_process(source, self.limits) for source in sources]
+
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_extract_in_process, sources,
+                                     [self.limits] * len(sources), chunksize=8))
+
+    def _delete_rows(self, file_ids):
+        for table in ROW_TABLES:
+            self.db.executemany(f'DELETE FROM {table} WHERE file_id = ?', file_ids)
+
+    def _store(self, path, digest, stat, entry, rows, errors, exceeded, failure):
+        if entry is None:
+            file_id = self.db.execute(
+                'INSERT INTO files (path, hash, size, mtime_ns, errors, budget_exceeded, failure) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (path, digest, stat.st_size, stat.st_mtime_ns, errors, exceeded,
+                 failure)).lastrowid
+        else:
+            file_id = entry[0]
+            self._delete_rows([(file_id,)])
+            self.db.execute('UPDATE files SET hash = ?, size = ?, mtime_ns = ?, errors = ?, '
+                            'budget_exceeded = ?, failure = ? WHERE id = ?',
+                            (digest, stat.st_size, stat.st_mtime_ns, errors, exceeded, failure,
+                             file_id))
+
+        for table, columns in ROW_TABLES.items():
+            placeholders = ', '.join('?' * (len(columns) + 1))
+            self.db.executemany(
+                f"INSERT INTO {table} (file_id, {', '.join(columns)}) VALUES ({placeholders})",
+                [(file_id, *row) for row in rows[table]])
+
+    # ========================================================================
+    # CONSULTAS
+    # ========================================================================
+    # Cada resultado é um dicionário com 'path' e 'line' do arquivo de origem
+
+    def _select(self, sql, params=()):
+        cursor = self.db.execute(sql, params)
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def _filtered(self, table, columns, criteria):
+        """SELECT das colunas com filtros de igualdade (valores None são ignorados)"""
+        conditions = []
+        params = []
+        for column, value in criteria.items():
+            if value is not None:
+                conditions.append(f't.{column} = ?')
+                params.append(value)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        return self._select(
+            f"SELECT f.path, t.line, {', '.join('t.' + c for c in columns)} "
+            f"FROM {table} t JOIN files f ON f.id = t.file_id {where} "
+            f"ORDER BY f.path, t.line", params)
+
+    def files(self):
+        """Arquivos indexados, com hash, número de erros e limite excedido"""
+        return self._select('SELECT path, hash, errors, budget_exceeded, failure '
+                            'FROM files ORDER BY path')
+
+    def declarations(self, name=None, kind=None, stereotype=None, package=None):
+        """Declarações (package, class, datatype, enum, genset)"""
+        return self._filtered('declarations', ('package', 'kind', 'name', 'stereotype'),
+                              {'name': name, 'kind': kind, 'stereotype': stereotype,
+                               'package': package})
+
+    def relations(self, stereotype=None, source=None, target=None, name=None):
+        """Relações internas (origem: a classe que as declara) e externas"""
+        return self._filtered('relations', ('package', 'stereotype', 'name', 'source', 'target',
+                                            'source_cardinality', 'target_cardinality',
+                                            'internal'),
+                              {'stereotype': stereotype, 'source': source, 'target': target,
+                               'name': name})
+
+    def attributes(self, type=None, owner=None, name=None):
+        return self._filtered('attributes', ('package', 'owner', 'name', 'type', 'cardinality'),
+                              {'type': type, 'owner': owner, 'name': name})
+
+    def imports(self, module=None):
+        return self._filtered('imports', ('module',), {'module': module})
+
+    def subclasses(self, name, transitive=False):
+        """Especializações de name (diretas ou, com transitive, todas, com 'depth')"""
+        if not transitive:
+            return self._filtered('specializations', ('package', 'child', 'parent', 'genset'),
+                                  {'parent': name})
+        return self._hierarchy(name, 'parent', 'child')
+
+    def superclasses(self, name, transitive=False):
+        """Classes que name especializa (diretas ou, com transitive, todas, com 'depth')"""
+        if not transitive:
+            return self._filtered('specializations', ('package', 'child', 'parent', 'genset'),
+                                  {'child': name})
+        return self._hierarchy(name, 'child', 'parent')
+
+    def _hierarchy(self, name, start, step):
+        """
+        Especializações alcançáveis a partir de name, seguindo da coluna
+        start para a coluna step (parent -> child desce na hierarquia).
+        A profundidade é limitada para que ciclos no modelo terminem.
+        """
+        return self._select(f'''
+            WITH RECURSIVE reached(id, name, depth) AS (
+                SELECT rowid, {step}, 1 FROM specializations WHERE {start} = ?
+                UNION
+                SELECT s.rowid, s.{step}, reached.depth + 1
+                FROM specializations s JOIN reached ON s.{start} = reached.name
+                WHERE reached.depth < 64
+            )
+            SELECT f.path, s.line, s.package, s.child, s.parent, s.genset,
+                   MIN(reached.depth) AS depth
+            FROM reached
+            JOIN specializations s ON s.rowid = reached.id
+            JOIN files f ON f.id = s.file_id
+            GROUP BY reached.id
+            ORDER BY depth, s.{step}''', (name,))
+
+    def usages(self, name):
+        """
+        Onde um nome é referenciado: extremidades de relações, pais em
+        specializes e gensets, tipos de atributos e imports. Cada resultado
+        traz 'kind' (relacao, especializacao, genset, atributo, import) e
+        'context', uma descrição curta da referência.
+        """
+        return self._select('''
+            SELECT f.path, r.line, 'relacao' AS kind,
+                   r.source || ' ' || COALESCE('@' || r.stereotype || ' ', '') || '-> '
+                       || r.target AS context
+            FROM relations r JOIN files f ON f.id = r.file_id
+            WHERE r.source = ?1 OR r.target = ?1
+            UNION ALL
+            SELECT f.path, s.line, CASE WHEN s.genset IS NULL THEN 'especializacao'
+                                        ELSE 'genset' END,
+                   s.child || ' specializes ' || s.parent
+                       || COALESCE(' (genset ' || s.genset || ')', '')
+            FROM specializations s JOIN files f ON f.id = s.file_id
+            WHERE s.parent = ?1 OR (s.child = ?1 AND s.genset IS NOT NULL)
+            UNION ALL
+            SELECT f.path, a.line, 'atributo', a.owner || '.' || a.name || ': ' || a.type
+            FROM attributes a JOIN files f ON f.id = a.file_id
+            WHERE a.type = ?1
+            UNION ALL
+            SELECT f.path, i.line, 'import', 'import ' || i.module
+            FROM imports i JOIN files f ON f.id = i.file_id
+            WHERE i.module = ?1
+            ORDER BY 1, 2''', (name,))
+
+    def mediations(self):
+        """Cada relator com as classes que ele media ('mediated', em ordem)"""
+        # As mediações são agrupadas por origem uma vez só, e não para cada
+        # declaração de relator (o mesmo nome pode ser declarado em vários arquivos)
+        rows = self._select('''
+            WITH mediated AS (
+                SELECT source, group_concat(DISTINCT target) AS targets
+                FROM relations WHERE stereotype = 'mediation'
+                GROUP BY source
+            )
+            SELECT f.path, d.line, d.package, d.name, m.targets AS mediated
+            FROM declarations d
+            JOIN files f ON f.id = d.file_id
+            LEFT JOIN mediated m ON m.source = d.name
+            WHERE d.kind = 'class' AND d.stereotype = 'relator'
+            ORDER BY d.name, f.path, d.line''')
+        for row in rows:
+            row['mediated'] = sorted(row['mediated'].split(',')) if row['mediated'] else []
+        return rows
+
+    def stats(self):
+        """Número de linhas de cada tabela"""
+        counts = {'files': self.db.execute('SELECT COUNT(*) FROM files').fetchone()[0]}
+        for table in ROW_TABLES:
+            counts[table] = self.db.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+        return counts
@@ -0,0 +1,446 @@
+"""
+Interface de linha de comando do Analisador TONTO
+
+Uso:
+    python -m src.cli export modelo.tonto -f dot -o modelo.dot
+    python -m src.cli diff antigo.tonto novo.tonto -o diff.json
+    python -m src.cli format pasta/ --check
+    python -m src.cli bench pasta/ --repeat 5
+    python -m src.cli bench pasta/ --transport -j 4
+    python -m src.cli conformance conformidade/
+    python -m src.cli serve --port 8765 -j 4
+    python -m src.cli index modelos/
+    python -m src.cli query usages Contract
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from .analise.analyzer import TontoAnalyzer
+from .analise.conformance import check_corpus
+from .analise.diff import diff
+from .analise.formatter import FormatError, format_file, format_files
+from .analise.graph_export import EXPORT_FORMATS, export_graph
+from .analise.workspace import find_tonto_files
+
+
+# Formato de exportação deduzido pela extensão do arquivo de saída
+EXTENSION_FORMATS = {
+    '.dot': 'dot',
+    '.gv': 'dot',
+    '.graphml': 'graphml',
+    '.json': 'json',
+}
+
+
+def analyze_file(path, analyzer=None):
+    """Lê e analisa um arquivo TONTO, avisando no stderr se houver erros"""
+    with open(path, 'r', encoding='utf-8') as file:
+        source = file.read()
+    analysis = (analyzer or TontoAnalyzer()).analyze(source)
+
+    total_errors = len(analysis['lex_errors']) + len(analysis['syn_errors'])
+    if total_errors:
+        print(f"Aviso: {path} tem {total_errors} erro(s); o resultado pode estar incompleto",
+              file=sys.stderr)
+    return analysis
+
+
+def open_output(path):
+    """Arquivo de saída em UTF-8, ou a saída padrão quando path é None ou '-'"""
+    if path in (None, '-'):
+        return sys.stdout
+    return open(path, 'w', encoding='utf-8', newline='\n')
+
+
+def _expand_paths(paths):
+    """Arquivos .tonto das pastas (recursivo) e os arquivos informados diretamente"""
+    expanded = []
+    for path in paths:
+        expanded.extend(find_tonto_files(path) if os.path.isdir(path) else [path])
+    return expanded
+
+
+def cmd_export(args):
+    fmt = args.format
+    if fmt is None:
+        extension = os.path.splitext(args.output or '')[1].lower()
+        fmt = EXTENSION_FORMATS.get(extension, 'dot')
+
+    analysis = analyze_file(args.file)
+    out = open_output(args.output)
+    try:
+        export_graph(analysis['summary'], out, fmt)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def cmd_diff(args):
+    analyzer = TontoAnalyzer()
+    old = analyze_file(args.old, analyzer)['summary']
+    new = analyze_file(args.new, analyzer)['summary']
+
+    result = diff(old, new)
+    out = open_output(args.output)
+    try:
+        json.dump(result, out, ensure_ascii=False, indent=args.indent)
+        out.write('\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def cmd_format(args):
+    paths = _expand_paths(args.paths)
+
+    if len(paths) == 1 or args.jobs == 1:
+        analyzer = TontoAnalyzer()
+        results = []
+        for path in paths:
+            try:
+                results.append((path, format_file(path, args.check, args.sort_enums, analyzer), None))
+            except (OSError, UnicodeDecodeError, FormatError) as e:
+                results.append((path, False, str(e)))
+    else:
+        results = format_files(paths, args.check, args.sort_enums, args.jobs)
+
+    changed = failed = 0
+    for path, was_changed, error in results:
+        if error is not None:
+            failed += 1
+            print(f"Erro: {path}: {error}", file=sys.stderr)
+        elif was_changed:
+            changed += 1
+            print(f"{'seria formatado' if args.check else 'formatado'}: {path}")
+
+    verb = "seriam formatados" if args.check else "formatados"
+    print(f"{len(paths)} arquivo(s): {changed} {verb}, {failed} com erro", file=sys.stderr)
+    if failed or (args.check and changed):
+        return 1
+    return 0
+
+
+def _without_spans(value):
+    """Cópia sem as chaves 'span', que só o driver das tabelas compactas preenche"""
+    if isinstance(value, dict):
+        return {key: _without_spans(item) for key, item in value.items() if key != 'span'}
+    if isinstance(value, (list, tuple)):
+        return [_without_spans(item) for item in value]
+    return value
+
+
+def cmd_bench(args):
+    """
+    Compara o driver das tabelas compactas com o driver genérico do PLY:
+    confere se árvore, erros e resumo são iguais e mede o tempo de cada um.
+    Com --transport, compara os retornos do pool (ver _bench_transport).
+    """
+    if args.transport:
+        return _bench_transport(args)
+
+    analyzer = TontoAnalyzer()
+    parser = analyzer.parser
+    different = 0
+    totals = {True: 0.0, False: 0.0}
+
+    for path in _expand_paths(args.paths):
+        with open(path, 'r', encoding='utf-8') as file:
+            tokens, _ = analyzer.lexer.tokenize(file.read())
+        tokens = list(tokens)
+
+        outputs = {}
+        times = {}
+        for use_ply in (True, False):
+            best = None
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                result, errors = parser.parse_tokens(tokens, use_ply=use_ply)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            outputs[use_ply] = _without_spans((result, errors, parser.get_analysis_summary()))
+            times[use_ply] = best
+            totals[use_ply] += best
+
+        same = outputs[True] == outputs[False]
+        different += not same
+        print(f"{path}: {len(tokens)} tokens, PLY {times[True] * 1000:.2f} ms, "
+              f"tabelas {times[False] * 1000:.2f} ms "
+              f"({times[True] / max(times[False], 1e-9):.2f}x)"
+              f"{'' if same else '  RESULTADOS DIFERENTES'}")
+
+    print(f"Total: PLY {totals[True] * 1000:.2f} ms, tabelas {totals[False] * 1000:.2f} ms, "
+          f"{different} arquivo(s) com resultados diferentes", file=sys.stderr)
+    return 1 if different else 0
+
+
+def _bench_transport(args):
+    """
+    Analisa os arquivos no pool da análise de pastas com resultados por
+    pickle e por memória compartilhada: confere se o resumo do projeto é o
+    mesmo e mede o tempo total e a CPU gasta no processo principal
+    (desserialização e montagem dos resultados).
+    """
+    import concurrent.futures  # noqa: F401 (importados fora da medição)
+    import multiprocessing.shared_memory  # noqa: F401
+    from .analise.workspace import WorkspaceAnalyzer, aggregate_results
+
+    paths = _expand_paths(args.paths)
+    reports = {}
+    for shared, label in ((False, 'pickle'), (True, 'memória compartilhada')):
+        workspace = WorkspaceAnalyzer(max_workers=args.jobs, shared_memory=shared)
+        start, cpu = time.perf_counter(), time.process_time()
+        workspace.analyze_folder(paths)
+        while workspace.messages.get()[1] != 'fim':
+            pass
+        reports[shared] = aggregate_results(workspace.results)
+        elapsed, cpu = time.perf_counter() - start, time.process_time() - cpu
+        workspace.shutdown(wait=True)
+        print(f"{label}: {len(paths)} arquivo(s) em {elapsed * 1000:.0f} ms, "
+              f"CPU do processo principal {cpu * 1000:.0f} ms")
+
+    same = reports[False] == reports[True]
+    if not same:
+        print("RESULTADOS DIFERENTES", file=sys.stderr)
+    return 0 if same else 1
+
+
+def cmd_conformance(args):
+    report = check_corpus(args.folder, update=args.update)
+    for name, status in report:
+        if status != 'ok':
+            print(f"{status}: {name}")
+
+    failed = sum(1 for _, status in report if status in ('diferente', 'novo'))
+    print(f"{len(report)} arquivo(s), {failed} sem conformidade", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def cmd_serve(args):
+    from .analise.server import AnalysisServer, AnalysisService
+
+    limits = {name: value for name, value in (('max_seconds', args.max_seconds),
+                                              ('max_tokens', args.max_tokens),
+                                              ('max_diagnostics', args.max_diagnostics))
+              if value is not None}
+    service = AnalysisService(max_workers=args.jobs, cache_entries=args.cache,
+                              limits=limits or None)
+    server = AnalysisServer((args.host, args.port), service, verbose=args.verbose)
+    host, port = server.server_address[:2]
+    print(f"Servindo em http://{host}:{port} ({service.max_workers} processo(s)); "
+          f"Ctrl+C para encerrar", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+def cmd_index(args):
+    from .analise.workspace_index import DEFAULT_INDEX, WorkspaceIndex
+
+    limits = {'max_seconds': args.max_seconds} if args.max_seconds else None
+    start = time.perf_counter()
+    with WorkspaceIndex(args.db or os.path.join(args.folder, DEFAULT_INDEX), limits) as index:
+        report = index.update(args.folder, max_workers=args.jobs)
+        stats = index.stats()
+    print(f"{report['indexados']} arquivo(s) indexado(s), {report['inalterados']} inalterado(s), "
+          f"{report['removidos']} removido(s) em {time.perf_counter() - start:.2f} s; "
+          f"{stats['declarations']} declarações, {stats['relations']} relações",
+          file=sys.stderr)
+    for path, message in report['falhas']:
+        print(f"{os.path.relpath(path)}: falha: {message}", file=sys.stderr)
+    return 0
+
+
+def _format_row(action, row):
+    """Linha de texto de um resultado de consulta do índice"""
+    if action == 'files':
+        status = row['failure'] or row['budget_exceeded'] and f"limite {row['budget_exceeded']}"
+        return (f"{os.path.relpath(row['path'])}  {row['errors']} erro(s)"
+                f"{f'  ({status})' if status else ''}")
+    where = f"{os.path.relpath(row['path'])}:{row['line']}" if 'path' in row else ''
+    if action == 'usages':
+        return f"{where}  {row['kind']}  {row['context']}"
+    if action == 'find':
+        kind = ' '.join(part for part in (row['kind'], row['stereotype']) if part)
+        return f"{where}  {kind} {row['name']}  (pacote {row['package']})"
+    if action == 'relations':
+        parts = [row['source']]
+        if row['stereotype']:
+            parts.append('@' + row['stereotype'])
+        if row['name']:
+            parts.append(row['name'])
+        return (f"{where}  {' '.join(parts)} -> {row['target']}"
+                f"{'' if row['internal'] else '  (externa)'}")
+    if action in ('subclasses', 'superclasses'):
+        via = f"  (genset {row['genset']})" if row['genset'] else ''
+        return f"{where}  {row['child']} specializes {row['parent']}{via}"
+    if action == 'relators':
+        return f"{where}  {row['name']} media {', '.join(row['mediated']) or '(nada)'}"
+    return '  '.join(f"{key}={value}" for key, value in row.items())
+
+
+def cmd_query(args):
+    from .analise.workspace_index import DEFAULT_INDEX, WorkspaceIndex
+
+    db = args.db or os.path.join(args.folder, DEFAULT_INDEX)
+    if not os.path.exists(db):
+        print(f"Erro: índice {db} não encontrado; crie com 'index {args.folder}'",
+              file=sys.stderr)
+        return 1
+    if args.action in ('usages', 'find', 'subclasses', 'superclasses') and not args.name:
+        print(f"Erro: '{args.action}' precisa de um nome", file=sys.stderr)
+        return 1
+
+    with WorkspaceIndex(db) as index:
+        start = time.perf_counter()
+        if args.action == 'usages':
+            rows = index.usages(args.name)
+        elif args.action == 'find':
+            rows = index.declarations(name=args.name, kind=args.kind, stereotype=args.stereotype)
+        elif args.action == 'relations':
+            rows = index.relations(stereotype=args.stereotype, source=args.source,
+                                   target=args.target, name=args.name)
+        elif args.action == 'subclasses':
+            rows = index.subclasses(args.name, transitive=args.all)
+        elif args.action == 'superclasses':
+            rows = index.superclasses(args.name, transitive=args.all)
+        elif args.action == 'relators':
+            rows = index.mediations()
+        elif args.action == 'files':
+            rows = index.files()
+        else:
+            rows = [index.stats()]
+        elapsed = time.perf_counter() - start
+
+    if args.json:
+        json.dump(rows, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+    else:
+        for row in rows:
+            print(_format_row(args.action, row))
+    print(f"{len(rows)} resultado(s) em {elapsed * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="python -m src.cli",
+                                     description="Analisador TONTO - linha de comando")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export = subparsers.add_parser('export',
+                                   help="Exporta classes e relações como grafo")
+    export.add_argument('file', help="Arquivo .tonto")
+    export.add_argument('-f', '--format', choices=EXPORT_FORMATS,
+                        help="Formato de saída (padrão: pela extensão de -o, ou dot)")
+    export.add_argument('-o', '--output', help="Arquivo de saída (padrão: saída padrão)")
+    export.set_defaults(func=cmd_export)
+
+    diff_parser = subparsers.add_parser('diff',
+                                        help="Diferença estrutural entre duas versões (JSON)")
+    diff_parser.add_argument('old', help="Versão antiga (.tonto)")
+    diff_parser.add_argument('new', help="Versão nova (.tonto)")
+    diff_parser.add_argument('-o', '--output', help="Arquivo JSON de saída (padrão: saída padrão)")
+    diff_parser.add_argument('--indent', type=int, default=2,
+                             help="Indentação do JSON (padrão: 2)")
+    diff_parser.set_defaults(func=cmd_diff)
+
+    format_parser = subparsers.add_parser('format',
+                                          help="Formata arquivos .tonto no estilo canônico")
+    format_parser.add_argument('paths', nargs='+', help="Arquivos .tonto ou pastas")
+    format_parser.add_argument('--check', action='store_true',
+                               help="Apenas verifica; sai com código 1 se algum arquivo mudaria")
+    format_parser.add_argument('--sort-enums', action='store_true',
+                               help="Ordena as instâncias das classes enumeradas")
+    format_parser.add_argument('-j', '--jobs', type=int, default=None,
+                               help="Processos em paralelo (padrão: número de CPUs)")
+    format_parser.set_defaults(func=cmd_format)
+
+    bench = subparsers.add_parser('bench',
+                                  help="Compara e mede o driver LR próprio e o do PLY")
+    bench.add_argument('paths', nargs='+', help="Arquivos .tonto ou pastas")
+    bench.add_argument('--repeat', type=int, default=5,
+                       help="Execuções por arquivo; vale o menor tempo (padrão: 5)")
+    bench.add_argument('--transport', action='store_true',
+                       help="Compara o retorno dos resultados do pool: pickle x memória "
+                            "compartilhada")
+    bench.add_argument('-j', '--jobs', type=int,
+                       help="Processos do pool com --transport (padrão: número de CPUs)")
+    bench.set_defaults(func=cmd_bench)
+
+    conformance = subparsers.add_parser('conformance',
+                                        help="Confere o parser com o corpus de conformidade")
+    conformance.add_argument('folder', nargs='?', default='conformidade',
+                             help="Pasta do corpus (padrão: conformidade)")
+    conformance.add_argument('--update', action='store_true',
+                             help="Regrava os resultados esperados com os atuais")
+    conformance.set_defaults(func=cmd_conformance)
+
+    serve = subparsers.add_parser('serve',
+                                  help="Serviço HTTP local de análise (JSON)")
+    serve.add_argument('--host', default='127.0.0.1',
+                       help="Endereço (padrão: 127.0.0.1)")
+    serve.add_argument('--port', type=int, default=8765,
+                       help="Porta; 0 escolhe uma livre (padrão: 8765)")
+    serve.add_argument('-j', '--jobs', type=int, default=None,
+                       help="Processos de análise (padrão: número de CPUs)")
+    serve.add_argument('--cache', type=int, default=1024,
+                       help="Resultados mantidos no cache LRU (padrão: 1024)")
+    serve.add_argument('--max-seconds', type=float, default=None,
+                       help="Tempo máximo de cada análise; depois dele o resultado é parcial")
+    serve.add_argument('--max-tokens', type=int, default=None,
+                       help="Número máximo de tokens analisados por arquivo")
+    serve.add_argument('--max-diagnostics', type=int, default=None,
+                       help="Número máximo de erros reportados por arquivo")
+    serve.add_argument('-v', '--verbose', action='store_true',
+                       help="Registra cada requisição no stderr")
+    serve.set_defaults(func=cmd_serve)
+
+    index = subparsers.add_parser('index',
+                                  help="Cria ou atualiza o índice SQLite de uma pasta")
+    index.add_argument('folder', help="Pasta com arquivos .tonto")
+    index.add_argument('--db', help="Arquivo do índice (padrão: PASTA/.tonto-index.sqlite)")
+    index.add_argument('-j', '--jobs', type=int, default=None,
+                       help="Processos em paralelo (padrão: número de CPUs)")
+    index.add_argument('--max-seconds', type=float, default=30.0,
+                       help="Tempo máximo da análise de cada arquivo (padrão: 30)")
+    index.set_defaults(func=cmd_index)
+
+    query = subparsers.add_parser('query', help="Consulta o índice SQLite de uma pasta")
+    query.add_argument('action', choices=('usages', 'find', 'relations', 'subclasses',
+                                          'superclasses', 'relators', 'files', 'stats'),
+                       help="Tipo de consulta")
+    query.add_argument('name', nargs='?', help="Nome consultado")
+    query.add_argument('-C', '--folder', default='.',
+                       help="Pasta indexada (padrão: a pasta atual)")
+    query.add_argument('--db', help="Arquivo do índice (padrão: PASTA/.tonto-index.sqlite)")
+    query.add_argument('--kind', help="find: package, class, datatype, enum ou genset")
+    query.add_argument('--stereotype', help="find / relations: estereótipo")
+    query.add_argument('--source', help="relations: classe de origem")
+    query.add_argument('--target', help="relations: classe de destino")
+    query.add_argument('--all', action='store_true',
+                       help="subclasses / superclasses: toda a hierarquia, não só a direta")
+    query.add_argument('--json', action='store_true', help="Resultados em JSON")
+    query.set_defaults(func=cmd_query)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except OSError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Realce de sintaxe do editor de código TONTO
+Colore apenas as linhas visíveis (e uma margem ao redor) usando as
+categorias de token do analisador léxico
+"""
+import re
+
+from ..lexico.lexico import TontoLexer, TOKEN_CATEGORIES
+from ..lexico.names import NameTable
+
+
+# Tag do Tk -> cor do texto
+HIGHLIGHT_TAGS = {
+    'hl_class_stereotype': {'foreground': '#7b1fa2', 'font': ('Courier New', 10, 'bold')},
+    'hl_relation_stereotype': {'foreground': '#c2185b', 'font': ('Courier New', 10, 'bold')},
+    'hl_reserved': {'foreground': '#1565c0', 'font': ('Courier New', 10, 'bold')},
+    'hl_type': {'foreground': '#00838f'},
+    'hl_name': {'foreground': '#2e7d32'},
+    'hl_cardinality': {'foreground': '#ef6c00'},
+    'hl_comment': {'foreground': '#9e9e9e'},
+    'hl_error': {'foreground': '#d32f2f', 'underline': True, 'background': '#ffebee'},
+}
+
+# Categoria do léxico -> tag de realce
+CATEGORY_TAGS = {
+    "Estereótipo de Classe": 'hl_class_stereotype',
+    "Estereótipo de Relação": 'hl_relation_stereotype',
+    "Palavra Reservada": 'hl_reserved',
+    "Meta-atributo": 'hl_reserved',
+    "Tipo de Dado Nativo": 'hl_type',
+    "Tipo de Dado Customizado": 'hl_type',
+    "Nome de Classe": 'hl_name',
+    "Nome de Relação": 'hl_name',
+    "Nome de Instância": 'hl_name',
+    "Literal Numérico": 'hl_cardinality',
+    "Erro": 'hl_error',
+}
+
+# Símbolos que só aparecem em cardinalidades
+CARDINALITY_TOKENS = {'LBRACKET', 'RBRACKET', 'DOTDOT', 'ASTERISK'}
+
+# O léxico descarta comentários, então eles são localizados à parte
+COMMENT = re.compile(r'#.*')
+
+
+def _build_token_tags():
+    """Pré-calcula tipo de token -> tag de realce"""
+    token_tags = {}
+    for token_type, (categoria, _) in TOKEN_CATEGORIES.items():
+        tag = CATEGORY_TAGS.get(categoria)
+        if tag:
+            token_tags[token_type] = tag
+    for token_type in CARDINALITY_TOKENS:
+        token_tags[token_type] = 'hl_cardinality'
+    return token_tags
+
+
+TOKEN_TAGS = _build_token_tags()
+
+
+class SyntaxHighlighter:
+    """
+    Realce sob demanda de um widget Text.
+
+    Tokens TONTO nunca atravessam quebras de linha, então cada faixa de
+    linhas pode ser lexada isoladamente. O realce guarda quais linhas já
+    estão coloridas e, ao rolar, só processa as que entraram na área visível.
+    Uma edição invalida o estado e recolore apenas a área visível.
+    """
+
+    # Linhas extras realçadas acima e abaixo da área visível
+    MARGIN_LINES = 40
+    # Atraso (ms) para agrupar eventos de rolagem/edição em um só realce
+    DELAY_MS = 30
+
+    def __init__(self, text_widget, scrollbar=None):
+        self.text = text_widget
+        self.scrollbar = scrollbar
+        self._clean_lines = set()
+        self._after_id = None
+
+        # Léxico exclusivo do realce (independente da análise em segundo plano),
+        # construído no primeiro realce, depois que a janela já apareceu
+        self._lexer = None
+
+        for tag, options in HIGHLIGHT_TAGS.items():
+            self.text.tag_configure(tag, **options)
+        self.text.tag_raise('hl_error')
+
+        # Rolagem: interceptar o yscrollcommand para saber quando a vista muda
+        self.text.configure(yscrollcommand=self._on_yscroll)
+        self.text.bind('<Configure>', lambda e: self.schedule(), add='+')
+
+    @property
+    def lexer(self):
+        if self._lexer is None:
+            lexer = TontoLexer()
+            # Os tokens do realce são descartados: nada de internar os nomes
+            # (nem os parciais, digitados a cada tecla) na tabela do processo
+            lexer.names = NameTable(max_names=0)
+            lexer.build()
+            self._lexer = lexer
+        return self._lexer
+
+    def invalidate(self):
+        """Marca todas as linhas como pendentes (chamado a cada edição)"""
+        self._clean_lines.clear()
+        self.schedule()
+
+    def schedule(self):
+        """Agenda um realce da área visível"""
+        if self._after_id is None:
+            self._after_id = self.text.after(self.DELAY_MS, self.highlight_visible)
+
+    def _on_yscroll(self, first, last):
+        if self.scrollbar is not None:
+            self.scrollbar.set(first, last)
+        self.schedule()
+
+    def highlight_visible(self):
+        """Realça as linhas pendentes dentro (e perto) da área visível"""
+        self._after_id = None
+
+        first = int(self.text.index('@0,0').split('.')[0])
+        last = int(self.text.index(f'@0,{self.text.winfo_height()}').split('.')[0])
+        total = int(self.text.index('end-1c').split('.')[0])
+
+        first = max(1, first - self.MARGIN_LINES)
+        last = min(total, last + self.MARGIN_LINES)
+
+        # Agrupar linhas pendentes em faixas contíguas
+        run_start = None
+        for line in range(first, last + 2):
+            pending = line <= last and line not in self._clean_lines
+            if pending and run_start is None:
+                run_start = line
+            elif not pending and run_start is not None:
+                self._highlight_lines(run_start, line - 1)
+                run_start = None
+
+    def _highlight_lines(self, first, last):
+        """Recolore as linhas first..last (inclusive)"""
+        start, end = f"{first}.0", f"{last}.end"
+        source = self.text.get(start, end)
+
+        for tag in HIGHLIGHT_TAGS:
+            self.text.tag_remove(tag, start, end)
+
+        # Offset de início de cada linha dentro do trecho
+        line_starts = [0]
+        line_starts.extend(match.end() for match in re.finditer('\n', source))
+
+        ranges = {tag: [] for tag in HIGHLIGHT_TAGS}
+
+        def add_range(tag, begin, finish, line):
+            column = begin - line_starts[line - first]
+            ranges[tag].append(f"{line}.{column}")
+            ranges[tag].append(f"{line}.{column + finish - begin}")
+
+        lexer = self.lexer.lexer
+        self.lexer.errors = []
+        self.lexer.comments = []
+        lexer.lineno = first
+        lexer.input(source)
+
+        while True:
+            tok = lexer.token()
+            if tok is None:
+                break
+            tag = TOKEN_TAGS.get(tok.type)
+            if tag:
+                # Após token(), lexpos aponta para o fim do token
+                add_range(tag, tok.lexpos, lexer.lexpos, tok.lineno)
+
+        for error in self.lexer.errors:
+            add_range('hl_error', error.lexpos, error.lexpos + 1, error.lineno)
+
+        for index, line_start in enumerate(line_starts):
+            line_end = source.find('\n', line_start)
+            match = COMMENT.search(source, line_start, len(source) if line_end < 0 else line_end)
+            if match:
+                add_range('hl_comment', match.start(), match.end(), first + index)
+
+        for tag, indexes in ranges.items():
+            if indexes:
+                self.text.tag_add(tag, *indexes)
+
+        self._clean_lines.update(range(first, last + 1))
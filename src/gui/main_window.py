@@ -2,50 +2,23 @@
 Interface gráfica principal do analisador TONTO
 Integra análise léxica e sintática
 """
+import codecs
+import os
+import queue
+import time
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
-from ..lexico.lexico import TontoLexer
-from ..sintatico.parser import TontoParser
-
-
-class ToolTip:
-    """
-    Classe para criar tooltips (balõezinhos) que aparecem ao passar o mouse
-    """
-    def __init__(self, widget):
-        self.widget = widget
-        self.tip_window = None
-        self.text = ""
-
-    def show_tip(self, text, x, y):
-        """Mostra o tooltip"""
-        if self.tip_window or not text:
-            return
-
-        self.text = text
-        # Posicionar o tooltip próximo ao mouse
-        x = x + 20
-        y = y + 10
-
-        self.tip_window = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-
-        # Criar frame com borda
-        frame = tk.Frame(tw, background="#ffffe0", relief=tk.SOLID, borderwidth=1)
-        frame.pack()
-
-        # Adicionar texto com quebra de linha
-        label = tk.Label(frame, text=text, justify=tk.LEFT,
-                        background="#ffffe0", relief=tk.FLAT,
-                        font=("Arial", 9), wraplength=400, padx=8, pady=6)
-        label.pack()
-
-    def hide_tip(self):
-        """Esconde o tooltip"""
-        if self.tip_window:
-            self.tip_window.destroy()
-            self.tip_window = None
+from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
+from ..analise.indexes import LineIndex
+from ..analise.mapped_file import MappedFile
+from ..analise.workspace import WorkspaceAnalyzer, aggregate_results, find_tonto_files
+from ..lexico.lexico import TontoLexer, lexical_error
+from .highlighter import SyntaxHighlighter
+from .project_panel import ProjectPanel
+from .summary_tree import LazySummaryTree
+from .tooltip import TreeviewTooltip
+from .tree_sync import sync_tree_rows
+from .virtual_table import VirtualTable
+from .worker import AnalysisWorker
 
 
 class TontoAnalyzerGUI:
@@ -54,17 +27,67 @@ class TontoAnalyzerGUI:
     def __init__(self, root):
         self.root = root
 
-        # Inicializar analisadores
+        # Léxico usado apenas para formatar tokens na tela; a análise em si
+        # roda na thread do AnalysisWorker, com léxico e parser próprios
         self.lexer = TontoLexer()
-        self.lexer.build()
-
-        self.parser = TontoParser(self.lexer)
-        self.parser.build(debug=False, write_tables=False)
+        self.worker = AnalysisWorker()
+
+        # Estado da análise em andamento
+        self.current_job = 0
+        self._batch_job = None
+        self._busy = False
+        self._polling = False
+
+        # Modo ao vivo: análise incremental após um intervalo sem edições
+        self.live_mode = tk.BooleanVar(value=False)
+        self.live_delay_ms = 600
+        self._live_after_id = None
+
+        # Linhas exibidas no relatório de erros: chave -> (iid, valores)
+        self._error_view_rows = {}
+
+        # Tokens da última análise (fonte de dados da tabela virtual)
+        self.tokens = []
+
+        # Índices dos filtros, montados uma vez por análise
+        self.token_index = None
+        self.declaration_trie = None
+        self.error_index = None
+        self._all_error_rows = []
+
+        # Carregamento em blocos de arquivos comuns
+        self._load_generation = 0
+        self._load_file = None
+
+        # Modo arquivo grande: o editor mostra só uma janela de linhas
+        # do arquivo mapeado, e a análise lê direto do disco
+        self.large_file_path = None
+        self.mapped_file = None
+        self.window_first_line = 1
+        self._project_total = 0
+
+        # Modo pasta: painel lateral, aba de projeto e pool de análise
+        # (criados na primeira vez que uma pasta é aberta)
+        self.workspace = None
+        self.project_panel = None
+        self.tab_project = None
+        self._workspace_polling = False
+        self._workspace_report_after_id = None
+        self._project_error_rows = {}
+        self._project_error_targets = {}
 
         self._setup_window()
         self._create_notebook()
         self._create_menu()
 
+        # Léxico e parser são aquecidos em segundo plano só depois que a
+        # janela aparece (uma análise pedida antes disso também inicia o worker)
+        self.root.bind('<Map>', self._on_first_map, add='+')
+
+    def _on_first_map(self, event):
+        if event.widget is self.root:
+            self.worker.start()
+
     def _setup_window(self):
         """Configurações da janela principal"""
         self.root.title("Analisador TONTO - Léxico e Sintático")
@@ -75,9 +98,13 @@ class TontoAnalyzerGUI:
 
     def _create_notebook(self):
         """Cria abas para diferentes visualizações"""
+        # Painel dividido: projeto (modo pasta) à esquerda, editor e abas à direita
+        self.paned = ttk.PanedWindow(self.root, orient=tk.HORIZONTAL)
+        self.paned.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
         # Frame principal
-        main_frame = tk.Frame(self.root, bg="white")
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        main_frame = tk.Frame(self.paned, bg="white")
+        self.paned.add(main_frame, weight=1)
 
         # Área de código fonte (topo)
         code_frame = tk.LabelFrame(main_frame, text="Código Fonte TONTO",
@@ -88,6 +115,23 @@ class TontoAnalyzerGUI:
         self.code_text = scrolledtext.ScrolledText(code_frame, font=('Courier New', 10),
                                                    height=12, wrap=tk.WORD)
         self.code_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.code_text.bind('<<Modified>>', self._on_code_modified)
+        self.code_text.tag_configure('current_line', background='#FFF59D')
+
+        # Barra do modo arquivo grande (exibida apenas nesse modo)
+        self.large_file_frame = tk.Frame(code_frame, bg="#FFF8E1")
+        self.large_file_label = tk.Label(self.large_file_frame, text="", bg="#FFF8E1",
+                                         fg="#333", font=('Arial', 9))
+        self.large_file_label.pack(side=tk.LEFT, padx=5)
+        tk.Button(self.large_file_frame, text="Próximas ▶", font=('Arial', 9),
+                 command=lambda: self._shift_file_window(1),
+                 relief=tk.RAISED, bd=1, padx=8).pack(side=tk.RIGHT, padx=2, pady=2)
+        tk.Button(self.large_file_frame, text="◀ Anteriores", font=('Arial', 9),
+                 command=lambda: self._shift_file_window(-1),
+                 relief=tk.RAISED, bd=1, padx=8).pack(side=tk.RIGHT, padx=2, pady=2)
+
+        # Realce de sintaxe restrito à área visível do editor
+        self.highlighter = SyntaxHighlighter(self.code_text, self.code_text.vbar)
 
         # Botões de ação
         button_frame = tk.Frame(main_frame, bg="white")
@@ -97,9 +141,24 @@ class TontoAnalyzerGUI:
                  font=('Arial', 10, 'bold'), command=self.clear_all,
                  relief=tk.RAISED, bd=2, padx=20, pady=5).pack(side=tk.RIGHT, padx=5)
 
-        tk.Button(button_frame, text="Analisar", bg="#D4EDDA", fg="black",
-                 font=('Arial', 10, 'bold'), command=self.analyze_code,
-                 relief=tk.RAISED, bd=2, padx=20, pady=5).pack(side=tk.RIGHT, padx=5)
+        self.cancel_button = tk.Button(button_frame, text="Cancelar", bg="#FFF3CD", fg="black",
+                                      font=('Arial', 10, 'bold'), command=self.cancel_analysis,
+                                      relief=tk.RAISED, bd=2, padx=20, pady=5,
+                                      state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.RIGHT, padx=5)
+
+        self.analyze_button = tk.Button(button_frame, text="Analisar", bg="#D4EDDA", fg="black",
+                                       font=('Arial', 10, 'bold'), command=self.analyze_code,
+                                       relief=tk.RAISED, bd=2, padx=20, pady=5)
+        self.analyze_button.pack(side=tk.RIGHT, padx=5)
+
+        # Progresso da análise em segundo plano
+        self.progress_bar = ttk.Progressbar(button_frame, mode='determinate',
+                                            maximum=1.0, length=250)
+        self.progress_bar.pack(side=tk.LEFT, padx=5)
+        self.status_label = tk.Label(button_frame, text="", bg="white", fg="#666",
+                                     font=('Arial', 9))
+        self.status_label.pack(side=tk.LEFT, padx=5)
 
         # Notebook para abas
         self.notebook = ttk.Notebook(main_frame)
@@ -127,31 +186,63 @@ class TontoAnalyzerGUI:
                                      font=('Arial', 10, 'bold'), bg="white")
         frame_tokens.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-        columns = ('linha', 'coluna', 'token', 'lexema', 'categoria')
-        self.lexical_tree = ttk.Treeview(frame_tokens, columns=columns,
-                                        show='headings', height=10)
-
-        self.lexical_tree.heading("linha", text='Linha')
-        self.lexical_tree.heading("coluna", text='Coluna')
-        self.lexical_tree.heading("token", text='Token')
-        self.lexical_tree.heading("lexema", text='Lexema')
-        self.lexical_tree.heading("categoria", text='Categoria')
-
-        self.lexical_tree.column("linha", width=60)
-        self.lexical_tree.column("coluna", width=60)
-        self.lexical_tree.column("token", width=150)
-        self.lexical_tree.column("lexema", width=150)
-        self.lexical_tree.column("categoria", width=200)
+        # Navegação: ir para a primeira linha de token de uma linha do código
+        goto_frame = tk.Frame(frame_tokens, bg="white")
+        goto_frame.pack(fill=tk.X, padx=5, pady=(5, 0))
+
+        tk.Label(goto_frame, text="Ir para linha do código:", bg="white",
+                font=('Arial', 9)).pack(side=tk.LEFT)
+        self.goto_line_entry = tk.Entry(goto_frame, width=8, font=('Arial', 9))
+        self.goto_line_entry.pack(side=tk.LEFT, padx=5)
+        self.goto_line_entry.bind('<Return>', lambda e: self._goto_token_line())
+        tk.Button(goto_frame, text="Ir", font=('Arial', 9), command=self._goto_token_line,
+                 relief=tk.RAISED, bd=1, padx=8).pack(side=tk.LEFT)
+
+        # Filtro por tipo e/ou valor (índice invertido dos tokens)
+        self.token_filter_label = tk.Label(goto_frame, text="", bg="white", fg="#666",
+                                           font=('Arial', 9))
+        self.token_filter_label.pack(side=tk.RIGHT, padx=5)
+        tk.Button(goto_frame, text="Limpar", font=('Arial', 9), command=self._clear_token_filter,
+                 relief=tk.RAISED, bd=1, padx=8).pack(side=tk.RIGHT)
+        tk.Button(goto_frame, text="Filtrar", font=('Arial', 9), command=self._apply_token_filter,
+                 relief=tk.RAISED, bd=1, padx=8).pack(side=tk.RIGHT, padx=5)
+        self.token_value_filter = tk.Entry(goto_frame, width=16, font=('Arial', 9))
+        self.token_value_filter.pack(side=tk.RIGHT)
+        self.token_value_filter.bind('<Return>', lambda e: self._apply_token_filter())
+        tk.Label(goto_frame, text="Valor:", bg="white",
+                font=('Arial', 9)).pack(side=tk.RIGHT, padx=(10, 5))
+        self.token_type_filter = ttk.Combobox(goto_frame, width=22, font=('Arial', 9))
+        self.token_type_filter.pack(side=tk.RIGHT)
+        self.token_type_filter.bind('<<ComboboxSelected>>', lambda e: self._apply_token_filter())
+        self.token_type_filter.bind('<Return>', lambda e: self._apply_token_filter())
+        tk.Label(goto_frame, text="Tipo:", bg="white",
+                font=('Arial', 9)).pack(side=tk.RIGHT, padx=5)
+
+        # Tabela virtual: apenas as linhas visíveis viram itens do Treeview
+        columns = [('linha', 'Linha', 60),
+                   ('coluna', 'Coluna', 60),
+                   ('token', 'Token', 150),
+                   ('lexema', 'Lexema', 150),
+                   ('categoria', 'Categoria', 200)]
+        sort_keys = {
+            'linha': lambda tok: (tok.lineno, tok.lexpos),
+            'coluna': lambda tok: tok.lexpos,
+            'token': lambda tok: tok.type,
+            'lexema': lambda tok: str(tok.value),
+            'categoria': lambda tok: self.lexer.get_token_category(tok.type),
+        }
+        self.lexical_tree = VirtualTable(frame_tokens, columns, self._format_token_row,
+                                         sort_keys=sort_keys)
 
         self.lexical_tree.tag_configure('erro', background='#ffcccc')
         self.lexical_tree.tag_configure('ok', background='#e6ffe6')
 
-        scroll_lex = ttk.Scrollbar(frame_tokens, orient=tk.VERTICAL,
-                                  command=self.lexical_tree.yview)
-        self.lexical_tree.configure(yscrollcommand=scroll_lex.set)
+        self.lexical_tree.pack(fill=tk.BOTH, expand=True)
 
-        self.lexical_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5,0), pady=5)
-        scroll_lex.pack(side=tk.RIGHT, fill=tk.Y, pady=5, padx=(0,5))
+        # Tooltip: os itens da tabela virtual são reaproveitados, então o
+        # texto vem sempre da própria tabela
+        self.lexical_tooltip = TreeviewTooltip(self.lexical_tree.tree,
+                                               row_values=self.lexical_tree.values_for_item)
 
         # Resumo léxico
         frame_summary_lex = tk.LabelFrame(self.tab_lexical, text="Resumo da Análise Léxica",
@@ -170,6 +261,22 @@ class TontoAnalyzerGUI:
                                  font=('Arial', 10, 'bold'), bg="white")
         frame_syn.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
+        # Busca por prefixo do nome (trie das declarações)
+        search_frame = tk.Frame(frame_syn, bg="white")
+        search_frame.pack(fill=tk.X, padx=5, pady=(5, 0))
+
+        tk.Label(search_frame, text="Buscar declaração:", bg="white",
+                font=('Arial', 9)).pack(side=tk.LEFT)
+        self.declaration_filter = tk.Entry(search_frame, width=30, font=('Arial', 9))
+        self.declaration_filter.pack(side=tk.LEFT, padx=5)
+        self.declaration_filter.bind('<KeyRelease>', lambda e: self._apply_declaration_filter())
+        tk.Button(search_frame, text="Limpar", font=('Arial', 9),
+                 command=self._clear_declaration_filter,
+                 relief=tk.RAISED, bd=1, padx=8).pack(side=tk.LEFT)
+        self.declaration_filter_label = tk.Label(search_frame, text="", bg="white", fg="#666",
+                                                 font=('Arial', 9))
+        self.declaration_filter_label.pack(side=tk.LEFT, padx=5)
+
         columns = ('construto', 'quantidade', 'detalhes')
         self.syntactic_tree = ttk.Treeview(frame_syn, columns=columns,
                                           show='tree headings', height=15)
@@ -188,6 +295,10 @@ class TontoAnalyzerGUI:
                                   command=self.syntactic_tree.yview)
         self.syntactic_tree.configure(yscrollcommand=scroll_syn.set)
 
+        # Nós criados fechados e preenchidos ao expandir
+        self.summary_tree = LazySummaryTree(self.syntactic_tree)
+        self.syntactic_tooltip = TreeviewTooltip(self.syntactic_tree)
+
         self.syntactic_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5,0), pady=5)
         scroll_syn.pack(side=tk.RIGHT, fill=tk.Y, pady=5, padx=(0,5))
 
@@ -206,6 +317,38 @@ class TontoAnalyzerGUI:
                 text="💡 Dica: Passe o mouse sobre uma célula para ver o texto completo | Duplo-clique para abrir detalhes",
                 bg="white", fg="#666", font=('Arial', 9, 'italic')).pack(anchor=tk.W)
 
+        # Filtro por faixa de linhas e tipo (erros ordenados por linha)
+        filter_frame = tk.Frame(frame_err, bg="white")
+        filter_frame.pack(fill=tk.X, padx=5, pady=(5, 0))
+
+        tk.Label(filter_frame, text="Linhas de", bg="white",
+                font=('Arial', 9)).pack(side=tk.LEFT)
+        self.error_first_line = tk.Entry(filter_frame, width=8, font=('Arial', 9))
+        self.error_first_line.pack(side=tk.LEFT, padx=5)
+        tk.Label(filter_frame, text="até", bg="white",
+                font=('Arial', 9)).pack(side=tk.LEFT)
+        self.error_last_line = tk.Entry(filter_frame, width=8, font=('Arial', 9))
+        self.error_last_line.pack(side=tk.LEFT, padx=5)
+        tk.Label(filter_frame, text="Tipo:", bg="white",
+                font=('Arial', 9)).pack(side=tk.LEFT, padx=(10, 5))
+        self.error_kind_filter = ttk.Combobox(filter_frame, width=12, state='readonly',
+                                              values=tuple(self.ERROR_KIND_FILTERS),
+                                              font=('Arial', 9))
+        self.error_kind_filter.set('Todos')
+        self.error_kind_filter.pack(side=tk.LEFT)
+        self.error_kind_filter.bind('<<ComboboxSelected>>', lambda e: self._apply_error_filter())
+        for entry in (self.error_first_line, self.error_last_line):
+            entry.bind('<Return>', lambda e: self._apply_error_filter())
+        tk.Button(filter_frame, text="Filtrar", font=('Arial', 9),
+                 command=self._apply_error_filter,
+                 relief=tk.RAISED, bd=1, padx=8).pack(side=tk.LEFT, padx=5)
+        tk.Button(filter_frame, text="Limpar", font=('Arial', 9),
+                 command=self._clear_error_filter,
+                 relief=tk.RAISED, bd=1, padx=8).pack(side=tk.LEFT)
+        self.error_filter_label = tk.Label(filter_frame, text="", bg="white", fg="#666",
+                                           font=('Arial', 9))
+        self.error_filter_label.pack(side=tk.LEFT, padx=5)
+
         columns = ('linha', 'tipo', 'mensagem', 'sugestao')
         self.errors_tree = ttk.Treeview(frame_err, columns=columns,
                                        show='headings', height=20)
@@ -234,51 +377,49 @@ class TontoAnalyzerGUI:
         # ADICIONAR FUNCIONALIDADES DE VISUALIZAÇÃO
         # ====================================================================
 
-        # Tooltip para quando passar o mouse
-        self.error_tooltip = ToolTip(self.errors_tree)
+        # Tooltip com o texto completo da célula sob o mouse
+        self.error_tooltip = TreeviewTooltip(self.errors_tree)
 
-        # Evento: Mostrar tooltip ao passar o mouse
-        self.errors_tree.bind('<Motion>', self._show_error_tooltip)
-        # Evento: Esconder tooltip ao sair
-        self.errors_tree.bind('<Leave>', lambda e: self.error_tooltip.hide_tip())
         # Evento: Abrir janela de detalhes ao dar duplo-clique
         self.errors_tree.bind('<Double-Button-1>', self._show_error_details)
 
-    def _show_error_tooltip(self, event):
-        """Mostra tooltip com o texto completo ao passar o mouse"""
-        # Identificar a região clicada
-        region = self.errors_tree.identify_region(event.x, event.y)
-
-        if region == "cell":
-            # Identificar a coluna
-            column = self.errors_tree.identify_column(event.x)
-            # Identificar o item (linha)
-            item = self.errors_tree.identify_row(event.y)
-
-            if item:
-                # Pegar valores da linha
-                values = self.errors_tree.item(item, 'values')
-
-                # Mapear coluna para índice
-                col_map = {'#1': 0, '#2': 1, '#3': 2, '#4': 3}
-                col_idx = col_map.get(column)
-
-                if col_idx is not None and col_idx < len(values):
-                    text = str(values[col_idx])
-
-                    # Mostrar tooltip apenas se o texto for longo
-                    if len(text) > 40:
-                        self.error_tooltip.hide_tip()
-                        x, y = event.x_root, event.y_root
-                        self.error_tooltip.show_tip(text, x, y)
-                    else:
-                        self.error_tooltip.hide_tip()
-                else:
-                    self.error_tooltip.hide_tip()
-            else:
-                self.error_tooltip.hide_tip()
-        else:
-            self.error_tooltip.hide_tip()
+        # Evento: Selecionar um erro destaca a linha correspondente no editor
+        self.errors_tree.bind('<<TreeviewSelect>>', self._on_error_selected)
+
+    def _on_error_selected(self, event):
+        """Leva o editor até a linha do erro selecionado"""
+        selection = self.errors_tree.selection()
+        if not selection:
+            return
+        values = self.errors_tree.item(selection[0], 'values')
+        try:
+            line = int(values[0])
+        except (IndexError, ValueError):
+            return
+        self.goto_source_line(line)
+
+    def goto_source_line(self, line):
+        """
+        Rola o editor até uma linha do código e a destaca.
+        No modo arquivo grande, carrega a janela que contém a linha.
+        """
+        if line < 1:
+            return  # Erros sem posição (ex.: fim de arquivo inesperado)
+
+        if self.mapped_file is not None:
+            last_line = self.window_first_line + self.LARGE_FILE_WINDOW - 1
+            if not self.window_first_line <= line <= last_line:
+                # Deixar algumas linhas de contexto acima da linha alvo
+                self._show_file_window(line - self.LARGE_FILE_WINDOW // 4)
+            line = line - self.window_first_line + 1
+        elif self.large_file_path is not None:
+            return  # Arquivo grande ainda sendo mapeado
+
+        index = f"{line}.0"
+        self.code_text.tag_remove('current_line', 1.0, tk.END)
+        self.code_text.tag_add('current_line', index, f"{index} lineend +1c")
+        self.code_text.mark_set(tk.INSERT, index)
+        self.code_text.see(index)
 
     def _show_error_details(self, event):
         """Abre janela com detalhes completos do erro ao dar duplo-clique"""
@@ -367,6 +508,8 @@ class TontoAnalyzerGUI:
         menubar.add_cascade(label="Arquivo", menu=file_menu)
         file_menu.add_command(label="Abrir Arquivo...", command=self.open_file,
                              accelerator="Ctrl+O")
+        file_menu.add_command(label="Abrir Pasta...", command=self.open_folder,
+                             accelerator="Ctrl+Shift+O")
         file_menu.add_command(label="Salvar Como...", command=self.save_file,
                              accelerator="Ctrl+S")
         file_menu.add_separator()
@@ -380,6 +523,11 @@ class TontoAnalyzerGUI:
                                  accelerator="F5")
         analysis_menu.add_command(label="Limpar Tudo", command=self.clear_all,
                                  accelerator="Ctrl+L")
+        analysis_menu.add_separator()
+        analysis_menu.add_checkbutton(label="Análise ao Vivo", variable=self.live_mode,
+                                     command=self.toggle_live_mode)
+        analysis_menu.add_command(label="Atraso da Análise ao Vivo...",
+                                 command=self.configure_live_delay)
 
         # Menu Ajuda
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -389,73 +537,209 @@ class TontoAnalyzerGUI:
 
         # Atalhos de teclado
         self.root.bind('<Control-o>', lambda e: self.open_file())
+        self.root.bind('<Control-O>', lambda e: self.open_folder())
         self.root.bind('<Control-s>', lambda e: self.save_file())
         self.root.bind('<Control-l>', lambda e: self.clear_all())
         self.root.bind('<F5>', lambda e: self.analyze_code())
 
+    # Tempo máximo (ms) de cada fatia de atualização dos widgets
+    BATCH_TIME_MS = 15
+    # Intervalo (ms) de consulta às mensagens da thread de análise
+    POLL_INTERVAL_MS = 50
+
+    PHASE_LABELS = {
+        'lexico': "Análise léxica",
+        'sintatico': "Análise sintática",
+    }
+
+    # Tamanho (bytes) de cada bloco lido ao abrir um arquivo
+    LOAD_CHUNK_SIZE = 256 * 1024
+    # Arquivos acima deste tamanho (bytes) abrem no modo arquivo grande
+    LARGE_FILE_THRESHOLD = 8 * 1024 * 1024
+    # Linhas exibidas de cada vez no modo arquivo grande
+    LARGE_FILE_WINDOW = 5000
+    # Intervalo mínimo (ms) entre atualizações do relatório agregado do modo pasta
+    WORKSPACE_REPORT_INTERVAL_MS = 300
+    # Limites de cada arquivo no modo pasta: um arquivo patológico é
+    # interrompido em vez de prender um processo do pool
+    WORKSPACE_LIMITS = {'max_seconds': 30.0, 'max_diagnostics': 10000}
+
+    # Opções do filtro de tipo do relatório de erros -> tag das linhas
+    ERROR_KIND_FILTERS = {
+        'Todos': None,
+        'Léxico': 'lexico',
+        'Sintático': 'sintatico',
+    }
+
     def analyze_code(self):
-        """Executa análise léxica e sintática"""
-        code = self.code_text.get(1.0, tk.END)
+        """Executa análise léxica e sintática em segundo plano"""
+        if self._load_file is not None:
+            return  # Arquivo ainda sendo carregado no editor
 
-        if not code.strip():
-            messagebox.showwarning("Aviso", "Por favor, insira algum código para analisar")
-            return
+        if self.large_file_path is None:
+            code = self.code_text.get(1.0, tk.END)
+
+            if not code.strip():
+                messagebox.showwarning("Aviso", "Por favor, insira algum código para analisar")
+                return
 
         # Limpar visualizações anteriores
         self._clear_results()
 
-        # ANÁLISE LÉXICA
-        tokens, lex_errors = self.lexer.tokenize(code)
-
-        # Mostrar tokens
-        for token in tokens:
-            info = self.lexer.get_token_info(token)
-            tag = 'erro' if info['categoria'] == 'Erro' else 'ok'
-            values = (info['linha'], info['coluna'], info['tipo'],
-                     info['valor'], info['categoria'])
-            self.lexical_tree.insert('', tk.END, values=values, tags=(tag,))
+        self.current_job += 1
+        if self.large_file_path is None:
+            self.worker.submit(self.current_job, code)
+        else:
+            # Arquivo grande: o worker mapeia e analisa direto do disco
+            self.worker.submit_file(self.current_job, self.large_file_path)
+
+        self._set_busy(True)
+        self.status_label.config(text="Iniciando análise...")
+        self._start_polling()
+
+    def cancel_analysis(self):
+        """Interrompe a análise em andamento"""
+        if self._load_file is not None:
+            self._stop_loading()
+            self._set_busy(False)
+            self.status_label.config(text="Carregamento cancelado")
+        self.worker.cancel()
+        # Também interrompe a aplicação dos resultados, se já tiver começado
+        if self._batch_job is not None:
+            self._batch_job = None
+            self._set_busy(False)
+            self.status_label.config(text="Análise cancelada")
+
+    def _set_busy(self, busy):
+        """Alterna os botões e a barra de progresso entre ocupado e livre"""
+        self._busy = busy
+        self.analyze_button.config(state=tk.DISABLED if busy else tk.NORMAL)
+        self.cancel_button.config(state=tk.NORMAL if busy else tk.DISABLED)
+        if not busy:
+            self.progress_bar['value'] = 0
+
+    def _start_polling(self):
+        """Inicia a consulta à fila do worker, se ainda não estiver ativa"""
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_INTERVAL_MS, self._poll_worker)
+
+    def _poll_worker(self):
+        """Consome as mensagens da thread de análise (sempre na thread do Tk)"""
+        while True:
+            try:
+                message = self.worker.messages.get_nowait()
+            except queue.Empty:
+                break
+
+            job_id, kind = message[0], message[1]
+            if job_id != self.current_job:
+                if kind == 'arquivo':
+                    message[2].close()  # Mapeamento que ninguém vai usar
+                continue  # Mensagem de uma análise já substituída
+
+            if kind == 'arquivo':
+                self._adopt_mapped_file(message[2])
+            elif kind == 'progresso':
+                phase, fraction = message[2], message[3]
+                # Léxico ocupa a primeira metade da barra, sintático a segunda
+                offset = 0.0 if phase == 'lexico' else 0.5
+                self.progress_bar['value'] = offset + fraction / 2
+                self.status_label.config(
+                    text=f"{self.PHASE_LABELS.get(phase, phase)}: {fraction:.0%}")
+            elif kind == 'concluido':
+                self._polling = False
+                if 'segments' in message[2]:
+                    self._apply_live_results(message[2])
+                else:
+                    self._apply_results(message[2])
+                return
+            elif kind == 'cancelado':
+                self._polling = False
+                self._set_busy(False)
+                self.status_label.config(text="Análise cancelada")
+                return
+            elif kind == 'erro':
+                self._polling = False
+                self._set_busy(False)
+                self.status_label.config(text="")
+                messagebox.showerror("Erro na Análise",
+                                    f"Ocorreu um erro durante a análise:\n{str(message[2])}")
+                return
+
+        self.root.after(self.POLL_INTERVAL_MS, self._poll_worker)
+
+    def _apply_results(self, analysis, announce=True):
+        """
+        Exibe os resultados; as árvores são preenchidas em fatias de tempo.
+        announce=False dispensa as mensagens de conclusão (resultados em cache).
+        """
+        tokens = analysis['tokens']
+        lex_errors = analysis['lex_errors']
+        syn_errors = analysis['syn_errors']
 
-        # Resumo léxico
-        self._show_lexical_summary(tokens, lex_errors)
+        # Tokens e resumo léxico são baratos (tabela virtual)
+        self.tokens = tokens
+        self.token_index = analysis['token_index']
+        self.token_type_filter['values'] = [''] + self.token_index.types()
+        self._apply_token_filter()
+        self._show_lexical_summary(len(tokens), lex_errors, analysis['categories'])
 
-        # ANÁLISE SINTÁTICA
-        try:
-            result, syn_errors = self.parser.parse(code)
-            summary = self.parser.get_analysis_summary()
+        # Tabela de síntese: só os nós de categoria; o resto é criado ao expandir
+        self.declaration_trie = analysis['declaration_trie']
+        self.summary_tree.update(analysis['summary'], self._declaration_filter_keep())
 
-            # Mostrar síntese sintática
-            self._show_syntactic_summary(summary)
+        self._index_errors(enumerate(self._error_rows(lex_errors, syn_errors)))
 
-            # Mostrar erros
-            self._show_errors(lex_errors, syn_errors)
+        self.status_label.config(text="Exibindo resultados...")
+        self._run_in_batches(self._show_errors(self._filtered_error_rows()),
+                             lambda: self._finish_analysis(lex_errors, syn_errors, announce))
 
-            # Mensagem de sucesso se não houver erros
-            if not lex_errors and not syn_errors:
-                messagebox.showinfo("Análise Concluída",
-                                   "✅ Código analisado com sucesso!\nNenhum erro encontrado.")
-                self.notebook.select(self.tab_syntactic)
-            else:
-                messagebox.showwarning("Análise Concluída com Erros",
-                                      f"⚠️ Foram encontrados {len(lex_errors) + len(syn_errors)} erro(s).\n"
-                                      f"Verifique a aba 'Relatório de Erros'.")
-                self.notebook.select(self.tab_errors)
+    def _run_in_batches(self, steps, on_done):
+        """
+        Consome um iterador de passos em fatias de até BATCH_TIME_MS,
+        devolvendo o controle ao Tk entre as fatias para manter a janela responsiva.
+        """
+        job = object()
+        self._batch_job = job
+
+        def run_slice():
+            if self._batch_job is not job:
+                return  # Cancelado ou substituído por outra análise
+            deadline = time.perf_counter() + self.BATCH_TIME_MS / 1000
+            for _ in steps:
+                if time.perf_counter() >= deadline:
+                    self.root.after(1, run_slice)
+                    return
+            self._batch_job = None
+            on_done()
+
+        run_slice()
+
+    def _finish_analysis(self, lex_errors, syn_errors, announce=True):
+        """Conclui a análise exibindo o resultado final"""
+        self._set_busy(False)
+        total_errors = len(lex_errors) + len(syn_errors)
+        self.status_label.config(text=f"{len(self.tokens)} tokens, {total_errors} erro(s)")
+
+        if not announce:
+            return
 
-        except Exception as e:
-            messagebox.showerror("Erro na Análise",
-                                f"Ocorreu um erro durante a análise:\n{str(e)}")
+        # Mensagem de sucesso se não houver erros
+        if not lex_errors and not syn_errors:
+            messagebox.showinfo("Análise Concluída",
+                               "✅ Código analisado com sucesso!\nNenhum erro encontrado.")
+            self.notebook.select(self.tab_syntactic)
+        else:
+            messagebox.showwarning("Análise Concluída com Erros",
+                                  f"⚠️ Foram encontrados {total_errors} erro(s).\n"
+                                  f"Verifique a aba 'Relatório de Erros'.")
+            self.notebook.select(self.tab_errors)
 
-    def _show_lexical_summary(self, tokens, errors):
+    def _show_lexical_summary(self, total_tokens, errors, categories):
         """Mostra resumo da análise léxica"""
-        total_tokens = len(tokens)
         total_errors = len(errors)
 
-        # Contar categorias
-        categories = {}
-        for token in tokens:
-            info = self.lexer.get_token_info(token)
-            cat = info['categoria']
-            categories[cat] = categories.get(cat, 0) + 1
-
         summary = f"Total de Tokens: {total_tokens}\n"
         summary += f"Erros Léxicos: {total_errors}\n"
         summary += f"Categorias: {', '.join(f'{k}({v})' for k, v in sorted(categories.items()))}\n"
@@ -463,104 +747,259 @@ class TontoAnalyzerGUI:
         self.lexical_summary_text.delete(1.0, tk.END)
         self.lexical_summary_text.insert(1.0, summary)
 
-    def _show_syntactic_summary(self, summary):
-        """Mostra síntese da análise sintática"""
-        # Pacotes
-        if summary['packages']:
-            pkg_node = self.syntactic_tree.insert('', tk.END, text='📦 Pacotes',
-                                                  values=('', len(summary['packages']), ''))
-            for pkg in summary['packages']:
-                self.syntactic_tree.insert(pkg_node, tk.END, text=f"  {pkg['name']}",
-                                         values=(pkg['name'], '', f"Linha {pkg['line']}"))
-
-        # Classes
-        if summary['classes']:
-            class_node = self.syntactic_tree.insert('', tk.END, text='📋 Classes',
-                                                   values=('', len(summary['classes']), ''))
-            for cls in summary['classes']:
-                details = f"{cls['stereotype']} - Linha {cls['line']}"
-                self.syntactic_tree.insert(class_node, tk.END, text=f"  {cls['name']}",
-                                         values=(cls['name'], '', details))
-
-        # Tipos de Dados
-        if summary['datatypes']:
-            dt_node = self.syntactic_tree.insert('', tk.END, text='🔤 Tipos de Dados',
-                                                values=('', len(summary['datatypes']), ''))
-            for dt in summary['datatypes']:
-                details = f"Linha {dt['line']}, {len(dt['attributes'])} atributo(s)"
-                self.syntactic_tree.insert(dt_node, tk.END, text=f"  {dt['name']}",
-                                         values=(dt['name'], '', details))
-
-        # Enumerações
-        if summary['enums']:
-            enum_node = self.syntactic_tree.insert('', tk.END, text='📝 Classes Enumeradas',
-                                                  values=('', len(summary['enums']), ''))
-            for enum in summary['enums']:
-                details = f"Linha {enum['line']}, Instâncias: {', '.join(enum['instances'])}"
-                self.syntactic_tree.insert(enum_node, tk.END, text=f"  {enum['name']}",
-                                         values=(enum['name'], len(enum['instances']), details))
-
-        # Generalizações
-        if summary['gensets']:
-            gen_node = self.syntactic_tree.insert('', tk.END, text='🌳 Generalizações',
-                                                 values=('', len(summary['gensets']), ''))
-            for gen in summary['gensets']:
-                modifiers = ', '.join(gen['modifiers']) if gen['modifiers'] else 'nenhum'
-                details = f"Linha {gen['line']}, Modificadores: {modifiers}"
-                details += f", Geral: {gen['general']}, Específicas: {', '.join(gen['specifics'])}"
-                self.syntactic_tree.insert(gen_node, tk.END, text=f"  {gen['name']}",
-                                         values=(gen['name'], len(gen['specifics']), details))
-
-        # Relações
-        if summary['relations']:
-            rel_node = self.syntactic_tree.insert('', tk.END, text='🔗 Relações',
-                                                 values=('', len(summary['relations']), ''))
-            for rel in summary['relations']:
-                tipo = "Interna" if rel['internal'] else "Externa"
-                estereotipo = rel.get('stereotype', 'sem estereótipo')
-
-                # Criar nome descritivo para a relação
-                if rel.get('name'):
-                    # Se tem nome explícito, usar ele
-                    nome = rel['name']
-                else:
-                    # Se não tem nome, criar descrição baseada em estereótipo e alvo
-                    target = rel.get('target', 'desconhecido')
-                    if estereotipo and estereotipo != 'sem estereótipo':
-                        nome = f"{estereotipo} → {target}"
-                    else:
-                        nome = f"→ {target}"
-
-                details = f"Linha {rel['line']}, Tipo: {tipo}, Estereótipo: {estereotipo}"
-                self.syntactic_tree.insert(rel_node, tk.END, text=f"  {nome}",
-                                         values=(nome, '', details))
-
-    def _show_errors(self, lex_errors, syn_errors):
-        """Mostra relatório de erros"""
+    def _format_token_row(self, token):
+        """Formata uma linha da tabela de tokens (chamado apenas para linhas visíveis)"""
+        info = self.lexer.get_token_info(token)
+        tag = 'erro' if info['categoria'] == 'Erro' else 'ok'
+        values = (info['linha'], info['coluna'], info['tipo'],
+                 info['valor'], info['categoria'])
+        return values, (tag,)
+
+    def _goto_token_line(self):
+        """Rola a tabela de tokens até o primeiro token da linha informada"""
+        try:
+            line = int(self.goto_line_entry.get())
+        except ValueError:
+            return
+
+        # Tokens exibidos (filtrados ou não) estão em ordem de linha: busca binária
+        tokens = self.lexical_tree.data
+        low, high = 0, len(tokens)
+        while low < high:
+            mid = (low + high) // 2
+            if tokens[mid].lineno < line:
+                low = mid + 1
+            else:
+                high = mid
+
+        if low < len(tokens):
+            self.lexical_tree.see(self.lexical_tree.index_of(low))
+
+    def _show_errors(self, rows):
+        """Mostra relatório de erros (gerador: um passo por item inserido)"""
+        for key, values, tag in rows:
+            iid = self.errors_tree.insert('', tk.END, values=values, tags=(tag,))
+            self._error_view_rows[key] = (iid, values)
+            yield
+
+    def _error_rows(self, lex_errors, syn_errors):
+        """Gera (valores, tag) de cada linha do relatório de erros"""
         # Erros léxicos
-        for error in lex_errors:
-            msg = f"Caractere inválido: '{error.value[0]}'"
-            sugestao = "Remova ou substitua este caractere por um símbolo válido"
-            self.errors_tree.insert('', tk.END,
-                                   values=(error.lineno, 'Erro Léxico', msg, sugestao),
-                                   tags=('lexico',))
+        for token in lex_errors:
+            error = lexical_error(token)
+            yield (error['linha'], error['tipo'],
+                   error['mensagem'], error['sugestao']), 'lexico'
 
         # Erros sintáticos
         for error in syn_errors:
-            self.errors_tree.insert('', tk.END,
-                                   values=(error['linha'], error['tipo'],
-                                          error['mensagem'], error['sugestao']),
-                                   tags=('sintatico',))
+            yield (error['linha'], error['tipo'],
+                   error['mensagem'], error['sugestao']), 'sintatico'
+
+    # ========================================================================
+    # FILTROS
+    # ========================================================================
+
+    def _apply_token_filter(self):
+        """Exibe apenas os tokens do tipo/valor informados"""
+        if self.token_index is None:
+            return
+
+        positions = self.token_index.search(self.token_type_filter.get().strip(),
+                                            self.token_value_filter.get().strip())
+        if positions is None:
+            data = self.tokens
+            self.token_filter_label.config(text="")
+        else:
+            data = self.token_index.select(positions)
+            self.token_filter_label.config(text=f"{len(data)} de {len(self.tokens)} token(s)")
+
+        self.lexical_tree.set_data(data)
+        self.lexical_tooltip.invalidate()
+
+    def _clear_token_filter(self):
+        self.token_type_filter.set('')
+        self.token_value_filter.delete(0, tk.END)
+        self._apply_token_filter()
+
+    def _declaration_filter_keep(self):
+        """Conjunto de id() das declarações que casam com a busca (None = todas)"""
+        prefix = self.declaration_filter.get().strip()
+        if not prefix or self.declaration_trie is None:
+            self.declaration_filter_label.config(text="")
+            return None
+
+        matches = self.declaration_trie.search(prefix)
+        self.declaration_filter_label.config(text=f"{len(matches)} declaração(ões)")
+        return {id(item) for _, item in matches}
+
+    def _apply_declaration_filter(self):
+        """Refaz a tabela de síntese com as declarações que casam com a busca"""
+        if self.summary_tree.summary is None:
+            return
+        self.summary_tree.update(self.summary_tree.summary, self._declaration_filter_keep())
+        self.syntactic_tooltip.invalidate()
+
+    def _clear_declaration_filter(self):
+        self.declaration_filter.delete(0, tk.END)
+        self._apply_declaration_filter()
+
+    def _index_errors(self, rows):
+        """Guarda as linhas do relatório (chave, valores, tag) e as indexa por linha"""
+        self._all_error_rows = [(key, values, tag) for key, (values, tag) in rows]
+        self.error_index = LineIndex(self._all_error_rows, lambda row: row[1][0])
+
+    def _filtered_error_rows(self):
+        """Linhas do relatório que passam pelo filtro de faixa e tipo"""
+        bounds = []
+        for entry in (self.error_first_line, self.error_last_line):
+            try:
+                bounds.append(int(entry.get()))
+            except ValueError:
+                bounds.append(None)
+        first, last = bounds
+        tag = self.ERROR_KIND_FILTERS.get(self.error_kind_filter.get())
+
+        if first is None and last is None:
+            rows = self._all_error_rows     # Sem faixa: ordem original do relatório
+        else:
+            rows = self.error_index.between(first, last)
+        if tag is not None:
+            rows = [row for row in rows if row[2] == tag]
+
+        if len(rows) == len(self._all_error_rows):
+            self.error_filter_label.config(text="")
+        else:
+            self.error_filter_label.config(
+                text=f"{len(rows)} de {len(self._all_error_rows)} erro(s)")
+        return rows
+
+    def _apply_error_filter(self):
+        """Atualiza o relatório de erros: só as linhas que mudaram tocam no Treeview"""
+        if self.error_index is None or self._batch_job is not None:
+            return  # Sem análise ou resultados ainda sendo exibidos
+        rows = [(key, '', values, (tag,)) for key, values, tag in self._filtered_error_rows()]
+        self._error_view_rows = sync_tree_rows(self.errors_tree, '', self._error_view_rows, rows)
+        self.error_tooltip.invalidate()
+
+    def _clear_error_filter(self):
+        self.error_first_line.delete(0, tk.END)
+        self.error_last_line.delete(0, tk.END)
+        self.error_kind_filter.set('Todos')
+        self._apply_error_filter()
+
+    # ========================================================================
+    # MODO AO VIVO
+    # ========================================================================
+
+    def toggle_live_mode(self):
+        """Liga/desliga a análise enquanto o usuário digita"""
+        if self.live_mode.get() and self.large_file_path is not None:
+            self.live_mode.set(False)
+            messagebox.showinfo("Análise ao Vivo",
+                               "A análise ao vivo não está disponível no modo arquivo grande.")
+            return
+
+        if self.live_mode.get():
+            self.code_text.edit_modified(False)
+            self._schedule_live_analysis()
+        elif self._live_after_id is not None:
+            self.root.after_cancel(self._live_after_id)
+            self._live_after_id = None
+
+    def configure_live_delay(self):
+        """Permite ajustar o tempo de espera após a última tecla"""
+        delay = simpledialog.askinteger("Análise ao Vivo",
+                                        "Atraso após a última edição (ms):",
+                                        initialvalue=self.live_delay_ms,
+                                        minvalue=100, maxvalue=10000,
+                                        parent=self.root)
+        if delay is not None:
+            self.live_delay_ms = delay
+
+    def _on_code_modified(self, event):
+        """Reage a <<Modified>>: apenas reagenda realce e análise (custo constante por tecla)"""
+        if not self.code_text.edit_modified():
+            return  # Evento gerado pelo próprio reset do indicador
+        self.code_text.edit_modified(False)
+        self.highlighter.invalidate()
+        if self.live_mode.get():
+            self._schedule_live_analysis()
+
+    def _schedule_live_analysis(self):
+        """Debounce: só analisa após live_delay_ms sem novas edições"""
+        if self._live_after_id is not None:
+            self.root.after_cancel(self._live_after_id)
+        self._live_after_id = self.root.after(self.live_delay_ms, self._run_live_analysis)
+
+    def _run_live_analysis(self):
+        self._live_after_id = None
+        if self._busy or self._batch_job is not None:
+            # Análise completa em andamento; tentar novamente depois
+            self._schedule_live_analysis()
+            return
+
+        self.current_job += 1
+        self.worker.submit(self.current_job, self.code_text.get(1.0, tk.END),
+                           incremental=True)
+        self.status_label.config(text="Análise ao vivo...")
+        self._start_polling()
+
+    def _apply_live_results(self, analysis):
+        """
+        Atualiza erros e sínteses comparando com o resultado anterior:
+        apenas as linhas que surgiram, sumiram ou mudaram tocam no Treeview.
+        """
+        segments = analysis['segments']
+
+        # Relatório de erros (respeitando o filtro atual)
+        self._index_errors(
+            ((segment['key'], index), row)
+            for segment in segments
+            for index, row in enumerate(self._error_rows(segment['lex_errors'],
+                                                         segment['syn_errors'])))
+        self._apply_error_filter()
+
+        # Tabela de síntese: nós fechados custam O(1), os abertos são comparados
+        self.declaration_trie = analysis['declaration_trie']
+        self.summary_tree.update(analysis['summary'], self._declaration_filter_keep())
+
+        # Linhas mantidas podem ter mudado de valor
+        self.error_tooltip.invalidate()
+        self.syntactic_tooltip.invalidate()
+
+        self._show_lexical_summary(analysis['token_count'], analysis['lex_errors'],
+                                   analysis['categories'])
+
+        reanalyzed = sum(1 for segment in segments if segment['reanalyzed'])
+        total_errors = len(analysis['lex_errors']) + len(analysis['syn_errors'])
+        self.status_label.config(
+            text=f"Ao vivo: {total_errors} erro(s), "
+                 f"{reanalyzed}/{len(segments)} trecho(s) reanalisado(s)")
 
     def _clear_results(self):
         """Limpa resultados das análises"""
-        self.lexical_tree.delete(*self.lexical_tree.get_children())
-        self.syntactic_tree.delete(*self.syntactic_tree.get_children())
+        self._batch_job = None
+        self._error_view_rows = {}
+        self.token_index = None
+        self.declaration_trie = None
+        self.error_index = None
+        self._all_error_rows = []
+        self.token_filter_label.config(text="")
+        self.declaration_filter_label.config(text="")
+        self.error_filter_label.config(text="")
+        self.error_tooltip.invalidate()
+        self.syntactic_tooltip.invalidate()
+        self.lexical_tooltip.invalidate()
+        self.tokens = []
+        self.lexical_tree.clear()
+        self.summary_tree.clear()
         self.errors_tree.delete(*self.errors_tree.get_children())
         self.lexical_summary_text.delete(1.0, tk.END)
 
     def clear_all(self):
         """Limpa tudo"""
+        self.cancel_analysis()
+        self._leave_large_file_mode()
         self.code_text.delete(1.0, tk.END)
         self._clear_results()
 
@@ -574,16 +1013,348 @@ class TontoAnalyzerGUI:
         )
 
         if filepath:
+            self._open_path(filepath)
+
+    def _open_path(self, filepath, cached=None, goto_line=None):
+        """
+        Carrega um arquivo no editor. Com cached (resultado de uma análise já
+        feita, ex.: no modo pasta), os resultados são exibidos sem reanalisar.
+        """
+        try:
+            size = os.path.getsize(filepath)
+        except OSError as e:
+            messagebox.showerror("Erro", f"Erro ao abrir arquivo:\n{str(e)}")
+            return
+
+        self.cancel_analysis()
+        # Mensagens da análise interrompida deixam de interessar
+        self.current_job += 1
+        self._set_busy(False)
+        self._clear_results()
+        self._leave_large_file_mode()
+
+        def show_cached():
+            if cached is not None:
+                self._apply_results(cached, announce=False)
+            if goto_line is not None:
+                self.goto_source_line(goto_line)
+
+        if size > self.LARGE_FILE_THRESHOLD:
+            self._open_large_file(filepath, size, analyze=cached is None)
+            if cached is not None:
+                try:
+                    self._adopt_mapped_file(MappedFile(filepath))
+                except Exception as e:
+                    messagebox.showerror("Erro", f"Erro ao abrir arquivo:\n{str(e)}")
+                    return
+                show_cached()
+        else:
+            self._load_file_in_chunks(filepath, size, on_done=show_cached)
+
+    # ========================================================================
+    # CARREGAMENTO DE ARQUIVOS
+    # ========================================================================
+
+    def _load_file_in_chunks(self, filepath, size, on_done=None):
+        """
+        Insere o arquivo no editor em blocos de LOAD_CHUNK_SIZE bytes,
+        devolvendo o controle ao Tk entre os blocos.
+        on_done: função opcional chamada quando o arquivo termina de carregar
+        """
+        try:
+            self._load_file = open(filepath, 'rb')
+        except Exception as e:
+            messagebox.showerror("Erro", f"Erro ao abrir arquivo:\n{str(e)}")
+            return
+
+        self.code_text.delete(1.0, tk.END)
+        self._load_generation += 1
+        # Decodificador incremental: um caractere pode ficar dividido entre blocos
+        decoder = codecs.getincrementaldecoder('utf-8')()
+
+        self._set_busy(True)
+        self.status_label.config(text="Carregando arquivo...")
+        self._load_chunk(decoder, 0, max(1, size), self._load_generation, on_done)
+
+    def _load_chunk(self, decoder, loaded, size, generation, on_done):
+        if generation != self._load_generation:
+            return  # Carregamento cancelado ou substituído
+
+        try:
+            data = self._load_file.read(self.LOAD_CHUNK_SIZE)
+            text = decoder.decode(data, final=not data)
+        except Exception as e:
+            self._stop_loading()
+            self._set_busy(False)
+            self.status_label.config(text="")
+            messagebox.showerror("Erro", f"Erro ao abrir arquivo:\n{str(e)}")
+            return
+
+        self.code_text.insert('end-1c', text)
+
+        if not data:
+            self._stop_loading()
+            self._set_busy(False)
+            lines = int(self.code_text.index('end-1c').split('.')[0])
+            self.status_label.config(text=f"Arquivo carregado: {lines} linha(s)")
+            if on_done is not None:
+                on_done()
+            return
+
+        loaded += len(data)
+        self.progress_bar['value'] = loaded / size
+        self.status_label.config(text=f"Carregando arquivo: {min(1.0, loaded / size):.0%}")
+        self.root.after(1, self._load_chunk, decoder, loaded, size, generation, on_done)
+
+    def _stop_loading(self):
+        """Encerra o carregamento em blocos em andamento"""
+        self._load_generation += 1
+        if self._load_file is not None:
+            self._load_file.close()
+            self._load_file = None
+
+    def _open_large_file(self, filepath, size, analyze=True):
+        """
+        Abre o arquivo no modo arquivo grande: somente leitura, análise
+        direto do disco e apenas uma janela de linhas no editor.
+        """
+        # Análise ao vivo reanalisaria só a janela exibida
+        if self.live_mode.get():
+            self.live_mode.set(False)
+            self.toggle_live_mode()
+
+        self.large_file_path = filepath
+        self.window_first_line = 1
+        self.code_text.delete(1.0, tk.END)
+        self.code_text.config(state=tk.DISABLED)
+        self.large_file_label.config(
+            text=f"📄 {os.path.basename(filepath)} ({size / (1024 * 1024):.1f} MB) - "
+                 f"modo arquivo grande, somente leitura. Mapeando arquivo...")
+        self.large_file_frame.pack(fill=tk.X, padx=5, pady=(5, 0), before=self.code_text)
+
+        # O worker mapeia o arquivo e o devolve antes de analisá-lo
+        if analyze:
+            self.analyze_code()
+
+    def _adopt_mapped_file(self, mapped):
+        """Recebe do worker o arquivo mapeado e exibe a janela atual"""
+        if mapped.path != self.large_file_path:
+            mapped.close()  # O usuário já saiu do modo arquivo grande
+            return
+
+        if self.mapped_file is not None:
+            self.mapped_file.close()
+        self.mapped_file = mapped
+        self._show_file_window(self.window_first_line)
+
+    def _show_file_window(self, first_line):
+        """Exibe no editor LARGE_FILE_WINDOW linhas a partir de first_line"""
+        mapped = self.mapped_file
+        last_start = max(1, mapped.line_count - self.LARGE_FILE_WINDOW + 1)
+        first_line = max(1, min(first_line, last_start))
+        last_line = min(mapped.line_count, first_line + self.LARGE_FILE_WINDOW - 1)
+
+        self.window_first_line = first_line
+        self.code_text.config(state=tk.NORMAL)
+        self.code_text.delete(1.0, tk.END)
+        self.code_text.insert(1.0, mapped.read_lines(first_line, last_line))
+        self.code_text.config(state=tk.DISABLED)
+
+        self.large_file_label.config(
+            text=f"📄 {os.path.basename(mapped.path)} ({mapped.size / (1024 * 1024):.1f} MB) - "
+                 f"somente leitura. Linhas {first_line}-{last_line} de {mapped.line_count}")
+
+    def _shift_file_window(self, direction):
+        """Avança ou recua uma janela inteira no modo arquivo grande"""
+        if self.mapped_file is not None:
+            self._show_file_window(self.window_first_line + direction * self.LARGE_FILE_WINDOW)
+
+    def _leave_large_file_mode(self):
+        """Volta ao editor normal, liberando o arquivo mapeado"""
+        if self.large_file_path is None:
+            return
+        self.large_file_path = None
+        if self.mapped_file is not None:
+            self.mapped_file.close()
+            self.mapped_file = None
+        self.large_file_frame.pack_forget()
+        self.code_text.config(state=tk.NORMAL)
+        self.code_text.delete(1.0, tk.END)
+
+    # ========================================================================
+    # MODO PASTA (PROJETO)
+    # ========================================================================
+
+    def open_folder(self):
+        """Abre uma pasta e analisa todos os seus arquivos .tonto em segundo plano"""
+        folder = filedialog.askdirectory(title="Abrir pasta de projeto TONTO")
+        if not folder:
+            return
+
+        paths = find_tonto_files(folder)
+        if not paths:
+            messagebox.showinfo("Abrir Pasta", "Nenhum arquivo .tonto encontrado na pasta.")
+            return
+
+        if self.workspace is None:
+            self.workspace = WorkspaceAnalyzer(limits=self.WORKSPACE_LIMITS)
+            self.project_panel = ProjectPanel(self.paned, self._on_project_file_selected)
+            self.paned.insert(0, self.project_panel.frame, weight=0)
+            self._create_project_tab()
+
+        self.project_panel.load(folder, paths)
+        self._project_error_rows = sync_tree_rows(self.project_errors_tree, '',
+                                                  self._project_error_rows, [])
+        self._project_error_targets = {}
+        self.project_summary_text.delete(1.0, tk.END)
+
+        self.workspace.analyze_folder(paths)
+        self._project_total = len(paths)
+        self.project_panel.status_label.config(text=f"Analisando 0/{len(paths)} arquivo(s)...")
+        if not self._workspace_polling:
+            self._workspace_polling = True
+            self.root.after(self.POLL_INTERVAL_MS, self._poll_workspace)
+
+    def _create_project_tab(self):
+        """Cria a aba com o resumo e o relatório de erros de toda a pasta"""
+        self.tab_project = tk.Frame(self.notebook, bg="white")
+        self.notebook.add(self.tab_project, text="📁 Projeto")
+
+        frame_summary = tk.LabelFrame(self.tab_project, text="Resumo do Projeto",
+                                     font=('Arial', 10, 'bold'), bg="white")
+        frame_summary.pack(fill=tk.X, padx=10, pady=5)
+
+        self.project_summary_text = tk.Text(frame_summary, height=6,
+                                            font=('Courier New', 9), bg="#f0f0f0")
+        self.project_summary_text.pack(fill=tk.X, padx=5, pady=5)
+
+        frame_err = tk.LabelFrame(self.tab_project, text="Erros de Todos os Arquivos",
+                                 font=('Arial', 10, 'bold'), bg="white")
+        frame_err.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        tk.Label(frame_err, text="💡 Dica: Duplo-clique para abrir o arquivo na linha do erro",
+                bg="white", fg="#666", font=('Arial', 9, 'italic')).pack(anchor=tk.W, padx=5)
+
+        columns = ('arquivo', 'linha', 'tipo', 'mensagem')
+        self.project_errors_tree = ttk.Treeview(frame_err, columns=columns,
+                                               show='headings', height=15)
+
+        self.project_errors_tree.heading("arquivo", text='Arquivo')
+        self.project_errors_tree.heading("linha", text='Linha')
+        self.project_errors_tree.heading("tipo", text='Tipo de Erro')
+        self.project_errors_tree.heading("mensagem", text='Mensagem')
+
+        self.project_errors_tree.column("arquivo", width=200)
+        self.project_errors_tree.column("linha", width=60)
+        self.project_errors_tree.column("tipo", width=120)
+        self.project_errors_tree.column("mensagem", width=450)
+
+        scroll_err = ttk.Scrollbar(frame_err, orient=tk.VERTICAL,
+                                  command=self.project_errors_tree.yview)
+        self.project_errors_tree.configure(yscrollcommand=scroll_err.set)
+
+        self.project_errors_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5,0), pady=5)
+        scroll_err.pack(side=tk.RIGHT, fill=tk.Y, pady=5, padx=(0,5))
+
+        self.project_error_tooltip = TreeviewTooltip(self.project_errors_tree)
+        self.project_errors_tree.bind('<Double-Button-1>', self._on_project_error_activated)
+
+    def _poll_workspace(self):
+        """Consome as mensagens da análise da pasta (sempre na thread do Tk)"""
+        while True:
             try:
-                with open(filepath, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                    self.code_text.delete(1.0, tk.END)
-                    self.code_text.insert(1.0, content)
-            except Exception as e:
-                messagebox.showerror("Erro", f"Erro ao abrir arquivo:\n{str(e)}")
+                message = self.workspace.messages.get_nowait()
+            except queue.Empty:
+                break
+
+            if message[0] != self.workspace.generation:
+                continue  # Pasta já substituída
+
+            if message[1] == 'fim':
+                self._workspace_polling = False
+                self._refresh_workspace_report()
+                return
+
+            _, _, path, status, result = message
+            if status == 'erro':
+                self.project_panel.set_status(path, status)
+            else:
+                errors = len(result['lex_errors']) + len(result['syn_errors'])
+                self.project_panel.set_status(path, status, errors)
+
+            # O relatório agregado é refeito no máximo algumas vezes por segundo
+            if self._workspace_report_after_id is None:
+                self._workspace_report_after_id = self.root.after(
+                    self.WORKSPACE_REPORT_INTERVAL_MS, self._refresh_workspace_report)
+
+        self.root.after(self.POLL_INTERVAL_MS, self._poll_workspace)
+
+    def _refresh_workspace_report(self):
+        """Atualiza o resumo e o relatório de erros agregados da pasta"""
+        if self._workspace_report_after_id is not None:
+            self.root.after_cancel(self._workspace_report_after_id)
+            self._workspace_report_after_id = None
+
+        # Ordem por caminho: arquivos que terminam depois só inserem linhas
+        results = dict(sorted(self.workspace.results.items()))
+        report = aggregate_results(results)
+        totals = report['totals']
+
+        done = len(results)
+        if done < self._project_total:
+            progress = f"Analisando {done}/{self._project_total} arquivo(s)..."
+        else:
+            progress = f"{done} arquivo(s), {report['files_with_errors']} com erros"
+        self.project_panel.status_label.config(text=progress)
+
+        summary = f"Arquivos: {done}/{self._project_total} "
+        summary += f"({report['files_with_errors']} com erros"
+        if report['files_over_budget']:
+            summary += f", {report['files_over_budget']} interrompido(s) por limite"
+        summary += ")\n"
+        summary += f"Total de Tokens: {report['token_count']}\n"
+        summary += f"Total de Erros: {len(report['errors'])}\n"
+        summary += (f"Pacotes: {totals['packages']}, Classes: {totals['classes']}, "
+                    f"Tipos de Dados: {totals['datatypes']}, Enumerações: {totals['enums']}\n")
+        summary += (f"Generalizações: {totals['gensets']}, Relações: {totals['relations']}, "
+                    f"Atributos: {totals['attributes']}\n")
+        self.project_summary_text.delete(1.0, tk.END)
+        self.project_summary_text.insert(1.0, summary)
+
+        # Erros agregados: só as linhas novas ou alteradas tocam no Treeview
+        rows = []
+        occurrences = {}
+        for path, line, tipo, mensagem, _ in report['errors']:
+            index = occurrences.get(path, 0)
+            occurrences[path] = index + 1
+            values = (self.project_panel.relative(path), line, tipo, mensagem)
+            rows.append(((path, index), '', values, ()))
+        self._project_error_rows = sync_tree_rows(self.project_errors_tree, '',
+                                                  self._project_error_rows, rows)
+        self._project_error_targets = {iid: (key[0], values[1])
+                                       for key, (iid, values) in self._project_error_rows.items()}
+        self.project_error_tooltip.invalidate()
+
+    def _on_project_file_selected(self, path):
+        """Mostra um arquivo da pasta com os resultados em cache, se houver"""
+        self._open_path(path, cached=self.workspace.results.get(path))
+
+    def _on_project_error_activated(self, event):
+        """Abre o arquivo do erro agregado e destaca a linha"""
+        target = self._project_error_targets.get(self.project_errors_tree.identify_row(event.y))
+        if target is None:
+            return
+        path, line = target
+        self.project_panel.select(path)
+        self._open_path(path, cached=self.workspace.results.get(path), goto_line=line)
 
     def save_file(self):
         """Salva arquivo TONTO"""
+        if self.large_file_path is not None:
+            messagebox.showinfo("Salvar",
+                               "Arquivos grandes são abertos somente para leitura.")
+            return
+
         filepath = filedialog.asksaveasfilename(
             defaultextension=".tonto",
             filetypes=(("Arquivos TONTO", "*.tonto"),
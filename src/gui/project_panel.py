@@ -0,0 +1,113 @@
+"""
+Painel lateral do modo pasta (projeto) da interface gráfica
+"""
+import os
+import tkinter as tk
+from tkinter import ttk
+
+
+class ProjectPanel:
+    """
+    Árvore com os arquivos .tonto da pasta aberta e o estado da análise de cada um.
+
+    on_select: função caminho -> None chamada ao selecionar um arquivo
+    """
+
+    STATUS_LABELS = {
+        'pendente': '⏳ Pendente',
+        'cache': '✅ Em cache',
+        'concluido': '✅ Analisado',
+        'erro': '⛔ Falhou',
+    }
+
+    def __init__(self, parent, on_select):
+        self.on_select = on_select
+        self.folder = None
+        self._items = {}        # caminho -> iid
+        self._paths = {}        # iid -> caminho
+        self._ignore_select = False
+
+        self.frame = tk.LabelFrame(parent, text="Projeto", font=('Arial', 11, 'bold'),
+                                   bg="white", fg="#333")
+
+        self.tree = ttk.Treeview(self.frame, columns=('estado', 'erros'),
+                                 show='tree headings', selectmode='browse')
+        self.tree.heading('#0', text='Arquivo')
+        self.tree.heading('estado', text='Estado')
+        self.tree.heading('erros', text='Erros')
+        self.tree.column('#0', width=180)
+        self.tree.column('estado', width=100)
+        self.tree.column('erros', width=50, anchor=tk.CENTER)
+
+        self.tree.tag_configure('com_erros', foreground='#d32f2f')
+
+        scroll = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scroll.set)
+
+        self.status_label = tk.Label(self.frame, text="", bg="white", fg="#666",
+                                     font=('Arial', 9), anchor=tk.W)
+        self.status_label.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=(0, 5))
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0), pady=5)
+        scroll.pack(side=tk.RIGHT, fill=tk.Y, pady=5, padx=(0, 5))
+
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+
+    def load(self, folder, paths):
+        """Lista os arquivos da pasta, agrupados pelos subdiretórios"""
+        self.folder = folder
+        self.tree.delete(*self.tree.get_children())
+        self._items = {}
+        self._paths = {}
+        directories = {'': ''}
+
+        for path in paths:
+            relative = os.path.relpath(path, folder)
+            directory, name = os.path.split(relative)
+
+            # Criar os nós dos diretórios intermediários sob demanda
+            parent = directories.get(directory)
+            if parent is None:
+                parent = ''
+                partial = ''
+                for part in directory.split(os.sep):
+                    partial = os.path.join(partial, part)
+                    if partial not in directories:
+                        directories[partial] = self.tree.insert(
+                            parent, tk.END, text=f"📁 {part}", open=True)
+                    parent = directories[partial]
+
+            iid = self.tree.insert(parent, tk.END, text=name,
+                                   values=(self.STATUS_LABELS['pendente'], ''))
+            self._items[path] = iid
+            self._paths[iid] = path
+
+        self.status_label.config(text=f"{len(paths)} arquivo(s)")
+
+    def set_status(self, path, status, errors=None):
+        """Atualiza o estado (e a contagem de erros) de um arquivo"""
+        iid = self._items.get(path)
+        if iid is None:
+            return
+        tags = ('com_erros',) if errors else ()
+        self.tree.item(iid, values=(self.STATUS_LABELS.get(status, status),
+                                    '' if errors is None else errors), tags=tags)
+
+    def select(self, path):
+        """Seleciona um arquivo sem disparar on_select"""
+        iid = self._items.get(path)
+        if iid is not None and self.tree.selection() != (iid,):
+            self._ignore_select = True
+            self.tree.selection_set(iid)
+            self.tree.see(iid)
+
+    def relative(self, path):
+        """Caminho do arquivo relativo à pasta do projeto"""
+        return os.path.relpath(path, self.folder) if self.folder else path
+
+    def _on_select(self, event):
+        if self._ignore_select:
+            self._ignore_select = False
+            return
+        selection = self.tree.selection()
+        if selection and selection[0] in self._paths:
+            self.on_select(self._paths[selection[0]])
@@ -0,0 +1,328 @@
+"""
+Tabela de síntese com expansão sob demanda
+
+A árvore mostra categoria -> pacote -> construto e, no nó "Por Pacote",
+o resumo hierárquico montado pelo parser (pacote -> classes -> atributos
+e relações). Só os nós de categoria são criados ao exibir uma análise; os
+filhos de cada nó são inseridos quando o usuário o expande, em blocos, a
+partir de um índice montado uma única vez por análise.
+"""
+import tkinter as tk
+
+from .tree_sync import sync_tree_rows
+
+
+# Categorias da tabela de síntese, na ordem de exibição
+SUMMARY_CATEGORIES = (
+    ('packages', '📦 Pacotes'),
+    ('classes', '📋 Classes'),
+    ('datatypes', '🔤 Tipos de Dados'),
+    ('enums', '📝 Classes Enumeradas'),
+    ('gensets', '🌳 Generalizações'),
+    ('relations', '🔗 Relações'),
+)
+
+# Nó com o resumo hierárquico por pacote (summary['package_tree'])
+PACKAGE_TREE_LABEL = '🗂️ Por Pacote'
+
+# Rótulo do grupo de construtos que não pertencem a nenhum pacote
+NO_PACKAGE = '(sem pacote)'
+
+PLACEHOLDER_TEXT = '  Carregando...'
+
+
+def build_summary_index(summary, keep=None):
+    """
+    Agrupa os construtos por categoria e pacote em uma única passada.
+
+    Retorna categoria -> lista de (chave_do_pacote, nome_do_pacote, itens).
+    Construtos que não aparecem em nenhum pacote (por exemplo, após erros
+    de sintaxe) ficam no grupo NO_PACKAGE.
+
+    keep: conjunto opcional de id() dos construtos a manter (filtro de busca)
+    """
+    index = {category: [] for category, _ in SUMMARY_CATEGORIES if category != 'packages'}
+    seen = set()
+    occurrences = {}
+
+    # O parser já agrupou as declarações de cada pacote
+    for entry in summary['package_tree']:
+        name = entry['package']['name']
+        occurrence = occurrences.get(name, 0)
+        occurrences[name] = occurrence + 1
+        key = (name, occurrence)
+
+        # Relações internas pertencem ao pacote da classe
+        relations = [member for group in entry['classes'] for member in group['relations']]
+        relations.extend(entry['external_relations'])
+        groups = {
+            'classes': [group['class'] for group in entry['classes']],
+            'datatypes': entry['datatypes'],
+            'enums': entry['enums'],
+            'gensets': entry['gensets'],
+            'relations': relations,
+        }
+
+        for category, items in groups.items():
+            seen.update(id(item) for item in items)
+            if keep is not None:
+                items = [item for item in items if id(item) in keep]
+            if items:
+                index[category].append((key, name, items))
+
+    for category in index:
+        orphans = [item for item in summary[category] if id(item) not in seen
+                   and (keep is None or id(item) in keep)]
+        if orphans:
+            index[category].append(((NO_PACKAGE, 0), NO_PACKAGE, orphans))
+
+    return index
+
+
+def summary_row(category, item):
+    """Retorna (texto, valores) da linha de um item da tabela de síntese"""
+    if category == 'packages':
+        return f"  {item['name']}", (item['name'], '', f"Linha {item['line']}")
+
+    if category == 'classes':
+        details = f"{item['stereotype']} - Linha {item['line']}"
+        return f"  {item['name']}", (item['name'], '', details)
+
+    if category == 'datatypes':
+        details = f"Linha {item['line']}, {len(item['attributes'])} atributo(s)"
+        return f"  {item['name']}", (item['name'], '', details)
+
+    if category == 'attributes':
+        details = f"Linha {item['line']}, Tipo: {item['type']}"
+        return f"  {item['name']}", (item['name'], '', details)
+
+    if category == 'enums':
+        details = f"Linha {item['line']}, Instâncias: {', '.join(item['instances'])}"
+        return f"  {item['name']}", (item['name'], len(item['instances']), details)
+
+    if category == 'gensets':
+        modifiers = ', '.join(item['modifiers']) if item['modifiers'] else 'nenhum'
+        details = f"Linha {item['line']}, Modificadores: {modifiers}"
+        details += f", Geral: {item['general']}, Específicas: {', '.join(item['specifics'])}"
+        return f"  {item['name']}", (item['name'], len(item['specifics']), details)
+
+    # Relações
+    tipo = "Interna" if item['internal'] else "Externa"
+    estereotipo = item.get('stereotype', 'sem estereótipo')
+
+    # Criar nome descritivo para a relação
+    if item.get('name'):
+        # Se tem nome explícito, usar ele
+        nome = item['name']
+    else:
+        # Se não tem nome, criar descrição baseada em estereótipo e alvo
+        target = item.get('target', 'desconhecido')
+        if estereotipo and estereotipo != 'sem estereótipo':
+            nome = f"{estereotipo} → {target}"
+        else:
+            nome = f"→ {target}"
+
+    details = f"Linha {item['line']}, Tipo: {tipo}, Estereótipo: {estereotipo}"
+    return f"  {nome}", (nome, '', details)
+
+
+class LazySummaryTree:
+    """
+    Controla o preenchimento sob demanda do Treeview da tabela de síntese.
+
+    Cada nó com filhos recebe um "carregador" (função que gera as linhas
+    filhas) e um item provisório para exibir o indicador de expansão.
+    Ao abrir o nó, as linhas são geradas a partir do índice e inseridas
+    em blocos de CHUNK_SIZE entre ciclos do Tk.
+    """
+
+    CHUNK_SIZE = 500
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.index = {}
+        self.summary = None
+        self.keep = None        # id() dos construtos visíveis (None = todos)
+        self._loaders = {}      # iid -> função que gera as linhas filhas
+        self._loaded = {}       # iid já expandido -> chave -> (iid, valores)
+        self._generation = 0    # Invalida preenchimentos agendados de análises anteriores
+
+        self.tree.bind('<<TreeviewOpen>>', self._on_open, add='+')
+
+    def clear(self):
+        """Remove todos os nós"""
+        self._generation += 1
+        self.tree.delete(*self.tree.get_children())
+        self.index = {}
+        self.summary = None
+        self.keep = None
+        self._loaders = {}
+        self._loaded = {}
+
+    def update(self, summary, keep=None):
+        """
+        Exibe um novo resumo. Custo constante para nós fechados; nós que o
+        usuário já expandiu são atualizados no lugar, por comparação.
+
+        keep: conjunto opcional de id() dos construtos a exibir (filtro)
+        """
+        self._generation += 1
+        self.summary = summary
+        self.keep = keep
+        self.index = build_summary_index(summary, keep)
+
+        # Nós que estavam no meio de um preenchimento voltam a ficar fechados
+        for iid in list(self._loaded):
+            if self._loaded[iid] is None and self.tree.exists(iid):
+                self.tree.delete(*self.tree.get_children(iid))
+                self.tree.item(iid, open=False)
+                del self._loaded[iid]
+
+        self._sync_children('', self._category_rows())
+
+        # Descartar o estado de nós que deixaram de existir
+        self._loaders = {iid: loader for iid, loader in self._loaders.items()
+                         if self.tree.exists(iid)}
+        self._loaded = {iid: rows for iid, rows in self._loaded.items()
+                        if iid == '' or self.tree.exists(iid)}
+
+    # ========================================================================
+    # LINHAS DE CADA NÍVEL
+    # ========================================================================
+
+    def _items(self, category):
+        """Construtos da categoria que passam pelo filtro atual"""
+        items = self.summary[category]
+        if self.keep is None:
+            return items
+        return [item for item in items if id(item) in self.keep]
+
+    def _category_rows(self):
+        rows = []
+        for category, label in SUMMARY_CATEGORIES:
+            items = self._items(category)
+            if items:
+                rows.append((category, label, ('', len(items), ''),
+                             lambda c=category: self._group_rows(c)))
+
+        # A visão hierárquica não é filtrada pela busca de declarações
+        package_tree = self.summary['package_tree']
+        if package_tree and self.keep is None:
+            rows.append(('package_tree', PACKAGE_TREE_LABEL, ('', len(package_tree), ''),
+                         self._package_tree_rows))
+        return rows
+
+    def _package_tree_rows(self):
+        rows = []
+        occurrences = {}
+        for entry in self.summary['package_tree']:
+            name = entry['package']['name']
+            occurrence = occurrences.get(name, 0)
+            occurrences[name] = occurrence + 1
+
+            counts = entry['counts']
+            details = (f"{counts['attributes']} atributo(s), "
+                       f"{counts['internal_relations']} relação(ões) interna(s), "
+                       f"{counts['external_relations']} externa(s)")
+            rows.append(((name, occurrence), f"  📦 {name}", (name, counts['classes'], details),
+                         lambda e=entry: self._package_rows(e)))
+        return rows
+
+    def _package_rows(self, entry):
+        """Classes (com atributos e relações), demais construtos e relações externas"""
+        rows = []
+        for position, group in enumerate(entry['classes']):
+            text, values = summary_row('classes', group['class'])
+            loader = None
+            if group['attributes'] or group['relations']:
+                loader = lambda g=group: self._class_member_rows(g)
+            rows.append((('classes', position), text, values, loader))
+
+        for category in ('datatypes', 'enums', 'gensets'):
+            for position, item in enumerate(entry[category]):
+                text, values = summary_row(category, item)
+                rows.append(((category, position), text, values, None))
+
+        external = entry['external_relations']
+        if external:
+            rows.append(('external_relations', "  🔗 Relações externas", ('', len(external), ''),
+                         lambda: self._item_rows('relations', external)))
+        return rows
+
+    def _class_member_rows(self, group):
+        rows = []
+        for category, items in (('attributes', group['attributes']),
+                                ('relations', group['relations'])):
+            for position, item in enumerate(items):
+                text, values = summary_row(category, item)
+                rows.append(((category, position), text, values, None))
+        return rows
+
+    def _group_rows(self, category):
+        # Pacotes são listados diretamente
+        if category == 'packages':
+            return self._item_rows(category, self._items('packages'))
+
+        rows = []
+        for key, name, items in self.index.get(category, []):
+            rows.append((key, f"  📦 {name}", (name, len(items), ''),
+                         lambda c=category, i=items: self._item_rows(c, i)))
+        return rows
+
+    def _item_rows(self, category, items):
+        rows = []
+        for position, item in enumerate(items):
+            text, values = summary_row(category, item)
+            rows.append((position, text, values, None))
+        return rows
+
+    # ========================================================================
+    # SINCRONIZAÇÃO E EXPANSÃO
+    # ========================================================================
+
+    def _sync_children(self, parent, rows):
+        """Sincroniza os filhos de um nó já carregado (recursivo nos nós abertos)"""
+        previous = self._loaded.get(parent) or {}
+        state = sync_tree_rows(self.tree, parent, previous,
+                               [(key, text, values, ()) for key, text, values, _ in rows])
+        self._loaded[parent] = state
+
+        for key, _, _, loader in rows:
+            if loader is None:
+                continue
+            iid = state[key][0]
+            self._loaders[iid] = loader
+            if iid in self._loaded:
+                self._sync_children(iid, loader())
+            elif not self.tree.get_children(iid):
+                self.tree.insert(iid, tk.END, text=PLACEHOLDER_TEXT)
+
+    def _on_open(self, event):
+        iid = self.tree.focus()
+        if iid in self._loaded or iid not in self._loaders:
+            return
+
+        rows = self._loaders[iid]()
+        self.tree.delete(*self.tree.get_children(iid))
+
+        # None indica preenchimento em andamento
+        self._loaded[iid] = None
+        self._insert_chunk(iid, rows, 0, {}, self._generation)
+
+    def _insert_chunk(self, parent, rows, start, state, generation):
+        """Insere um bloco de filhos e agenda o próximo"""
+        if generation != self._generation or not self.tree.exists(parent):
+            return
+
+        for key, text, values, loader in rows[start:start + self.CHUNK_SIZE]:
+            iid = self.tree.insert(parent, tk.END, text=text, values=values)
+            state[key] = (iid, values)
+            if loader is not None:
+                self._loaders[iid] = loader
+                self.tree.insert(iid, tk.END, text=PLACEHOLDER_TEXT)
+
+        start += self.CHUNK_SIZE
+        if start < len(rows):
+            self.tree.after(1, self._insert_chunk, parent, rows, start, state, generation)
+        else:
+            self._loaded[parent] = state
@@ -0,0 +1,152 @@
+"""
+Tooltips (balõezinhos) da interface gráfica do analisador TONTO
+"""
+import tkinter as tk
+
+
+class ToolTip:
+    """
+    Tooltip com uma única janela persistente.
+
+    A janela é criada no primeiro uso e depois apenas escondida/mostrada,
+    em vez de ser destruída e recriada a cada movimento do mouse.
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.tip_window = None
+        self.label = None
+        self.text = ""
+        self.visible = False
+
+    def _create_window(self):
+        self.tip_window = tw = tk.Toplevel(self.widget)
+        tw.wm_overrideredirect(True)
+        tw.withdraw()
+
+        # Criar frame com borda
+        frame = tk.Frame(tw, background="#ffffe0", relief=tk.SOLID, borderwidth=1)
+        frame.pack()
+
+        # Texto com quebra de linha
+        self.label = tk.Label(frame, justify=tk.LEFT,
+                              background="#ffffe0", relief=tk.FLAT,
+                              font=("Arial", 9), wraplength=400, padx=8, pady=6)
+        self.label.pack()
+
+    def show_tip(self, text, x, y):
+        """Mostra o tooltip próximo à posição (x, y) da tela"""
+        if not text:
+            self.hide_tip()
+            return
+
+        if self.tip_window is None:
+            self._create_window()
+
+        if text != self.text:
+            self.text = text
+            self.label.config(text=text)
+
+        # Posicionar o tooltip próximo ao mouse
+        self.tip_window.wm_geometry(f"+{x + 20}+{y + 10}")
+        if not self.visible:
+            self.tip_window.deiconify()
+            self.tip_window.lift()
+            self.visible = True
+
+    def hide_tip(self):
+        """Esconde o tooltip (a janela é mantida para reutilização)"""
+        if self.visible:
+            self.tip_window.withdraw()
+            self.visible = False
+
+
+class TreeviewTooltip:
+    """
+    Mostra o texto completo de uma célula de Treeview ao passar o mouse.
+
+    Os eventos de movimento são agrupados (no máximo um processamento a
+    cada THROTTLE_MS) e o tooltip só é atualizado quando a célula sob o
+    mouse muda. Os valores de cada linha ficam em cache até invalidate().
+
+    row_values: função opcional iid -> tupla (texto, valor1, valor2, ...)
+                para tabelas cujos itens não guardam o texto completo
+                (ex.: VirtualTable); nesse caso o cache não é usado.
+    """
+
+    THROTTLE_MS = 50
+
+    def __init__(self, tree, min_length=40, row_values=None):
+        self.tree = tree
+        self.min_length = min_length
+        self.row_values = row_values
+        self.tip = ToolTip(tree)
+
+        self._row_cache = {}
+        self._current_cell = None
+        self._pending = None        # Último evento de movimento ainda não processado
+        self._after_id = None
+
+        self.tree.bind('<Motion>', self._on_motion, add='+')
+        self.tree.bind('<Leave>', lambda e: self.hide(), add='+')
+        # Rolagem muda o conteúdo sob o mouse sem movimento
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, lambda e: self.hide(), add='+')
+
+    def invalidate(self):
+        """Descarta o cache (chamar quando os valores das linhas mudarem)"""
+        self._row_cache.clear()
+        self.hide()
+
+    def hide(self):
+        self._current_cell = None
+        self.tip.hide_tip()
+
+    def _on_motion(self, event):
+        self._pending = (event.x, event.y, event.x_root, event.y_root)
+        if self._after_id is None:
+            self._after_id = self.tree.after(self.THROTTLE_MS, self._process_motion)
+
+    def _process_motion(self):
+        self._after_id = None
+        if self._pending is None:
+            return
+        x, y, x_root, y_root = self._pending
+        self._pending = None
+
+        region = self.tree.identify_region(x, y)
+        item = self.tree.identify_row(y) if region in ('cell', 'tree') else ''
+        if not item:
+            self.hide()
+            return
+
+        cell = (item, self.tree.identify_column(x))
+        if cell == self._current_cell:
+            return  # Mesma célula: nada a atualizar
+        self._current_cell = cell
+
+        text = self._cell_text(*cell)
+
+        # Mostrar tooltip apenas se o texto for longo
+        if text and len(text) > self.min_length:
+            self.tip.show_tip(text, x_root, y_root)
+        else:
+            self.tip.hide_tip()
+
+    def _cell_text(self, item, column):
+        """Texto completo da célula; coluna '#0' é o texto da árvore"""
+        if self.row_values is not None:
+            values = self.row_values(item)
+        else:
+            values = self._row_cache.get(item)
+            if values is None:
+                values = (self.tree.item(item, 'text'),) + tuple(self.tree.item(item, 'values'))
+                self._row_cache[item] = values
+
+        try:
+            index = int(column.lstrip('#'))
+        except ValueError:
+            return ""
+        if values is None or index >= len(values):
+            return ""
+        return str(values[index]).strip()
@@ -0,0 +1,37 @@
+"""
+Atualização incremental de itens de um ttk.Treeview
+"""
+
+
+def sync_tree_rows(tree, parent, previous, rows):
+    """
+    Atualiza os filhos de parent para refletir rows sem recriar itens inalterados.
+
+    previous: dicionário chave -> (iid, valores) devolvido na chamada anterior
+    rows: lista ordenada de (chave, texto, valores, tags)
+    Retorna o novo dicionário chave -> (iid, valores).
+    """
+    new_keys = {row[0] for row in rows}
+
+    # Inserir por posição só funciona se os itens mantidos não mudaram de ordem
+    kept_old = [key for key in previous if key in new_keys]
+    kept_new = [row[0] for row in rows if row[0] in previous]
+    if kept_old != kept_new:
+        tree.delete(*(iid for iid, _ in previous.values()))
+        previous = {}
+    else:
+        removed = [iid for key, (iid, _) in previous.items() if key not in new_keys]
+        if removed:
+            tree.delete(*removed)
+
+    current = {}
+    for position, (key, text, values, tags) in enumerate(rows):
+        entry = previous.get(key)
+        if entry is None:
+            iid = tree.insert(parent, position, text=text, values=values, tags=tags)
+        else:
+            iid = entry[0]
+            if entry[1] != values:
+                tree.item(iid, text=text, values=values)
+        current[key] = (iid, values)
+    return current
@@ -0,0 +1,259 @@
+"""
+Tabela virtualizada para a interface gráfica do analisador TONTO
+Exibe grandes volumes de linhas materializando apenas as que estão visíveis
+"""
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualTable:
+    """
+    Treeview virtualizada.
+
+    Os dados ficam em uma lista Python comum e apenas as linhas que cabem
+    na área visível existem como itens do Tk. Ao rolar, os mesmos itens são
+    reaproveitados com novos valores, então o custo de exibição não depende
+    do tamanho da lista.
+    """
+
+    DEFAULT_ROW_HEIGHT = 20
+    DEFAULT_HEADER_HEIGHT = 24
+
+    def __init__(self, parent, columns, row_formatter, sort_keys=None):
+        """
+        columns: lista de tuplas (id, título, largura)
+        row_formatter: função item -> (valores, tags) chamada só para linhas visíveis
+        sort_keys: dicionário id_coluna -> função item -> chave de ordenação
+        """
+        self.row_formatter = row_formatter
+        self.sort_keys = sort_keys or {}
+        self.headings = {}
+
+        self.data = []
+        self.order = None           # Permutação após ordenação (None = ordem original)
+        self.offset = 0             # Índice da primeira linha visível
+        self.visible_rows = 1
+        self.selected = None        # Índice (na ordem exibida) da linha selecionada
+        self.sort_column = None
+        self.sort_reverse = False
+        self._items = []            # Itens do Tk reaproveitados entre rolagens
+
+        self.frame = tk.Frame(parent, bg="white")
+
+        column_ids = [col_id for col_id, _, _ in columns]
+        self.tree = ttk.Treeview(self.frame, columns=column_ids,
+                                 show='headings', height=10, selectmode='browse')
+
+        for col_id, title, width in columns:
+            self.headings[col_id] = title
+            self.tree.heading(col_id, text=title,
+                              command=lambda c=col_id: self.sort_by(c))
+            self.tree.column(col_id, width=width)
+
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL,
+                                       command=self._on_scrollbar)
+
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0), pady=5)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=5, padx=(0, 5))
+
+        # Eventos de redimensionamento, rolagem e navegação por teclado
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self._scroll_units(-3))
+        self.tree.bind('<Button-5>', lambda e: self._scroll_units(3))
+        self.tree.bind('<Up>', lambda e: self._move_selection(-1))
+        self.tree.bind('<Down>', lambda e: self._move_selection(1))
+        self.tree.bind('<Prior>', lambda e: self._move_selection(-self.visible_rows))
+        self.tree.bind('<Next>', lambda e: self._move_selection(self.visible_rows))
+        self.tree.bind('<Home>', lambda e: self._move_selection(-len(self)))
+        self.tree.bind('<End>', lambda e: self._move_selection(len(self)))
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+
+    def pack(self, **kwargs):
+        """Posiciona o frame da tabela"""
+        self.frame.pack(**kwargs)
+
+    def tag_configure(self, tag, **kwargs):
+        """Configura a aparência de uma tag das linhas"""
+        self.tree.tag_configure(tag, **kwargs)
+
+    def __len__(self):
+        return len(self.data)
+
+    # ========================================================================
+    # DADOS
+    # ========================================================================
+
+    def set_data(self, data):
+        """Substitui os dados exibidos (a lista não é copiada)"""
+        self.data = data
+        self.order = None
+        self.offset = 0
+        self.selected = None
+        self.sort_column = None
+        self.sort_reverse = False
+        self._update_headings()
+        self._refresh()
+
+    def clear(self):
+        """Remove todas as linhas"""
+        self.set_data([])
+
+    def row_at(self, index):
+        """Retorna o item exibido na posição index (considerando a ordenação)"""
+        if self.order is not None:
+            return self.data[self.order[index]]
+        return self.data[index]
+
+    def index_of(self, data_index):
+        """Converte um índice da lista original para a posição exibida"""
+        if self.order is None:
+            return data_index
+        return self.order.index(data_index)
+
+    def values_for_item(self, iid):
+        """
+        Valores da linha exibida em um item do Tk, no formato (texto, valor1, ...).
+        Os itens são reaproveitados na rolagem, então o valor é sempre recalculado.
+        """
+        if iid not in self._items:
+            return None
+        values, _ = self.row_formatter(self.row_at(self.offset + self._items.index(iid)))
+        return ('',) + tuple(values)
+
+    def selected_item(self):
+        """Retorna o item selecionado ou None"""
+        if self.selected is None or self.selected >= len(self.data):
+            return None
+        return self.row_at(self.selected)
+
+    def see(self, index):
+        """Rola até a posição index e a seleciona"""
+        if not self.data:
+            return
+        index = max(0, min(index, len(self.data) - 1))
+        self.selected = index
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + self.visible_rows:
+            self.offset = index - self.visible_rows + 1
+        self._refresh()
+
+    def sort_by(self, column):
+        """Ordena pela coluna clicada; um segundo clique inverte a ordem"""
+        key = self.sort_keys.get(column)
+        if key is None or not self.data:
+            return
+
+        if self.sort_column == column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+
+        data = self.data
+        self.order = sorted(range(len(data)), key=lambda i: key(data[i]),
+                            reverse=self.sort_reverse)
+        self.offset = 0
+        self.selected = None
+        self._update_headings()
+        self._refresh()
+
+    def _update_headings(self):
+        """Indica a coluna e o sentido da ordenação no cabeçalho"""
+        for col_id, title in self.headings.items():
+            if col_id == self.sort_column:
+                title = f"{title} {'▼' if self.sort_reverse else '▲'}"
+            self.tree.heading(col_id, text=title)
+
+    # ========================================================================
+    # RENDERIZAÇÃO
+    # ========================================================================
+
+    def _refresh(self):
+        """Atualiza os itens visíveis a partir de self.offset"""
+        total = len(self.data)
+        max_offset = max(0, total - self.visible_rows)
+        self.offset = max(0, min(self.offset, max_offset))
+
+        needed = min(self.visible_rows, total - self.offset)
+
+        # Ajustar a quantidade de itens reaproveitáveis
+        while len(self._items) < needed:
+            self._items.append(self.tree.insert('', tk.END))
+        while len(self._items) > needed:
+            self.tree.delete(self._items.pop())
+
+        for position, iid in enumerate(self._items):
+            values, tags = self.row_formatter(self.row_at(self.offset + position))
+            self.tree.item(iid, values=values, tags=tags)
+
+        # Reaplicar a seleção apenas se a linha selecionada estiver visível
+        if self.selected is not None and self.offset <= self.selected < self.offset + needed:
+            iid = self._items[self.selected - self.offset]
+            self.tree.selection_set(iid)
+            self.tree.focus(iid)
+        elif self.tree.selection():
+            self.tree.selection_set(())
+
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + needed) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _measure_rows(self):
+        """Calcula quantas linhas cabem na altura atual do widget"""
+        row_height = self.DEFAULT_ROW_HEIGHT
+        header_height = self.DEFAULT_HEADER_HEIGHT
+
+        # Usar a geometria real do primeiro item quando disponível
+        if self._items:
+            bbox = self.tree.bbox(self._items[0])
+            if bbox:
+                header_height, row_height = bbox[1], bbox[3]
+
+        height = self.tree.winfo_height()
+        return max(1, (height - header_height) // max(1, row_height))
+
+    # ========================================================================
+    # EVENTOS
+    # ========================================================================
+
+    def _on_configure(self, event):
+        rows = self._measure_rows()
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self._refresh()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        total = len(self.data)
+        if action == 'moveto':
+            self.offset = int(float(amount) * total)
+        elif action == 'scroll':
+            step = self.visible_rows if unit == 'pages' else 1
+            self.offset += int(amount) * step
+        self._refresh()
+
+    def _on_mousewheel(self, event):
+        # Windows usa múltiplos de 120; macOS envia valores pequenos
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self._scroll_units(-3 * delta)
+        return 'break'
+
+    def _scroll_units(self, units):
+        self.offset += units
+        self._refresh()
+        return 'break'
+
+    def _move_selection(self, step):
+        if not self.data:
+            return 'break'
+        current = self.selected if self.selected is not None else self.offset - (1 if step > 0 else 0)
+        self.see(current + step)
+        return 'break'
+
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        # Seleções vazias vêm da própria rolagem e não devem apagar o estado
+        if selection and selection[0] in self._items:
+            self.selected = self.offset + self._items.index(selection[0])
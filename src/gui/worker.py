@@ -0,0 +1,116 @@
+"""
+Execução da análise em segundo plano para a interface gráfica
+A thread de trabalho nunca toca nos widgets: ela apenas publica mensagens
+em uma fila que a GUI consulta periodicamente com root.after
+"""
+import queue
+import threading
+
+from ..analise.analyzer import TontoAnalyzer, AnalysisCancelled
+from ..analise.incremental import IncrementalAnalyzer
+from ..analise.indexes import TokenIndex, build_declaration_trie
+from ..analise.mapped_file import MappedFile
+
+
+class AnalysisWorker:
+    """
+    Thread de análise com léxico e parser pré-construídos.
+
+    Mensagens publicadas em self.messages (sempre tuplas iniciadas pelo id do job):
+        (job_id, 'progresso', fase, fração)
+        (job_id, 'arquivo', MappedFile)      apenas em submit_file, antes da análise
+        (job_id, 'concluido', resultado)
+        (job_id, 'cancelado')                também para um job cancelado ainda na fila
+        (job_id, 'erro', exceção)
+
+    Cada job tem o próprio evento de cancelamento: um cancel() feito
+    enquanto o job ainda espera na fila (ex.: durante a construção do
+    léxico e do parser) não se perde quando ele começa.
+    """
+
+    def __init__(self):
+        self.messages = queue.Queue()
+        self._jobs = queue.Queue()
+        self._cancel_event = threading.Event()     # Do job agendado mais recente
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="tonto-analysis",
+                                        daemon=True)
+
+    def start(self):
+        """
+        Inicia a thread, que já constrói léxico e parser. A interface chama
+        depois que a janela aparece, para não disputar com a montagem dos widgets.
+        """
+        if self._thread.ident is None:
+            self._thread.start()
+
+    def submit(self, job_id, source, incremental=False):
+        """
+        Agenda a análise de um código; cancela a que estiver em andamento.
+        Com incremental=True apenas os trechos alterados desde a última
+        análise incremental são reanalisados (modo ao vivo).
+        """
+        self._schedule(job_id, 'incremental' if incremental else 'codigo', source)
+
+    def submit_file(self, job_id, path):
+        """
+        Agenda a análise de um arquivo lido direto do disco (mmap).
+        O MappedFile criado é publicado antes da análise para que a GUI
+        possa exibir trechos do arquivo enquanto ela acontece.
+        """
+        self._schedule(job_id, 'arquivo', path)
+
+    def cancel(self):
+        """Pede a interrupção cooperativa da análise em andamento (ou agendada)"""
+        with self._lock:
+            self._cancel_event.set()
+
+    def _schedule(self, job_id, kind, payload):
+        """Enfileira um job com evento próprio, cancelando o anterior"""
+        with self._lock:
+            self._cancel_event.set()
+            self._cancel_event = threading.Event()
+            self._jobs.put((job_id, kind, payload, self._cancel_event))
+        self.start()
+
+    def _run(self):
+        # As tabelas do PLY são construídas uma única vez, na própria thread
+        analyzer = TontoAnalyzer()
+        analyzer.warm_up()
+        incremental_analyzer = IncrementalAnalyzer(analyzer)
+
+        while True:
+            job_id, kind, payload, cancel_event = self._jobs.get()
+
+            # Só o job mais recente interessa
+            while not self._jobs.empty():
+                job_id, kind, payload, cancel_event = self._jobs.get()
+            if cancel_event.is_set():
+                self.messages.put((job_id, 'cancelado'))
+                continue
+
+            target = incremental_analyzer if kind == 'incremental' else analyzer
+
+            def progress(phase, fraction, job_id=job_id):
+                self.messages.put((job_id, 'progresso', phase, fraction))
+
+            try:
+                if kind == 'arquivo':
+                    mapped = MappedFile(payload)
+                    self.messages.put((job_id, 'arquivo', mapped))
+                    source = mapped.read_text()
+                else:
+                    source = payload
+                result = target.analyze(source, progress=progress,
+                                        cancel_event=cancel_event)
+
+                # Índices dos filtros também são montados fora da thread do Tk
+                if 'tokens' in result:
+                    result['token_index'] = TokenIndex(result['tokens'])
+                result['declaration_trie'] = build_declaration_trie(result['summary'])
+            except AnalysisCancelled:
+                self.messages.put((job_id, 'cancelado'))
+            except Exception as e:
+                self.messages.put((job_id, 'erro', e))
+            else:
+                self.messages.put((job_id, 'concluido', result))
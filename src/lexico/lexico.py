@@ -1,8 +1,59 @@
 """
 Analisador Léxico para a linguagem TONTO
+
+O PLY só é importado em build(): quem precisa apenas das categorias de
+token (ex.: a interface ao exibir a tabela) não paga a importação.
 """
-import ply.lex as lex
-from .tokens import *
+from .names import NAMES
+from .tokens import (CLASS_STEREOTYPES, META_ATTRIBUTES, NATIVE_TYPES, RELATION_STEREOTYPES,
+                     RESERVED, RESERVED_WORDS, TOKENS)
+
+
+def _build_token_categories():
+    """
+    Pré-calcula (categoria, notificação) de cada tipo de token.
+    Evita percorrer os dicionários de palavras reservadas a cada token exibido.
+    """
+    categories = {}
+    for token_type in CLASS_STEREOTYPES.values():
+        categories[token_type] = ("Estereótipo de Classe", "OK")
+    for token_type in RELATION_STEREOTYPES.values():
+        categories[token_type] = ("Estereótipo de Relação", "OK")
+    for token_type in RESERVED_WORDS.values():
+        categories[token_type] = ("Palavra Reservada", "OK")
+    for token_type in NATIVE_TYPES.values():
+        categories[token_type] = ("Tipo de Dado Nativo", "OK")
+    for token_type in META_ATTRIBUTES.values():
+        categories[token_type] = ("Meta-atributo", "OK")
+
+    categories.update({
+        'CLASS_NAME': ("Nome de Classe", "OK"),
+        'RELATION_NAME': ("Nome de Relação", "OK"),
+        'INSTANCE_NAME': ("Nome de Instância", "OK"),
+        'CUSTOM_DATATYPE': ("Tipo de Dado Customizado", "OK"),
+        'INVALID_CLASS_NAME': ("Erro", "Nome de classe inválido: não deve conter números"),
+        'INVALID_RELATION_NAME': ("Erro", "Nome de relação inválido: não deve conter números"),
+        'INVALID_DATATYPE': ("Erro", "Tipo customizado inválido: não deve conter números ou sublinhado"),
+        'COMMENT': ("Comentário", "OK"),
+        'INTEGER': ("Literal Numérico", "OK"),
+    })
+    return categories
+
+
+def lexical_error(token):
+    """Erro léxico (token de t_error) no formato de dicionário dos diagnósticos"""
+    return {
+        'linha': token.lineno,
+        'coluna': token.lexpos,
+        'tipo': 'Erro Léxico',
+        'mensagem': f"Caractere inválido: '{token.value[0]}'",
+        'sugestao': "Remova ou substitua este caractere por um símbolo válido",
+    }
+
+
+# Tabela tipo de token -> (categoria, notificação)
+TOKEN_CATEGORIES = _build_token_categories()
+DEFAULT_CATEGORY = ("Símbolo Especial", "OK")
 
 class TontoLexer:
     """Analisador léxico da linguagem TONTO"""
@@ -12,9 +63,16 @@ class TontoLexer:
         self.reserved = RESERVED
         self.lexer = None
         self.errors = []
+        # Em streaming, função que recebe cada erro léxico no lugar de self.errors
+        self.error_handler = None
+        # Comentários (linha, posição, texto), guardados fora do fluxo de tokens
+        self.comments = []
+        # Tabela de internação dos nomes (ver names.py)
+        self.names = NAMES
 
     def build(self, **kwargs):
         """Constrói o lexer"""
+        import ply.lex as lex
         self.lexer = lex.lex(module=self, **kwargs)
         return self.lexer
 
@@ -39,17 +97,22 @@ class TontoLexer:
 
     def t_COMMENT(self, t):
         r'\#.*'
-        pass  # Comentários são ignorados, não passados para o parser
+        # Comentários não são passados para o parser, mas ficam registrados
+        # para ferramentas que reescrevem o código (ex.: formatador)
+        self.comments.append((t.lineno, t.lexpos, t.value))
 
     # Números inteiros (para cardinalidades)
     def t_INTEGER(self, t):
         r'\d+'
+        # Fim do texto original, que o valor convertido não preserva (ex.: "007")
+        t.endlexpos = t.lexpos + len(t.value)
         t.value = int(t.value)
         return t
 
     # Custom DataType: inicia com letra, sem números, sem sublinhado, termina com "DataType"
     def t_CUSTOM_DATATYPE(self, t):
         r'[a-zA-Z][a-zA-Z]*DataType'
+        t.value = self.names.intern(t.value)
         # Validar que não contém números ou sublinhado
         if '_' in t.value or any(c.isdigit() for c in t.value[:-8]):
             t.type = 'INVALID_DATATYPE'
@@ -58,11 +121,13 @@ class TontoLexer:
     # Nome de instância: inicia com letra, pode ter sublinhado, termina com número
     def t_INSTANCE_NAME(self, t):
         r'[a-zA-Z][a-zA-Z_]*[0-9]+'
+        t.value = self.names.intern(t.value)
         return t
 
     # Nome de classe: inicia com maiúscula, seguido por letras ou sublinhado, sem números
     def t_CLASS_NAME(self, t):
         r'[A-Z][a-zA-Z_]*'
+        t.value = self.names.intern(t.value)
         # Validar que não contém números
         if any(c.isdigit() for c in t.value):
             t.type = 'INVALID_CLASS_NAME'
@@ -74,6 +139,7 @@ class TontoLexer:
     # Nome de relação: inicia com minúscula, seguido por letras ou sublinhado, sem números
     def t_RELATION_NAME(self, t):
         r'[a-z][a-zA-Z_\-]*'
+        t.value = self.names.intern(t.value)
         # Validar que não contém números
         if any(c.isdigit() for c in t.value):
             t.type = 'INVALID_RELATION_NAME'
@@ -90,12 +156,20 @@ class TontoLexer:
     # Tratamento de erros léxicos
     def t_error(self, t):
         """Tratamento de erros léxicos"""
-        self.errors.append(t)
+        # O PLY entrega todo o resto do código em t.value: guardar isso em
+        # cada erro custaria memória quadrática em arquivos muito quebrados
+        t.value = t.value[0]
+        if self.error_handler is None:
+            self.errors.append(t)
+        else:
+            self.error_handler(t)
         t.lexer.skip(1)
 
     def tokenize(self, data):
         """Tokeniza o código fonte"""
         self.errors.clear()
+        self.comments.clear()
+        self.lexer.lineno = 1
         self.lexer.input(data)
         tokens = []
 
@@ -106,54 +180,7 @@ class TontoLexer:
 
     def get_token_info(self, token):
         """Retorna informações sobre um token para exibição"""
-        categoria = ""
-        notificacao = ""
-
-        if token.type in CLASS_STEREOTYPES.values():
-            categoria = "Estereótipo de Classe"
-            notificacao = "OK"
-        elif token.type in RELATION_STEREOTYPES.values():
-            categoria = "Estereótipo de Relação"
-            notificacao = "OK"
-        elif token.type in RESERVED_WORDS.values():
-            categoria = "Palavra Reservada"
-            notificacao = "OK"
-        elif token.type in NATIVE_TYPES.values():
-            categoria = "Tipo de Dado Nativo"
-            notificacao = "OK"
-        elif token.type in META_ATTRIBUTES.values():
-            categoria = "Meta-atributo"
-            notificacao = "OK"
-        elif token.type == 'CLASS_NAME':
-            categoria = "Nome de Classe"
-            notificacao = "OK"
-        elif token.type == 'RELATION_NAME':
-            categoria = "Nome de Relação"
-            notificacao = "OK"
-        elif token.type == 'INSTANCE_NAME':
-            categoria = "Nome de Instância"
-            notificacao = "OK"
-        elif token.type == 'CUSTOM_DATATYPE':
-            categoria = "Tipo de Dado Customizado"
-            notificacao = "OK"
-        elif token.type == 'INVALID_CLASS_NAME':
-            categoria = "Erro"
-            notificacao = "Nome de classe inválido: não deve conter números"
-        elif token.type == 'INVALID_RELATION_NAME':
-            categoria = "Erro"
-            notificacao = "Nome de relação inválido: não deve conter números"
-        elif token.type == 'INVALID_DATATYPE':
-            categoria = "Erro"
-            notificacao = "Tipo customizado inválido: não deve conter números ou sublinhado"
-        elif token.type == 'COMMENT':
-            categoria = "Comentário"
-            notificacao = "OK"
-        elif token.type == 'INTEGER':
-            categoria = "Literal Numérico"
-            notificacao = "OK"
-        else:
-            categoria = "Símbolo Especial"
-            notificacao = "OK"
+        categoria, notificacao = TOKEN_CATEGORIES.get(token.type, DEFAULT_CATEGORY)
 
         return {
             'linha': token.lineno,
@@ -163,3 +190,8 @@ class TontoLexer:
             'notificacao': notificacao,
             'categoria': categoria
         }
+
+    @staticmethod
+    def get_token_category(token_type):
+        """Retorna apenas a categoria de um tipo de token (consulta O(1))"""
+        return TOKEN_CATEGORIES.get(token_type, DEFAULT_CATEGORY)[0]
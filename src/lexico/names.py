@@ -0,0 +1,86 @@
+"""
+Tabela de nomes (internação) compartilhada pelo léxico e pelo parser
+
+Cada nome lido do código (classes, relações, instâncias, tipos e palavras
+reservadas) é trocado pelo objeto canônico da tabela. Um mesmo nome
+repetido em tokens, declarações, listas de pais, gensets e em todos os
+arquivos de uma pasta passa a ocupar memória uma única vez, e nomes
+iguais podem ser comparados por identidade (a is b).
+
+A tabela NAMES é do processo inteiro e só cresce, até MAX_NAMES: um nome
+internado continua válido enquanto o processo existir.
+Depois do limite, nomes novos voltam sem internação (iguais por ==, mas
+não por identidade), e a memória deixa de crescer. Quem lexa texto que não
+vira resultado guardado (realce de sintaxe, serviço HTTP) usa uma tabela
+própria: NameTable(max_names=0) não guarda nada.
+"""
+
+
+class NameTable:
+    """
+    Nome -> objeto canônico.
+    max_names limita quantos nomes são guardados (None: sem limite).
+    """
+
+    def __init__(self, max_names=None):
+        self.max_names = max_names
+        self._names = {}        # nome -> objeto canônico
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def intern(self, name):
+        """
+        Objeto canônico de name (o próprio name na primeira vez, ou sempre
+        que a tabela já está cheia)
+        """
+        canonical = self._names.get(name)
+        if canonical is None:
+            if self.max_names is not None and len(self._names) >= self.max_names:
+                return name
+            canonical = self._names.setdefault(name, name)
+        return canonical
+
+    def intern_tokens(self, tokens):
+        """Troca os valores textuais dos tokens pelos canônicos (ex.: após unpickle)"""
+        intern = self.intern
+        for token in tokens:
+            if token.value.__class__ is str:
+                token.value = intern(token.value)
+
+    def intern_tree(self, obj, memo=None):
+        """
+        Troca, no lugar, as strings de uma estrutura de dicts e listas pelas
+        canônicas. Usado com resultados que chegam de outro processo, cujas
+        strings são cópias criadas pelo pickle.
+        """
+        if memo is None:
+            memo = set()
+        if id(obj) in memo:
+            return
+        memo.add(id(obj))
+
+        intern = self.intern
+        if obj.__class__ is dict:
+            for key, value in obj.items():
+                if value.__class__ is str:
+                    obj[key] = intern(value)
+                elif value.__class__ in (dict, list):
+                    self.intern_tree(value, memo)
+        elif obj.__class__ is list:
+            for index, value in enumerate(obj):
+                if value.__class__ is str:
+                    obj[index] = intern(value)
+                elif value.__class__ in (dict, list):
+                    self.intern_tree(value, memo)
+
+
+# Máximo de nomes da tabela do processo
+MAX_NAMES = 500_000
+
+# Tabela do processo, usada pelo léxico, pelo parser e pela análise de pastas
+NAMES = NameTable(MAX_NAMES)
+intern = NAMES.intern
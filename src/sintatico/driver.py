@@ -0,0 +1,260 @@
+"""
+Driver LR sobre as tabelas compactas de tables.py
+
+Substitui o laço genérico do ply.yacc na análise do TONTO: as ações e
+desvios são lidos de arrays de inteiros, os símbolos da pilha são apenas
+valores (sem um YaccSymbol por token ou redução) e um único objeto de
+produção é reaproveitado em todas as chamadas das regras p_*. Regras que
+só repassam o valor (p[0] = p[1]) nem chegam a ser chamadas.
+
+O comportamento é o do PLY sem rastreamento de posições (tracking=False):
+mesmas reduções padrão sem lookahead, mesma chamada de p_error e mesma
+recuperação de erros.
+
+Mesmo assim, todo nó (dict) devolvido por uma regra recebe 'span':
+(início, fim) em offsets do código. A pilha de posições guarda o próprio
+token para terminais, o offset de início para não terminais e None para
+não terminais vazios (sem posição), então um empilhamento não custa nada a
+mais. O início de uma redução é o do primeiro filho não vazio e o fim é
+sempre o fim do último token empilhado, calculado só quando a regra
+devolve um nó. Um nó sem filhos não vazios recebe um span vazio.
+A conversão para linha e coluna fica para quem precisar (ver
+analise/spans.py).
+"""
+from .tables import ACCEPT
+
+
+# Tokens que precisam ser empilhados sem erro antes que um novo erro seja reportado
+ERROR_COUNT = 3
+
+
+class _Symbol:
+    """Lookahead especial ($end ou error), no formato de um token"""
+
+    __slots__ = ('type', 'value', 'lineno', 'lexpos')
+
+    def __init__(self, type, value=None, lineno=0, lexpos=0):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+def token_end(tok):
+    """Offset logo após o token (valores convertidos pelo léxico trazem endlexpos)"""
+    value = tok.value
+    return tok.lexpos + len(value) if value.__class__ is str else tok.endlexpos
+
+
+class Production(list):
+    """
+    Argumento p das regras p_*: p[0] é o resultado, p[1..n] os valores
+    do lado direito. Reaproveitado em todas as reduções de uma análise.
+    """
+
+    __slots__ = ('positions', 'last')
+
+    def lineno(self, n):
+        """Linha do n-ésimo símbolo (0 para não terminais, como no PLY)"""
+        if n <= 0:
+            return 0
+        positions = self.positions
+        position = positions[len(positions) - len(self) + n]
+        return 0 if position is None or position.__class__ is int else position.lineno
+
+    def lexpos(self, n):
+        """Offset de início do n-ésimo símbolo, terminal ou não (None se vazio)"""
+        positions = self.positions
+        position = positions[len(positions) - len(self) + n]
+        return position if position is None or position.__class__ is int else position.lexpos
+
+    def span(self):
+        """
+        (início, fim) da redução em andamento: o mesmo span que o driver
+        grava no nó depois da regra, disponível já dentro dela
+        """
+        end = token_end(self.last)
+        positions = self.positions
+        start = _first_position(positions, len(positions) - len(self) + 1)
+        return (end if start is None else start, end)
+
+
+def _first_position(positions, first):
+    """Offset de início do primeiro símbolo não vazio de positions[first:]"""
+    for index in range(first, len(positions)):
+        position = positions[index]
+        if position is not None:
+            return position if position.__class__ is int else position.lexpos
+    return None
+
+
+class LRDriver:
+    """Analisador LR dirigido pelas tabelas de compile_tables"""
+
+    def __init__(self, tables, errorfunc):
+        self.tables = tables
+        self.errorfunc = errorfunc
+        self.errorok = True
+
+        # Cópias em listas das tabelas consultadas a cada passo: indexar uma
+        # lista devolve o int já existente, enquanto o array cria um novo
+        self._table = tables['table'].tolist()
+        self._rule_goto = tables['rule_goto'].tolist()
+        self._rule_len = tables['rule_len'].tolist()
+        self._rule_pass = tables['rule_pass'].tolist()
+
+    def errok(self):
+        """Chamado por p_error para indicar que a recuperação foi tratada"""
+        self.errorok = True
+
+    def parse(self, tokens):
+        """
+        Analisa os tokens de um iterável (ex.: iter(lexer.token, None))
+        e retorna o valor da regra inicial, ou None se a análise não terminar.
+        """
+        tables = self.tables
+        table = self._table
+        rule_goto = self._rule_goto
+        rule_len = self._rule_len
+        rule_pass = self._rule_pass
+        rule_action = tables['rule_action']
+        token_ids = tables['token_ids']
+        unknown = tables['unknown']
+        default_column = tables['default_column']
+        error_id = unknown      # O token 'error' nunca tem ação: mesma coluna dos desconhecidos
+        errorfunc = self.errorfunc
+        tokens = iter(tokens)
+
+        eof = _Symbol('$end')
+        # Pilhas paralelas: deslocamento do estado, valor e posição de cada
+        # símbolo (o token, ou o offset de início de um não terminal)
+        statestack = [0]
+        valstack = [None]
+        posstack = [0]
+        p = Production()
+        p.positions = posstack
+        empty = (None,)
+        last = _Symbol('$start', '')     # Último token empilhado: fim dos spans
+
+        lookahead = None
+        lookahead_id = 0
+        lookaheadstack = []
+        errorcount = 0
+        state = 0
+
+        while True:
+            t = table[state + default_column]
+            if not t:
+                if lookahead is None:
+                    lookahead = lookaheadstack.pop() if lookaheadstack else next(tokens, None)
+                    if lookahead is None:
+                        lookahead = eof
+                        lookahead_id = 0
+                    else:
+                        try:
+                            lookahead_id = token_ids[lookahead.type]
+                        except KeyError:
+                            lookahead_id = unknown
+                t = table[state + lookahead_id]
+
+            if t < 0:
+                # Redução: os símbolos do lado direito são trocados pelo resultado
+                if rule_pass[-t]:
+                    # p[0] = p[1]: o valor fica onde está, só o estado muda
+                    state = table[statestack[-2] + rule_goto[-t]]
+                    statestack[-1] = state
+                    start = posstack[-1]
+                    if start is not None and start.__class__ is not int:
+                        posstack[-1] = start.lexpos
+                    continue
+                length = rule_len[-t]
+                if length:
+                    p[:] = valstack[-length - 1:]
+                    p[0] = None
+                    p.last = last
+                    rule_action[-t](p)
+                    value = p[0]
+                    start = posstack[-length]
+                    if start is None:
+                        # Primeiro filho vazio: começa no primeiro não vazio
+                        start = _first_position(posstack, len(posstack) - length)
+                    elif start.__class__ is not int:
+                        start = start.lexpos
+                    if value.__class__ is dict:
+                        tail = last.value      # token_end(last), sem a chamada
+                        end = (last.lexpos + len(tail) if tail.__class__ is str
+                               else last.endlexpos)
+                        value['span'] = (end if start is None else start, end)
+                    state = table[statestack[-length - 1] + rule_goto[-t]]
+                    statestack[-length:] = (state,)
+                    valstack[-length:] = (value,)
+                    posstack[-length:] = (start,)
+                else:
+                    p[:] = empty
+                    p.last = last
+                    rule_action[-t](p)
+                    value = p[0]
+                    # Regra vazia: sem posição na pilha (não puxa o início do
+                    # pai para trás); um nó recebe span vazio após o último token
+                    if value.__class__ is dict:
+                        end = token_end(last)
+                        value['span'] = (end, end)
+                    state = table[state + rule_goto[-t]]
+                    statestack.append(state)
+                    valstack.append(value)
+                    posstack.append(None)
+                continue
+
+            if t > ACCEPT:
+                # Empilhamento
+                statestack.append(t)
+                valstack.append(lookahead.value)
+                posstack.append(lookahead)
+                last = lookahead
+                state = t
+                lookahead = None
+                if errorcount:
+                    errorcount -= 1
+                continue
+
+            if t == ACCEPT:
+                return valstack[-1]
+
+            # Erro sintático: p_error é chamado para o primeiro erro e, depois,
+            # só quando a regra anterior chamou errok() ou após ERROR_COUNT empilhamentos
+            if errorcount == 0 or self.errorok:
+                errorcount = ERROR_COUNT
+                self.errorok = False
+                tok = errorfunc(None if lookahead is eof else lookahead)
+                if self.errorok:
+                    # p_error tratou o erro: o token retornado (se houver) vira o lookahead
+                    lookahead = tok
+                    if tok is not None:
+                        lookahead_id = token_ids.get(tok.type, unknown)
+                    continue
+            else:
+                errorcount = ERROR_COUNT
+
+            if len(statestack) <= 1 and lookahead is not eof:
+                # Pilha vazia: descarta o token e recomeça do estado inicial
+                lookahead = None
+                state = 0
+                del lookaheadstack[:]
+                continue
+
+            if lookahead is eof:
+                return None
+
+            if lookahead.type != 'error':
+                # Token de erro no lugar do lookahead, que volta para a fila
+                lookaheadstack.append(lookahead)
+                lookahead = _Symbol('error', lookahead,
+                                    getattr(lookahead, 'lineno', 0),
+                                    getattr(lookahead, 'lexpos', 0))
+                lookahead_id = error_id
+            else:
+                # Desempilha até um estado que aceite o token de erro
+                statestack.pop()
+                valstack.pop()
+                posstack.pop()
+                state = statestack[-1]
@@ -0,0 +1,192 @@
+"""
+Eventos da análise sintática (API no estilo SAX)
+
+O parser chama um método do handler assim que a redução correspondente
+termina: on_attribute e on_relation (internas) antes do on_class da
+classe que os contém, e as declarações de um pacote antes do on_package.
+Cada nó é entregue completo (com 'line' e 'span'), mas só o handler
+decide o que guardar: em uma análise em streaming o parser não monta as
+listas de declarações, pacotes e imports, e a memória fica constante
+qualquer que seja o tamanho do modelo.
+
+Exemplo:
+    counts = Counter()
+    parser.parse_tokens(tokens, handler=Callbacks(
+        on_class=lambda info: counts.update([info['stereotype']])))
+"""
+
+
+class ParseHandler:
+    """Handler que ignora todos os eventos; subclasses sobrescrevem os que usam"""
+
+    def on_import(self, info):
+        """import Modulo"""
+
+    def on_package(self, info):
+        """Fim de um pacote (em streaming, 'declarations' vem vazio)"""
+
+    def on_class(self, info):
+        """Classe, com corpo (atributos e relações internas) e pais"""
+
+    def on_datatype(self, info):
+        """Tipo de dados, com seus atributos"""
+
+    def on_enum(self, info):
+        """Enumeração, com suas instâncias"""
+
+    def on_genset(self, info):
+        """Generalization set"""
+
+    def on_relation(self, info):
+        """Relação interna (info['internal']) ou externa"""
+
+    def on_attribute(self, info):
+        """Atributo de uma classe ou de um tipo de dados"""
+
+    def on_error(self, error):
+        """Erro léxico ou sintático, no formato de dicionário dos diagnósticos"""
+
+
+# Eventos aceitos por Callbacks
+EVENTS = tuple(name for name in vars(ParseHandler) if name.startswith('on_'))
+
+
+class Callbacks(ParseHandler):
+    """Handler montado a partir de funções: Callbacks(on_class=f, on_error=g)"""
+
+    def __init__(self, **callbacks):
+        for name, callback in callbacks.items():
+            if name not in EVENTS:
+                raise TypeError(f"Evento desconhecido: {name!r} (eventos: {', '.join(EVENTS)})")
+            setattr(self, name, callback)
+
+
+class SummaryCollector(ParseHandler):
+    """
+    Consumidor que monta o resumo da análise (get_analysis_summary):
+    listas por tipo de declaração e o resumo hierárquico por pacote.
+
+    O agrupamento por pacote também usa só os eventos: as declarações de
+    topo que chegam antes de um on_package pertencem a esse pacote.
+    """
+
+    LISTS = ('imports', 'packages', 'classes', 'datatypes', 'enums', 'gensets',
+             'relations', 'attributes', 'package_tree')
+
+    def __init__(self):
+        self.imports = []
+        self.packages = []
+        self.classes = []
+        self.datatypes = []
+        self.enums = []
+        self.gensets = []
+        self.relations = []
+        self.attributes = []
+        # Resumo hierárquico por pacote, montado no fim de cada pacote
+        self.package_tree = []
+        self._pending = []      # Declarações de topo do pacote em andamento
+
+    def reset(self):
+        """Limpa as listas da análise anterior"""
+        for name in self.LISTS:
+            getattr(self, name).clear()
+        self._pending.clear()
+
+    def summary(self, total_errors):
+        """Resumo no formato de TontoParser.get_analysis_summary"""
+        summary = {name: getattr(self, name) for name in self.LISTS}
+        summary['total_errors'] = total_errors
+        return summary
+
+    def on_import(self, info):
+        self.imports.append(info)
+
+    def on_class(self, info):
+        self.classes.append(info)
+        self._pending.append(info)
+
+    def on_datatype(self, info):
+        self.datatypes.append(info)
+        self._pending.append(info)
+
+    def on_enum(self, info):
+        self.enums.append(info)
+        self._pending.append(info)
+
+    def on_genset(self, info):
+        self.gensets.append(info)
+        self._pending.append(info)
+
+    def on_relation(self, info):
+        self.relations.append(info)
+        if not info['internal']:
+            self._pending.append(info)
+
+    def on_attribute(self, info):
+        self.attributes.append(info)
+
+    def on_package(self, info):
+        self.packages.append(info)
+        self._group_package(info, self._pending)
+        self._pending = []
+
+    def _group_package(self, package_info, declarations):
+        """
+        Monta o resumo hierárquico de um pacote em uma única passada pelas
+        suas declarações: pacote -> classes -> atributos e relações internas,
+        mais as relações externas do pacote, com as contagens já calculadas.
+        """
+        classes = []
+        datatypes = []
+        enums = []
+        gensets = []
+        external_relations = []
+        attribute_count = 0
+        internal_count = 0
+
+        for decl in declarations:
+            if 'body' in decl:
+                attributes = []
+                relations = []
+                for member in decl['body']:
+                    if not isinstance(member, dict):
+                        continue
+                    if member.get('internal'):
+                        relations.append(member)
+                    elif 'type' in member and 'name' in member:
+                        attributes.append(member)
+                attribute_count += len(attributes)
+                internal_count += len(relations)
+                classes.append({
+                    'class': decl,
+                    'attributes': attributes,
+                    'relations': relations,
+                    'counts': {'attributes': len(attributes),
+                               'relations': len(relations)},
+                })
+            elif 'instances' in decl:
+                enums.append(decl)
+            elif 'general' in decl:
+                gensets.append(decl)
+            elif 'internal' in decl:
+                external_relations.append(decl)
+            elif 'attributes' in decl:
+                datatypes.append(decl)
+
+        self.package_tree.append({
+            'package': package_info,
+            'classes': classes,
+            'datatypes': datatypes,
+            'enums': enums,
+            'gensets': gensets,
+            'external_relations': external_relations,
+            'counts': {
+                'classes': len(classes),
+                'datatypes': len(datatypes),
+                'enums': len(enums),
+                'gensets': len(gensets),
+                'attributes': attribute_count,
+                'internal_relations': internal_count,
+                'external_relations': len(external_relations),
+            },
+        })
@@ -1,64 +1,108 @@
 """
 Analisador Sintático para a linguagem TONTO
 Implementado com PLY (Python Lex-Yacc)
+
+As tabelas LALR vêm de parsetab.py (gerado pelo PLY a partir desta
+gramática) e o ply.yacc só é importado em build().
+
+As regras p_* entregam cada declaração a um handler (ver events.py). Por
+padrão é o SummaryCollector, que monta o resumo de get_analysis_summary;
+com parse(..., handler=h) a análise é em streaming.
 """
-import ply.yacc as yacc
 from ..lexico.tokens import TOKENS
+from .driver import LRDriver
+from .events import SummaryCollector
+from .tables import compile_tables
 
 
 class TontoParser:
     """Analisador sintático da linguagem TONTO"""
 
+    # Em "nome: Tipo" seguido de '[', o colchete pode ser a cardinalidade do
+    # atributo ou o início de uma relação interna ("[1] -- Classe"). A
+    # precedência maior de LBRACKET faz o parser sempre ler a cardinalidade
+    # do atributo, decisão que antes o PLY tomava com um aviso de conflito.
+    precedence = (
+        ('nonassoc', 'ATTRIBUTE'),
+        ('nonassoc', 'LBRACKET'),
+    )
+
     def __init__(self, lexer):
         self.lexer = lexer
         self.tokens = TOKENS
         self.parser = None
         self.errors = []
+        self.error_count = 0    # Também conta os erros não guardados em streaming
 
-        # Estrutura para armazenar informações da análise
-        self.imports = []
-        self.packages = []
-        self.current_package = None
-        self.classes = []
-        self.datatypes = []
-        self.enums = []
-        self.gensets = []
-        self.relations = []
-        self.attributes = []
+        # Tabelas compactas e driver LR próprio (ver tables.py / driver.py);
+        # self.parser continua sendo o LRParser do PLY, usado como referência
+        self.tables = None
+        self.driver = None
+        self._active = None     # Quem está analisando (errok em p_error)
+
+        # Quem recebe as declarações: o resumo padrão ou o handler de parse()
+        self.summary = SummaryCollector()
+        self.handler = self.summary
+        # False em streaming: as listas de declarações, pacotes e imports
+        # não são montadas e cada nó é descartado depois do evento
+        self.retain = True
 
     def build(self, **kwargs):
         """Constrói o parser"""
+        import ply.yacc as yacc
         self.parser = yacc.yacc(module=self, **kwargs)
+        self.tables = compile_tables(self.parser)
+        self.driver = LRDriver(self.tables, self.p_error)
         return self.parser
 
-    def parse(self, data):
+    def parse(self, data, use_ply=False, handler=None):
         """Analisa o código fonte"""
-        self.errors.clear()
-        self.imports.clear()
-        self.packages.clear()
-        self.classes.clear()
-        self.datatypes.clear()
-        self.enums.clear()
-        self.gensets.clear()
-        self.relations.clear()
-        self.attributes.clear()
-
-        result = self.parser.parse(data, lexer=self.lexer.lexer)
+        self.lexer.lexer.lineno = 1
+        self.lexer.lexer.input(data)
+        return self._run(iter(self.lexer.lexer.token, None), use_ply, handler)
+
+    def parse_tokens(self, tokens, use_ply=False, handler=None):
+        """
+        Analisa uma sequência de tokens já produzida pelo léxico.
+        Evita lexar o código uma segunda vez quando os tokens já estão em memória.
+        """
+        return self._run(iter(tokens), use_ply, handler)
+
+    def _run(self, tokens, use_ply, handler):
+        """
+        Executa a análise com o driver sobre as tabelas compactas ou,
+        com use_ply=True, com o driver genérico do PLY (para comparação).
+
+        Com um handler (events.ParseHandler) a análise é em streaming: os
+        eventos e os erros vão só para ele (self.error_count os conta), o
+        resumo padrão fica vazio e a árvore devolvida não tem as listas de
+        pacotes, declarações e imports.
+        """
+        self._reset()
+        if handler is not None:
+            self.handler = handler
+            self.retain = False
+
+        if use_ply:
+            self._active = self.parser
+            result = self.parser.parse(lexer=self.lexer.lexer,
+                                       tokenfunc=lambda: next(tokens, None))
+        else:
+            self._active = self.driver
+            result = self.driver.parse(tokens)
         return result, self.errors
 
+    def _reset(self):
+        """Limpa as estruturas da análise anterior"""
+        self.errors.clear()
+        self.error_count = 0
+        self.summary.reset()
+        self.handler = self.summary
+        self.retain = True
+
     def get_analysis_summary(self):
         """Retorna resumo da análise sintática"""
-        return {
-            'imports': self.imports,
-            'packages': self.packages,
-            'classes': self.classes,
-            'datatypes': self.datatypes,
-            'enums': self.enums,
-            'gensets': self.gensets,
-            'relations': self.relations,
-            'attributes': self.attributes,
-            'total_errors': len(self.errors)
-        }
+        return self.summary.summary(len(self.errors))
 
     def _process_class_body(self, body):
         """
@@ -108,7 +152,9 @@ class TontoParser:
     def p_import_list(self, p):
         '''import_list : import_statement
                        | import_list import_statement'''
-        if len(p) == 2:
+        if not self.retain:
+            p[0] = []
+        elif len(p) == 2:
             p[0] = [p[1]]
         else:
             p[0] = p[1] + [p[2]]
@@ -120,13 +166,16 @@ class TontoParser:
             'module': p[2],
             'line': p.lineno(1)
         }
-        self.imports.append(import_info)
+        self._annotate(p, import_info)
+        self.handler.on_import(import_info)
         p[0] = import_info
 
     def p_package_list(self, p):
         '''package_list : package
                         | package_list package'''
-        if len(p) == 2:
+        if not self.retain:
+            p[0] = []
+        elif len(p) == 2:
             p[0] = [p[1]]
         else:
             p[0] = p[1] + [p[2]]
@@ -139,7 +188,8 @@ class TontoParser:
             'declarations': p[4],
             'line': p.lineno(1)
         }
-        self.packages.append(package_info)
+        self._annotate(p, package_info)
+        self.handler.on_package(package_info)
         p[0] = package_info
 
     def p_package_without_braces(self, p):
@@ -149,7 +199,8 @@ class TontoParser:
             'declarations': p[3],
             'line': p.lineno(1)
         }
-        self.packages.append(package_info)
+        self._annotate(p, package_info)
+        self.handler.on_package(package_info)
         p[0] = package_info
 
     def p_package_name(self, p):
@@ -163,7 +214,8 @@ class TontoParser:
 
     def p_declarations_list(self, p):
         '''declarations : declarations declaration'''
-        p[0] = p[1] + [p[2]]
+        # Em streaming a declaração já foi entregue ao handler
+        p[0] = p[1] + [p[2]] if self.retain else p[1]
 
     def p_declaration(self, p):
         '''declaration : class_declaration
@@ -183,7 +235,8 @@ class TontoParser:
             'body': [],
             'line': p.lineno(2)
         }
-        self.classes.append(class_info)
+        self._annotate(p, class_info)
+        self.handler.on_class(class_info)
         p[0] = class_info
 
     def p_class_declaration_with_specializes(self, p):
@@ -195,7 +248,8 @@ class TontoParser:
             'body': [],
             'line': p.lineno(2)
         }
-        self.classes.append(class_info)
+        self._annotate(p, class_info)
+        self.handler.on_class(class_info)
         p[0] = class_info
 
     def p_class_declaration_with_body(self, p):
@@ -210,7 +264,8 @@ class TontoParser:
             'body': processed_body,
             'line': p.lineno(2)
         }
-        self.classes.append(class_info)
+        self._annotate(p, class_info)
+        self.handler.on_class(class_info)
         p[0] = class_info
 
     def p_class_declaration_with_specializes_and_body(self, p):
@@ -225,7 +280,8 @@ class TontoParser:
             'body': processed_body,
             'line': p.lineno(2)
         }
-        self.classes.append(class_info)
+        self._annotate(p, class_info)
+        self.handler.on_class(class_info)
         p[0] = class_info
 
     # Declarações com "of <partition>"
@@ -239,7 +295,8 @@ class TontoParser:
             'body': [],
             'line': p.lineno(2)
         }
-        self.classes.append(class_info)
+        self._annotate(p, class_info)
+        self.handler.on_class(class_info)
         p[0] = class_info
 
     def p_class_declaration_with_partition_and_specializes(self, p):
@@ -252,7 +309,8 @@ class TontoParser:
             'body': [],
             'line': p.lineno(2)
         }
-        self.classes.append(class_info)
+        self._annotate(p, class_info)
+        self.handler.on_class(class_info)
         p[0] = class_info
 
     def p_class_declaration_with_partition_and_body(self, p):
@@ -267,7 +325,8 @@ class TontoParser:
             'body': processed_body,
             'line': p.lineno(2)
         }
-        self.classes.append(class_info)
+        self._annotate(p, class_info)
+        self.handler.on_class(class_info)
         p[0] = class_info
 
     def p_class_declaration_with_partition_specializes_and_body(self, p):
@@ -282,7 +341,8 @@ class TontoParser:
             'body': processed_body,
             'line': p.lineno(2)
         }
-        self.classes.append(class_info)
+        self._annotate(p, class_info)
+        self.handler.on_class(class_info)
         p[0] = class_info
 
     def p_partition_name(self, p):
@@ -347,7 +407,7 @@ class TontoParser:
         }
 
     def p_attribute_declaration(self, p):
-        '''attribute_declaration : RELATION_NAME COLON type_reference
+        '''attribute_declaration : RELATION_NAME COLON type_reference %prec ATTRIBUTE
                                   | RELATION_NAME COLON type_reference cardinality'''
         attr_info = {
             'name': p[1],
@@ -355,7 +415,8 @@ class TontoParser:
             'cardinality': p[4] if len(p) == 5 else None,
             'line': p.lineno(1)
         }
-        self.attributes.append(attr_info)
+        self._annotate(p, attr_info)
+        self.handler.on_attribute(attr_info)
         p[0] = attr_info
 
     def p_type_reference(self, p):
@@ -377,7 +438,8 @@ class TontoParser:
             'attributes': p[3],
             'line': p.lineno(1)
         }
-        self.datatypes.append(datatype_info)
+        self._annotate(p, datatype_info)
+        self.handler.on_datatype(datatype_info)
         p[0] = datatype_info
 
     def p_datatype_body_empty(self, p):
@@ -396,7 +458,8 @@ class TontoParser:
             'instances': p[4],
             'line': p.lineno(1)
         }
-        self.enums.append(enum_info)
+        self._annotate(p, enum_info)
+        self.handler.on_enum(enum_info)
         p[0] = enum_info
 
     def p_instance_list_single(self, p):
@@ -424,7 +487,8 @@ class TontoParser:
             'specifics': p[8],
             'line': p.lineno(2)
         }
-        self.gensets.append(genset_info)
+        self._annotate(p, genset_info)
+        self.handler.on_genset(genset_info)
         p[0] = genset_info
 
     # Forma completa
@@ -437,7 +501,8 @@ class TontoParser:
             'specifics': p[5]['specifics'],
             'line': p.lineno(2)
         }
-        self.gensets.append(genset_info)
+        self._annotate(p, genset_info)
+        self.handler.on_genset(genset_info)
         p[0] = genset_info
 
     def p_genset_name(self, p):
@@ -497,212 +562,128 @@ class TontoParser:
 
     def p_cardinality_single(self, p):
         '''cardinality : LBRACKET INTEGER RBRACKET'''
-        p[0] = {'min': p[2], 'max': p[2], 'text': f'[{p[2]}]'}
+        p[0] = {'min': p[2], 'max': p[2], 'text': self.lexer.names.intern(f'[{p[2]}]')}
 
     def p_cardinality_range(self, p):
         '''cardinality : LBRACKET INTEGER DOTDOT INTEGER RBRACKET'''
-        p[0] = {'min': p[2], 'max': p[4], 'text': f'[{p[2]}..{p[4]}]'}
+        p[0] = {'min': p[2], 'max': p[4], 'text': self.lexer.names.intern(f'[{p[2]}..{p[4]}]')}
 
     def p_cardinality_range_asterisk(self, p):
         '''cardinality : LBRACKET INTEGER DOTDOT ASTERISK RBRACKET'''
-        p[0] = {'min': p[2], 'max': '*', 'text': f'[{p[2]}..*]'}
-
-    def p_cardinality_optional(self, p):
-        '''cardinality : '''
-        p[0] = None
+        p[0] = {'min': p[2], 'max': '*', 'text': self.lexer.names.intern(f'[{p[2]}..*]')}
 
     # 6. DECLARAÇÃO DE RELAÇÕES
+    #
+    # As cardinalidades opcionais são escritas como alternativas explícitas
+    # (com e sem cardinalidade) em vez de uma regra vazia: com a regra vazia,
+    # o parser não sabia se reduzia a cardinalidade ausente ou empilhava a
+    # seta, gerando conflitos shift/reduce em vários estados.
+
+    def p_relation_tail_with_cardinality(self, p):
+        '''relation_tail : arrow_symbol cardinality CLASS_NAME'''
+        # Seta, cardinalidade opcional do destino e classe destino
+        p[0] = (p[1], p[2], p[3])
+
+    def p_relation_tail(self, p):
+        '''relation_tail : arrow_symbol CLASS_NAME'''
+        p[0] = (p[1], None, p[2])
+
+    def _internal_relation(self, p, stereotype, name, source_cardinality, tail, line):
+        arrow, target_cardinality, target = tail
+        relation_info = {
+            'stereotype': stereotype,
+            'name': name,
+            'source_cardinality': source_cardinality,
+            'arrow': arrow,
+            'target_cardinality': target_cardinality,
+            'target': target,
+            'internal': True,
+            'line': line
+        }
+        self._annotate(p, relation_info)
+        self.handler.on_relation(relation_info)
+        p[0] = relation_info
 
     # Relação interna (dentro de classe)
-    def p_internal_relation_declaration(self, p):
-        '''internal_relation_declaration : relation_stereotype cardinality arrow_symbol cardinality CLASS_NAME
-                                         | relation_stereotype RELATION_NAME cardinality arrow_symbol cardinality CLASS_NAME
-                                         | relation_stereotype arrow_symbol CLASS_NAME
-                                         | relation_stereotype RELATION_NAME arrow_symbol CLASS_NAME
-                                         | arrow_symbol RELATION_NAME arrow_symbol cardinality CLASS_NAME
-                                         | arrow_symbol RELATION_NAME arrow_symbol CLASS_NAME
-                                         | cardinality arrow_symbol cardinality CLASS_NAME
-                                         | cardinality arrow_symbol CLASS_NAME'''
-        # Verificar se começa com estereótipo, seta ou cardinalidade
-        starts_with_arrow = (p[1] == '--' or p[1] == '<>--' or p[1] == '--<>')
-        starts_with_cardinality = isinstance(p[1], dict) and 'min' in p[1]
-
-        if starts_with_cardinality:
-            # Sintaxe: [card] -- [card] Classe  OU  [card] -- Classe
-            if len(p) == 5:
-                # [1..*] -- [1] Unidade_Basica_De_Saude
-                relation_info = {
-                    'stereotype': None,
-                    'name': None,
-                    'source_cardinality': p[1],
-                    'arrow': p[2],
-                    'target_cardinality': p[3],
-                    'target': p[4],
-                    'internal': True,
-                    'line': p.lineno(2)
-                }
-            else:  # len(p) == 4
-                # [1..*] -- Unidade_Basica_De_Saude
-                relation_info = {
-                    'stereotype': None,
-                    'name': None,
-                    'source_cardinality': p[1],
-                    'arrow': p[2],
-                    'target_cardinality': None,
-                    'target': p[3],
-                    'internal': True,
-                    'line': p.lineno(2)
-                }
-        elif starts_with_arrow:
-            # Sintaxe: -- nome -- [card] Classe  OU  -- nome -- Classe
-            if len(p) == 6:
-                # -- involvesRental -- [1] RentalCar
-                relation_info = {
-                    'stereotype': None,
-                    'name': p[2],
-                    'source_cardinality': None,
-                    'arrow': p[3],
-                    'target_cardinality': p[4],
-                    'target': p[5],
-                    'internal': True,
-                    'line': p.lineno(1)
-                }
-            else:  # len(p) == 5
-                # -- involvesMediator -- ResponsibleEmployee
-                relation_info = {
-                    'stereotype': None,
-                    'name': p[2],
-                    'source_cardinality': None,
-                    'arrow': p[3],
-                    'target_cardinality': None,
-                    'target': p[4],
-                    'internal': True,
-                    'line': p.lineno(1)
-                }
-        else:
-            # Começa com estereótipo
-            if len(p) == 6:
-                # @mediation [1..*] -- [1] Paciente
-                relation_info = {
-                    'stereotype': p[1],
-                    'name': None,
-                    'source_cardinality': p[2],
-                    'arrow': p[3],
-                    'target_cardinality': p[4],
-                    'target': p[5],
-                    'internal': True,
-                    'line': p.lineno(1)
-                }
-            elif len(p) == 7:
-                # @mediation rel [1..*] -- [1] Paciente
-                relation_info = {
-                    'stereotype': p[1],
-                    'name': p[2],
-                    'source_cardinality': p[3],
-                    'arrow': p[4],
-                    'target_cardinality': p[5],
-                    'target': p[6],
-                    'internal': True,
-                    'line': p.lineno(1)
-                }
-            elif len(p) == 4:
-                # @mediation -- Paciente
-                relation_info = {
-                    'stereotype': p[1],
-                    'name': None,
-                    'source_cardinality': None,
-                    'arrow': p[2],
-                    'target_cardinality': None,
-                    'target': p[3],
-                    'internal': True,
-                    'line': p.lineno(1)
-                }
-            else:  # len(p) == 5
-                # @mediation rel -- Paciente
-                relation_info = {
-                    'stereotype': p[1],
-                    'name': p[2],
-                    'source_cardinality': None,
-                    'arrow': p[3],
-                    'target_cardinality': None,
-                    'target': p[4],
-                    'internal': True,
-                    'line': p.lineno(1)
-                }
-        self.relations.append(relation_info)
+    def p_internal_relation_stereotype_cardinality(self, p):
+        '''internal_relation_declaration : relation_stereotype cardinality relation_tail'''
+        # @mediation [1..*] -- [1] Paciente
+        self._internal_relation(p, p[1], None, p[2], p[3], p.lineno(1))
+
+    def p_internal_relation_stereotype_name_cardinality(self, p):
+        '''internal_relation_declaration : relation_stereotype RELATION_NAME cardinality relation_tail'''
+        # @mediation rel [1..*] -- [1] Paciente
+        self._internal_relation(p, p[1], p[2], p[3], p[4], p.lineno(1))
+
+    def p_internal_relation_stereotype(self, p):
+        '''internal_relation_declaration : relation_stereotype arrow_symbol CLASS_NAME'''
+        # @mediation -- Paciente
+        self._internal_relation(p, p[1], None, None, (p[2], None, p[3]), p.lineno(1))
+
+    def p_internal_relation_stereotype_name(self, p):
+        '''internal_relation_declaration : relation_stereotype RELATION_NAME arrow_symbol CLASS_NAME'''
+        # @mediation rel -- Paciente
+        self._internal_relation(p, p[1], p[2], None, (p[3], None, p[4]), p.lineno(1))
+
+    def p_internal_relation_named(self, p):
+        '''internal_relation_declaration : arrow_symbol RELATION_NAME relation_tail'''
+        # -- involvesRental -- [1] RentalCar  OU  -- involvesMediator -- ResponsibleEmployee
+        self._internal_relation(p, None, p[2], None, p[3], p.lineno(1))
+
+    def p_internal_relation_cardinality(self, p):
+        '''internal_relation_declaration : cardinality relation_tail'''
+        # [1..*] -- [1] Unidade_Basica_De_Saude  OU  [1..*] -- Unidade_Basica_De_Saude
+        self._internal_relation(p, None, None, p[1], p[2], p.lineno(2))
+
+    def _relation(self, p, stereotype, source, source_cardinality, arrow,
+                  relation_name, tail, line):
+        arrow2, target_cardinality, target = tail
+        relation_info = {
+            'stereotype': stereotype,
+            'source': source,
+            'source_cardinality': source_cardinality,
+            'arrow': arrow,
+        }
+        if relation_name is not None:
+            relation_info['relation_name'] = relation_name
+            relation_info['arrow2'] = arrow2
+        relation_info.update({
+            'target_cardinality': target_cardinality,
+            'target': target,
+            'internal': False,
+            'line': line
+        })
+        self._annotate(p, relation_info)
+        self.handler.on_relation(relation_info)
         p[0] = relation_info
 
     # Relação externa
-    def p_relation_declaration(self, p):
-        '''relation_declaration : AT relation_stereotype RELATION CLASS_NAME cardinality arrow_symbol RELATION_NAME arrow_symbol cardinality CLASS_NAME
-                                | AT relation_stereotype RELATION CLASS_NAME cardinality arrow_symbol cardinality CLASS_NAME
-                                | AT relation_stereotype RELATION CLASS_NAME arrow_symbol CLASS_NAME
-                                | relation_stereotype CLASS_NAME cardinality arrow_symbol cardinality CLASS_NAME
-                                | relation_stereotype CLASS_NAME arrow_symbol CLASS_NAME'''
-        if len(p) == 11:
-            # @material relation Paciente [1..*] -- consultado_Por -- [1..*] Medico
-            relation_info = {
-                'stereotype': p[2],
-                'source': p[4],
-                'source_cardinality': p[5],
-                'arrow': p[6],
-                'relation_name': p[7],
-                'arrow2': p[8],
-                'target_cardinality': p[9],
-                'target': p[10],
-                'internal': False,
-                'line': p.lineno(1)
-            }
-        elif len(p) == 9:
-            # @material relation Paciente [1..*] -- [1..*] Medico
-            relation_info = {
-                'stereotype': p[2],
-                'source': p[4],
-                'source_cardinality': p[5],
-                'arrow': p[6],
-                'target_cardinality': p[7],
-                'target': p[8],
-                'internal': False,
-                'line': p.lineno(1)
-            }
-        elif len(p) == 7:
-            # @mediation relation Employee -- EmploymentContract
-            relation_info = {
-                'stereotype': p[2],
-                'source': p[4],
-                'source_cardinality': None,
-                'arrow': p[5],
-                'target_cardinality': None,
-                'target': p[6],
-                'internal': False,
-                'line': p.lineno(1)
-            }
-        elif len(p) == 6:
-            # material University [1..*] <>-- [1] Department
-            relation_info = {
-                'stereotype': p[1],
-                'source': p[2],
-                'source_cardinality': p[3],
-                'arrow': p[4],
-                'target_cardinality': p[5],
-                'target': p[6],
-                'internal': False,
-                'line': p.lineno(1)
-            }
-        else:
-            # material University <>-- Department
-            relation_info = {
-                'stereotype': p[1],
-                'source': p[2],
-                'source_cardinality': None,
-                'arrow': p[3],
-                'target_cardinality': None,
-                'target': p[4],
-                'internal': False,
-                'line': p.lineno(1)
-            }
-        self.relations.append(relation_info)
-        p[0] = relation_info
+    def p_relation_declaration_named(self, p):
+        '''relation_declaration : AT relation_stereotype RELATION CLASS_NAME cardinality arrow_symbol RELATION_NAME relation_tail'''
+        # @material relation Paciente [1..*] -- consultado_Por -- [1..*] Medico
+        self._relation(p, p[2], p[4], p[5], p[6], p[7], p[8], p.lineno(1))
+
+    def p_relation_declaration_cardinality(self, p):
+        '''relation_declaration : AT relation_stereotype RELATION CLASS_NAME cardinality relation_tail'''
+        # @material relation Paciente [1..*] -- [1..*] Medico
+        arrow = p[6][0]
+        self._relation(p, p[2], p[4], p[5], arrow, None, p[6], p.lineno(1))
+
+    def p_relation_declaration_simple(self, p):
+        '''relation_declaration : AT relation_stereotype RELATION CLASS_NAME arrow_symbol CLASS_NAME'''
+        # @mediation relation Employee -- EmploymentContract
+        self._relation(p, p[2], p[4], None, p[5], None, (p[5], None, p[6]), p.lineno(1))
+
+    def p_relation_declaration_short_cardinality(self, p):
+        '''relation_declaration : relation_stereotype CLASS_NAME cardinality relation_tail'''
+        # material University [1..*] <>-- [1] Department
+        arrow = p[4][0]
+        self._relation(p, p[1], p[2], p[3], arrow, None, p[4], p.lineno(1))
+
+    def p_relation_declaration_short(self, p):
+        '''relation_declaration : relation_stereotype CLASS_NAME arrow_symbol CLASS_NAME'''
+        # material University <>-- Department
+        self._relation(p, p[1], p[2], None, p[3], None, (p[3], None, p[4]), p.lineno(1))
 
     def p_relation_stereotype(self, p):
         '''relation_stereotype : MATERIAL
@@ -754,10 +735,10 @@ class TontoParser:
                 'mensagem': f"Sintaxe inválida: token inesperado '{p.value}' (tipo: {p.type})",
                 'sugestao': self._get_error_suggestion(p)
             }
-            self.errors.append(error)
+            self._report(error)
 
             # Tentar recuperar do erro
-            self.parser.errok()
+            self._active.errok()
         else:
             error = {
                 'linha': -1,
@@ -768,7 +749,23 @@ class TontoParser:
                 'mensagem': "Fim de arquivo inesperado",
                 'sugestao': "Verifique se todas as chaves e parênteses foram fechados corretamente"
             }
+            self._report(error)
+
+    def _annotate(self, p, info):
+        """
+        Grava o span do nó antes do evento, para que o handler já o receba
+        (o driver grava o mesmo valor depois da regra). O driver do PLY,
+        usado só para comparação, não registra spans.
+        """
+        if self._active is self.driver:
+            info['span'] = p.span()
+
+    def _report(self, error):
+        """Registra um erro; em streaming ele só vai para o handler"""
+        self.error_count += 1
+        if self.retain:
             self.errors.append(error)
+        self.handler.on_error(error)
 
     def _get_error_suggestion(self, p):
         """Gera sugestões de correção baseadas no tipo de erro"""
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'AGGREGATION ARROW ARROW_LEFT ARROW_RIGHT ASTERISK AT BOOLEAN_TYPE BRINGSABOUT CATEGORY CHARACTERIZATION CLASS_NAME COLLECTIVE COLON COMMA COMMENT COMPARATIVE COMPLETE COMPONENTOF COMPOSITION CONST CONSTITUTION CREATION CUSTOM_DATATYPE DATETIME_TYPE DATE_TYPE DERIVATION DERIVED DISJOINT DOTDOT ENUM EVENT EXTERNALDEPENDENCE EXTRINSICMODE FORMAL FUNCTIONAL_COMPLEXES GENERAL GENSET HISTORICALDEPENDENCE HISTORICALROLE HISTORICALROLEMIXIN IMPORT INCOMPLETE INHERENCE INSTANCE_NAME INSTANTIATION INTEGER INTRINSICMODE INVALID_CLASS_NAME INVALID_DATATYPE INVALID_INSTANCE_NAME INVALID_RELATION_NAME KIND LBRACE LBRACKET LPAREN MANIFESTATION MATERIAL MEDIATION MEMBEROF MIXIN MODE NUMBER_TYPE ORDERED OVERLAPPING PACKAGE PARTICIPATION PARTICIPATIONAL PHASE PHASEMIXIN PROCESS QUALITY QUANTITY RBRACE RBRACKET REDEFINES RELATION RELATION_NAME RELATOR ROLE ROLEMIXIN RPAREN SITUATION SPECIALIZES SPECIFICS STRING_TYPE SUBCOLLECTIONOF SUBKIND SUBQUALITYOF SUBSETS TERMINATION TIME_TYPE TRIGGERS VALUE WHEREontology : import_list package_list\n                    | package_listimport_list : import_statement\n                       | import_list import_statementimport_statement : IMPORT CLASS_NAMEpackage_list : package\n                        | package_list packagepackage : PACKAGE CLASS_NAME LBRACE declarations RBRACEpackage : PACKAGE CLASS_NAME declarationsdeclarations : declarations : declarations declarationdeclaration : class_declaration\n                       | datatype_declaration\n                       | enum_declaration\n                       | generalization_declaration\n                       | relation_declarationclass_declaration : class_stereotype CLASS_NAMEclass_declaration : class_stereotype CLASS_NAME SPECIALIZES parent_listclass_declaration : class_stereotype CLASS_NAME LBRACE class_body RBRACEclass_declaration : class_stereotype CLASS_NAME SPECIALIZES parent_list LBRACE class_body RBRACEparent_list : CLASS_NAMEparent_list : parent_list COMMA CLASS_NAMEclass_stereotype : KIND\n                            | SUBKIND\n                            | ROLE\n                            | PHASE\n                            | CATEGORY\n                            | MIXIN\n                            | PHASEMIXIN\n                            | ROLEMIXIN\n                            | HISTORICALROLEMIXIN\n                            | COLLECTIVE\n                            | QUANTITY\n                            | QUALITY\n                            | MODE\n                            | INTRINSICMODE\n                            | EXTRINSICMODE\n                            | EVENT\n                            | SITUATION\n                            | PROCESS\n                            | HISTORICALROLE\n                            | RELATORclass_body : class_body : class_body class_memberclass_member : attribute_declaration\n                        | internal_relation_declaration\n                        | standalone_stereotypestandalone_stereotype : AT relation_stereotypeattribute_declaration : RELATION_NAME COLON type_referencetype_reference : NUMBER_TYPE\n                          | STRING_TYPE\n                          | BOOLEAN_TYPE\n                          | DATE_TYPE\n                          | TIME_TYPE\n                          | DATETIME_TYPE\n                          | CLASS_NAME\n                          | CUSTOM_DATATYPEdatatype_declaration : CUSTOM_DATATYPE LBRACE datatype_body RBRACEdatatype_body : datatype_body : datatype_body attribute_declarationenum_declaration : ENUM CLASS_NAME LBRACE instance_list RBRACEinstance_list : CLASS_NAMEinstance_list : instance_list COMMA CLASS_NAMEgeneralization_declaration : genset_modifiers GENSET CLASS_NAME WHERE GENERAL CLASS_NAME SPECIFICS class_name_listgeneralization_declaration : genset_modifiers GENSET CLASS_NAME LBRACE genset_body RBRACEgenset_modifiers : genset_modifiers : DISJOINTgenset_modifiers : COMPLETEgenset_modifiers : OVERLAPPINGgenset_modifiers : INCOMPLETEgenset_modifiers : DISJOINT COMPLETE\n                            | COMPLETE DISJOINTgenset_modifiers : OVERLAPPING INCOMPLETE\n                            | INCOMPLETE OVERLAPPINGgenset_body : GENERAL CLASS_NAME SPECIFICS class_name_listclass_name_list : CLASS_NAMEclass_name_list : class_name_list COMMA CLASS_NAMEcardinality : LBRACKET ASTERISK RBRACKETcardinality : LBRACKET INTEGER RBRACKETcardinality : LBRACKET INTEGER DOTDOT INTEGER RBRACKETcardinality : LBRACKET INTEGER DOTDOT ASTERISK RBRACKETcardinality : internal_relation_declaration : relation_stereotype cardinality arrow_symbol cardinality CLASS_NAME\n                                         | relation_stereotype RELATION_NAME cardinality arrow_symbol cardinality CLASS_NAME\n                                         | relation_stereotype arrow_symbol CLASS_NAME\n                                         | relation_stereotype RELATION_NAME arrow_symbol CLASS_NAME\n                                         | arrow_symbol RELATION_NAME arrow_symbol cardinality CLASS_NAME\n                                         | arrow_symbol RELATION_NAME arrow_symbol CLASS_NAMErelation_declaration : AT relation_stereotype RELATION CLASS_NAME cardinality arrow_symbol RELATION_NAME arrow_symbol cardinality CLASS_NAME\n                                | AT relation_stereotype RELATION CLASS_NAME cardinality arrow_symbol cardinality CLASS_NAME\n                                | AT relation_stereotype RELATION CLASS_NAME arrow_symbol CLASS_NAME\n                                | relation_stereotype CLASS_NAME cardinality arrow_symbol cardinality CLASS_NAME\n                                | relation_stereotype CLASS_NAME arrow_symbol CLASS_NAMErelation_stereotype : MATERIAL\n                               | MEDIATION\n                               | CHARACTERIZATION\n                               | DERIVATION\n                               | COMPARATIVE\n                               | EXTERNALDEPENDENCE\n                               | COMPONENTOF\n                               | MEMBEROF\n                               | SUBCOLLECTIONOF\n                               | SUBQUALITYOF\n                               | INSTANTIATION\n                               | TERMINATION\n                               | PARTICIPATIONAL\n                               | PARTICIPATION\n                               | HISTORICALDEPENDENCE\n                               | CREATION\n                               | MANIFESTATION\n                               | BRINGSABOUT\n                               | TRIGGERS\n                               | COMPOSITION\n                               | AGGREGATION\n                               | INHERENCE\n                               | VALUE\n                               | FORMAL\n                               | CONSTITUTIONarrow_symbol : ARROW_LEFT\n                        | ARROW_RIGHT\n                        | ARROW'
+_lr_signature = 'nonassocATTRIBUTEnonassocLBRACKETAGGREGATION ARROW ARROW_LEFT ARROW_RIGHT ASTERISK AT BOOLEAN_TYPE BRINGSABOUT CATEGORY CHARACTERIZATION CLASS_NAME COLLECTIVE COLON COMMA COMMENT COMPARATIVE COMPLETE COMPONENTOF COMPOSITION CONST CONSTITUTION CREATION CUSTOM_DATATYPE DATETIME_TYPE DATE_TYPE DERIVATION DERIVED DISJOINT DOTDOT ENUM EVENT EXTERNALDEPENDENCE EXTRINSICMODE FORMAL FUNCTIONAL_COMPLEXES GENERAL GENSET HISTORICALDEPENDENCE HISTORICALROLE HISTORICALROLEMIXIN IMPORT INCOMPLETE INHERENCE INSTANCE_NAME INSTANTIATION INTEGER INTRINSICMODE INTRINSIC_MODES INVALID_CLASS_NAME INVALID_DATATYPE INVALID_INSTANCE_NAME INVALID_RELATION_NAME KIND LBRACE LBRACKET LPAREN MANIFESTATION MATERIAL MEDIATION MEMBEROF MIXIN MODE NUMBER_TYPE OF ORDERED OVERLAPPING PACKAGE PARTICIPATION PARTICIPATIONAL PHASE PHASEMIXIN PROCESS QUALITY QUANTITY RBRACE RBRACKET REDEFINES RELATION RELATION_NAME RELATOR RELATORS ROLE ROLEMIXIN RPAREN SITUATION SPECIALIZES SPECIFICS STRING_TYPE SUBCOLLECTIONOF SUBKIND SUBQUALITYOF SUBSETS TERMINATION TIME_TYPE TRIGGERS VALUE WHEREontology : import_list package_list\n                    | package_listimport_list : import_statement\n                       | import_list import_statementimport_statement : IMPORT CLASS_NAME\n                            | IMPORT RELATION_NAMEpackage_list : package\n                        | package_list packagepackage : PACKAGE package_name LBRACE declarations RBRACEpackage : PACKAGE package_name declarationspackage_name : CLASS_NAME\n                        | RELATION_NAMEdeclarations : declarations : declarations declarationdeclaration : class_declaration\n                       | datatype_declaration\n                       | enum_declaration\n                       | generalization_declaration\n                       | relation_declarationclass_declaration : class_stereotype CLASS_NAMEclass_declaration : class_stereotype CLASS_NAME SPECIALIZES parent_listclass_declaration : class_stereotype CLASS_NAME LBRACE class_body RBRACEclass_declaration : class_stereotype CLASS_NAME SPECIALIZES parent_list LBRACE class_body RBRACEclass_declaration : class_stereotype CLASS_NAME OF partition_nameclass_declaration : class_stereotype CLASS_NAME OF partition_name SPECIALIZES parent_listclass_declaration : class_stereotype CLASS_NAME OF partition_name LBRACE class_body RBRACEclass_declaration : class_stereotype CLASS_NAME OF partition_name SPECIALIZES parent_list LBRACE class_body RBRACEpartition_name : FUNCTIONAL_COMPLEXES\n                          | RELATORS\n                          | INTRINSIC_MODESparent_list : CLASS_NAMEparent_list : parent_list COMMA CLASS_NAMEclass_stereotype : KIND\n                            | SUBKIND\n                            | ROLE\n                            | PHASE\n                            | CATEGORY\n                            | MIXIN\n                            | PHASEMIXIN\n                            | ROLEMIXIN\n                            | HISTORICALROLEMIXIN\n                            | COLLECTIVE\n                            | QUANTITY\n                            | QUALITY\n                            | MODE\n                            | INTRINSICMODE\n                            | EXTRINSICMODE\n                            | EVENT\n                            | SITUATION\n                            | PROCESS\n                            | HISTORICALROLE\n                            | RELATORclass_body : class_body : class_body class_memberclass_member : attribute_declaration\n                        | internal_relation_declaration\n                        | standalone_stereotypestandalone_stereotype : AT relation_stereotypeattribute_declaration : RELATION_NAME COLON type_reference %prec ATTRIBUTE\n                                  | RELATION_NAME COLON type_reference cardinalitytype_reference : NUMBER_TYPE\n                          | STRING_TYPE\n                          | BOOLEAN_TYPE\n                          | DATE_TYPE\n                          | TIME_TYPE\n                          | DATETIME_TYPE\n                          | CLASS_NAME\n                          | CUSTOM_DATATYPEdatatype_declaration : CUSTOM_DATATYPE LBRACE datatype_body RBRACEdatatype_body : datatype_body : datatype_body attribute_declarationenum_declaration : ENUM CLASS_NAME LBRACE instance_list RBRACEinstance_list : instance_nameinstance_list : instance_list COMMA instance_nameinstance_name : CLASS_NAME\n                         | INSTANCE_NAMEgeneralization_declaration : genset_modifiers GENSET genset_name WHERE GENERAL CLASS_NAME SPECIFICS class_name_listgeneralization_declaration : genset_modifiers GENSET genset_name LBRACE genset_body RBRACEgenset_name : CLASS_NAME\n                       | RELATION_NAMEgenset_modifiers : genset_modifiers : DISJOINTgenset_modifiers : COMPLETEgenset_modifiers : OVERLAPPINGgenset_modifiers : INCOMPLETEgenset_modifiers : DISJOINT COMPLETE\n                            | COMPLETE DISJOINTgenset_modifiers : OVERLAPPING INCOMPLETE\n                            | INCOMPLETE OVERLAPPINGgenset_body : GENERAL CLASS_NAME SPECIFICS class_name_listclass_name_list : CLASS_NAMEclass_name_list : class_name_list COMMA CLASS_NAMEcardinality : LBRACKET ASTERISK RBRACKETcardinality : LBRACKET INTEGER RBRACKETcardinality : LBRACKET INTEGER DOTDOT INTEGER RBRACKETcardinality : LBRACKET INTEGER DOTDOT ASTERISK RBRACKETrelation_tail : arrow_symbol cardinality CLASS_NAMErelation_tail : arrow_symbol CLASS_NAMEinternal_relation_declaration : relation_stereotype cardinality relation_tailinternal_relation_declaration : relation_stereotype RELATION_NAME cardinality relation_tailinternal_relation_declaration : relation_stereotype arrow_symbol CLASS_NAMEinternal_relation_declaration : relation_stereotype RELATION_NAME arrow_symbol CLASS_NAMEinternal_relation_declaration : arrow_symbol RELATION_NAME relation_tailinternal_relation_declaration : cardinality relation_tailrelation_declaration : AT relation_stereotype RELATION CLASS_NAME cardinality arrow_symbol RELATION_NAME relation_tailrelation_declaration : AT relation_stereotype RELATION CLASS_NAME cardinality relation_tailrelation_declaration : AT relation_stereotype RELATION CLASS_NAME arrow_symbol CLASS_NAMErelation_declaration : relation_stereotype CLASS_NAME cardinality relation_tailrelation_declaration : relation_stereotype CLASS_NAME arrow_symbol CLASS_NAMErelation_stereotype : MATERIAL\n                               | MEDIATION\n                               | CHARACTERIZATION\n                               | DERIVATION\n                               | COMPARATIVE\n                               | EXTERNALDEPENDENCE\n                               | COMPONENTOF\n                               | MEMBEROF\n                               | SUBCOLLECTIONOF\n                               | SUBQUALITYOF\n                               | INSTANTIATION\n                               | TERMINATION\n                               | PARTICIPATIONAL\n                               | PARTICIPATION\n                               | HISTORICALDEPENDENCE\n                               | CREATION\n                               | MANIFESTATION\n                               | BRINGSABOUT\n                               | TRIGGERS\n                               | COMPOSITION\n                               | AGGREGATION\n                               | INHERENCE\n                               | VALUE\n                               | FORMAL\n                               | CONSTITUTIONarrow_symbol : ARROW_LEFT\n                        | ARROW_RIGHT\n                        | ARROW'
     
-_lr_action_items = {'IMPORT':([0,2,4,9,11,],[6,6,-3,-4,-5,]),'PACKAGE':([0,2,3,4,5,8,9,10,11,12,14,16,17,18,19,20,21,77,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[7,7,7,-3,-6,7,-4,-7,-5,-10,-9,-11,-12,-13,-14,-15,-16,-8,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'$end':([1,3,5,8,10,12,14,16,17,18,19,20,21,77,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[0,-2,-6,-1,-7,-10,-9,-11,-12,-13,-14,-15,-16,-8,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'CLASS_NAME':([6,7,22,24,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,81,88,91,93,95,97,98,99,111,116,125,127,128,130,132,133,134,135,140,157,163,166,167,168,169,170,172,173,174,175,177,183,185,187,188,],[11,12,78,80,83,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,92,100,106,110,112,-119,-120,-121,-82,138,151,153,154,156,158,159,-78,-79,164,-82,-82,176,178,179,179,182,-80,-81,184,-82,186,-82,189,190,191,]),'LBRACE':([12,23,78,80,92,100,101,138,],[13,79,89,91,109,-21,115,-22,]),'CUSTOM_DATATYPE':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,125,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,23,23,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,152,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'ENUM':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,24,24,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'AT':([12,13,14,15,16,17,18,19,20,21,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,26,26,-11,-12,-13,-14,-15,-16,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,124,-58,-93,-43,-19,-44,-45,-46,-47,-61,124,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'KIND':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,28,28,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'SUBKIND':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,29,29,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'ROLE':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,30,30,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'PHASE':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,31,31,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'CATEGORY':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,32,32,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'MIXIN':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,33,33,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'PHASEMIXIN':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,34,34,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'ROLEMIXIN':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,35,35,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'HISTORICALROLEMIXIN':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,36,36,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'COLLECTIVE':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,37,37,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'QUANTITY':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,38,38,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'QUALITY':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,39,39,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'MODE':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,40,40,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'INTRINSICMODE':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,41,41,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'EXTRINSICMODE':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,42,42,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'EVENT':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,43,43,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'SITUATION':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,44,44,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'PROCESS':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,45,45,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'HISTORICALROLE':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,46,46,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'RELATOR':([12,13,14,15,16,17,18,19,20,21,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,47,47,-11,-12,-13,-14,-15,-16,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'DISJOINT':([12,13,14,15,16,17,18,19,20,21,49,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,48,48,-11,-12,-13,-14,-15,-16,85,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'COMPLETE':([12,13,14,15,16,17,18,19,20,21,48,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,49,49,-11,-12,-13,-14,-15,-16,84,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'OVERLAPPING':([12,13,14,15,16,17,18,19,20,21,51,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,50,50,-11,-12,-13,-14,-15,-16,87,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'INCOMPLETE':([12,13,14,15,16,17,18,19,20,21,50,78,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,51,51,-11,-12,-13,-14,-15,-16,86,-17,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'MATERIAL':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,52,52,-11,-12,-13,-14,-15,-16,52,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,52,-58,-93,-43,-19,-44,-45,-46,-47,52,-61,52,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'MEDIATION':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,53,53,-11,-12,-13,-14,-15,-16,53,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,53,-58,-93,-43,-19,-44,-45,-46,-47,53,-61,53,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'CHARACTERIZATION':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,54,54,-11,-12,-13,-14,-15,-16,54,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,54,-58,-93,-43,-19,-44,-45,-46,-47,54,-61,54,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'DERIVATION':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,55,55,-11,-12,-13,-14,-15,-16,55,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,55,-58,-93,-43,-19,-44,-45,-46,-47,55,-61,55,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'COMPARATIVE':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,56,56,-11,-12,-13,-14,-15,-16,56,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,56,-58,-93,-43,-19,-44,-45,-46,-47,56,-61,56,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'EXTERNALDEPENDENCE':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,57,57,-11,-12,-13,-14,-15,-16,57,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,57,-58,-93,-43,-19,-44,-45,-46,-47,57,-61,57,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'COMPONENTOF':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,58,58,-11,-12,-13,-14,-15,-16,58,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,58,-58,-93,-43,-19,-44,-45,-46,-47,58,-61,58,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'MEMBEROF':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,59,59,-11,-12,-13,-14,-15,-16,59,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,59,-58,-93,-43,-19,-44,-45,-46,-47,59,-61,59,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'SUBCOLLECTIONOF':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,60,60,-11,-12,-13,-14,-15,-16,60,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,60,-58,-93,-43,-19,-44,-45,-46,-47,60,-61,60,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'SUBQUALITYOF':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,61,61,-11,-12,-13,-14,-15,-16,61,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,61,-58,-93,-43,-19,-44,-45,-46,-47,61,-61,61,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'INSTANTIATION':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,62,62,-11,-12,-13,-14,-15,-16,62,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,62,-58,-93,-43,-19,-44,-45,-46,-47,62,-61,62,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'TERMINATION':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,63,63,-11,-12,-13,-14,-15,-16,63,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,63,-58,-93,-43,-19,-44,-45,-46,-47,63,-61,63,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'PARTICIPATIONAL':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,64,64,-11,-12,-13,-14,-15,-16,64,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,64,-58,-93,-43,-19,-44,-45,-46,-47,64,-61,64,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'PARTICIPATION':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,65,65,-11,-12,-13,-14,-15,-16,65,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,65,-58,-93,-43,-19,-44,-45,-46,-47,65,-61,65,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'HISTORICALDEPENDENCE':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,66,66,-11,-12,-13,-14,-15,-16,66,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,66,-58,-93,-43,-19,-44,-45,-46,-47,66,-61,66,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'CREATION':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,67,67,-11,-12,-13,-14,-15,-16,67,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,67,-58,-93,-43,-19,-44,-45,-46,-47,67,-61,67,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'MANIFESTATION':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,68,68,-11,-12,-13,-14,-15,-16,68,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,68,-58,-93,-43,-19,-44,-45,-46,-47,68,-61,68,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'BRINGSABOUT':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,69,69,-11,-12,-13,-14,-15,-16,69,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,69,-58,-93,-43,-19,-44,-45,-46,-47,69,-61,69,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'TRIGGERS':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,70,70,-11,-12,-13,-14,-15,-16,70,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,70,-58,-93,-43,-19,-44,-45,-46,-47,70,-61,70,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'COMPOSITION':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,71,71,-11,-12,-13,-14,-15,-16,71,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,71,-58,-93,-43,-19,-44,-45,-46,-47,71,-61,71,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'AGGREGATION':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,72,72,-11,-12,-13,-14,-15,-16,72,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,72,-58,-93,-43,-19,-44,-45,-46,-47,72,-61,72,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'INHERENCE':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,73,73,-11,-12,-13,-14,-15,-16,73,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,73,-58,-93,-43,-19,-44,-45,-46,-47,73,-61,73,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'VALUE':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,74,74,-11,-12,-13,-14,-15,-16,74,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,74,-58,-93,-43,-19,-44,-45,-46,-47,74,-61,74,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'FORMAL':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,75,75,-11,-12,-13,-14,-15,-16,75,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,75,-58,-93,-43,-19,-44,-45,-46,-47,75,-61,75,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'CONSTITUTION':([12,13,14,15,16,17,18,19,20,21,26,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,89,100,101,102,103,112,115,117,118,119,120,121,124,126,137,138,143,144,145,146,147,148,149,150,151,152,155,158,159,162,164,176,178,179,180,182,184,186,189,190,191,],[-10,-10,76,76,-11,-12,-13,-14,-15,-16,76,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-43,-21,-18,76,-58,-93,-43,-19,-44,-45,-46,-47,76,-61,76,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-65,-91,-92,-20,-85,-86,-88,-76,-64,-90,-83,-87,-84,-77,-89,]),'GENSET':([12,13,14,15,16,17,18,19,20,21,25,48,49,50,51,78,84,85,86,87,100,101,103,112,117,126,138,155,158,159,162,179,180,182,190,191,],[-10,-10,-66,-66,-11,-12,-13,-14,-15,-16,81,-67,-68,-69,-70,-17,-71,-72,-73,-74,-21,-18,-58,-93,-19,-61,-22,-65,-91,-92,-20,-76,-64,-90,-77,-89,]),'RBRACE':([13,15,16,17,18,19,20,21,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,89,90,100,101,102,103,104,106,107,112,115,117,118,119,120,121,126,129,137,138,143,144,145,146,147,148,149,150,151,152,153,155,158,159,162,164,176,178,179,180,181,182,184,186,189,190,191,],[-10,77,-11,-12,-13,-14,-15,-16,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-17,-59,-43,103,-21,-18,117,-58,-60,-62,126,-93,-43,-19,-44,-45,-46,-47,-61,155,162,-22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-63,-65,-91,-92,-20,-85,-86,-88,-76,-64,-75,-90,-83,-87,-84,-77,-89,]),'RELATION':([52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,82,],[-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,93,]),'RELATION_NAME':([52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,89,90,97,98,99,102,104,115,118,119,120,121,122,123,137,143,144,145,146,147,148,149,150,151,152,157,164,176,178,184,186,189,],[-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,-59,-43,105,-119,-120,-121,105,-60,-43,-44,-45,-46,-47,141,142,105,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,171,-85,-86,-88,-83,-87,-84,]),'LBRACKET':([52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,83,97,98,99,110,111,122,141,157,163,167,175,183,],[-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,96,-119,-120,-121,96,96,96,96,96,96,96,96,96,]),'ARROW_LEFT':([52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,83,89,94,102,110,115,118,119,120,121,122,131,134,135,137,139,141,142,143,144,145,146,147,148,149,150,151,152,164,165,171,172,173,176,178,184,186,189,],[-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,97,-43,97,97,97,-43,-44,-45,-46,-47,97,97,-78,-79,97,97,97,97,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-85,97,97,-80,-81,-86,-88,-83,-87,-84,]),'ARROW_RIGHT':([52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,83,89,94,102,110,115,118,119,120,121,122,131,134,135,137,139,141,142,143,144,145,146,147,148,149,150,151,152,164,165,171,172,173,176,178,184,186,189,],[-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,98,-43,98,98,98,-43,-44,-45,-46,-47,98,98,-78,-79,98,98,98,98,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-85,98,98,-80,-81,-86,-88,-83,-87,-84,]),'ARROW':([52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,83,89,94,102,110,115,118,119,120,121,122,131,134,135,137,139,141,142,143,144,145,146,147,148,149,150,151,152,164,165,171,172,173,176,178,184,186,189,],[-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-110,-111,-112,-113,-114,-115,-116,-117,-118,99,-43,99,99,99,-43,-44,-45,-46,-47,99,99,-78,-79,99,99,99,99,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-85,99,99,-80,-81,-86,-88,-83,-87,-84,]),'SPECIALIZES':([78,],[88,]),'WHERE':([92,],[108,]),'ASTERISK':([96,136,],[113,161,]),'INTEGER':([96,136,],[114,160,]),'COMMA':([100,101,106,107,138,153,179,180,181,190,],[-21,116,-62,127,-22,-63,-76,187,187,-77,]),'COLON':([105,],[125,]),'GENERAL':([108,109,],[128,130,]),'RBRACKET':([113,114,160,161,],[134,135,172,173,]),'DOTDOT':([114,],[136,]),'NUMBER_TYPE':([125,],[145,]),'STRING_TYPE':([125,],[146,]),'BOOLEAN_TYPE':([125,],[147,]),'DATE_TYPE':([125,],[148,]),'TIME_TYPE':([125,],[149,]),'DATETIME_TYPE':([125,],[150,]),'SPECIFICS':([154,156,],[168,169,]),}
+_lr_action_items = {'IMPORT':([0,2,4,9,11,12,],[6,6,-3,-4,-5,-6,]),'PACKAGE':([0,2,3,4,5,8,9,10,11,12,13,14,15,17,19,20,21,22,23,24,80,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[7,7,7,-3,-7,7,-4,-8,-5,-6,-13,-11,-12,-10,-14,-15,-16,-17,-18,-19,-9,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'$end':([1,3,5,8,10,13,14,15,17,19,20,21,22,23,24,80,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[0,-2,-7,-1,-8,-13,-11,-12,-10,-14,-15,-16,-17,-18,-19,-9,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'CLASS_NAME':([6,7,25,27,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,91,95,99,101,103,104,105,124,129,139,141,143,144,146,148,149,151,152,159,177,186,192,193,195,196,205,],[11,14,81,83,86,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,97,106,116,122,125,-135,-136,-137,150,155,106,171,116,174,176,179,180,-93,-94,187,150,198,200,200,-95,-96,206,]),'RELATION_NAME':([6,7,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,82,84,92,94,103,104,105,108,114,128,131,132,133,134,136,137,140,150,151,152,154,156,161,163,164,165,166,167,168,169,170,171,172,177,180,184,187,188,189,191,195,196,197,198,199,],[12,15,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-70,98,-53,115,-135,-136,-137,115,-71,-53,-54,-55,-56,-57,158,160,-53,-98,-93,-94,115,-104,-58,115,-59,-61,-62,-63,-64,-65,-66,-67,-68,194,-97,-99,-101,-103,-53,-60,-95,-96,-100,-102,115,]),'LBRACE':([13,14,15,26,81,83,96,97,98,106,107,109,110,111,112,155,162,],[16,-11,-12,82,92,95,121,-79,-80,-31,128,140,-28,-29,-30,-32,189,]),'CUSTOM_DATATYPE':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,141,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,26,26,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,172,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'ENUM':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,27,27,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'AT':([13,14,15,16,17,18,19,20,21,22,23,24,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,29,29,-14,-15,-16,-17,-18,-19,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,138,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,-53,-72,-98,-93,-94,138,-32,-104,-58,-25,138,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,138,-91,-77,-105,-27,-92,]),'KIND':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,31,31,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'SUBKIND':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,32,32,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'ROLE':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,33,33,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'PHASE':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,34,34,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'CATEGORY':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,35,35,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'MIXIN':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,36,36,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'PHASEMIXIN':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,37,37,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'ROLEMIXIN':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,38,38,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'HISTORICALROLEMIXIN':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,39,39,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'COLLECTIVE':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,40,40,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'QUANTITY':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,41,41,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'QUALITY':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,42,42,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'MODE':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,43,43,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'INTRINSICMODE':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,44,44,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'EXTRINSICMODE':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,45,45,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'EVENT':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,46,46,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'SITUATION':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,47,47,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'PROCESS':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,48,48,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'HISTORICALROLE':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,49,49,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'RELATOR':([13,14,15,16,17,18,19,20,21,22,23,24,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,50,50,-14,-15,-16,-17,-18,-19,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'DISJOINT':([13,14,15,16,17,18,19,20,21,22,23,24,52,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,51,51,-14,-15,-16,-17,-18,-19,88,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'COMPLETE':([13,14,15,16,17,18,19,20,21,22,23,24,51,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,52,52,-14,-15,-16,-17,-18,-19,87,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'OVERLAPPING':([13,14,15,16,17,18,19,20,21,22,23,24,54,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,53,53,-14,-15,-16,-17,-18,-19,90,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'INCOMPLETE':([13,14,15,16,17,18,19,20,21,22,23,24,53,81,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,54,54,-14,-15,-16,-17,-18,-19,89,-20,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'MATERIAL':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,55,55,-14,-15,-16,-17,-18,-19,55,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,55,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,55,-53,-72,-98,-93,-94,55,-32,-104,-58,-25,55,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,55,-91,-77,-105,-27,-92,]),'MEDIATION':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,56,56,-14,-15,-16,-17,-18,-19,56,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,56,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,56,-53,-72,-98,-93,-94,56,-32,-104,-58,-25,56,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,56,-91,-77,-105,-27,-92,]),'CHARACTERIZATION':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,57,57,-14,-15,-16,-17,-18,-19,57,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,57,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,57,-53,-72,-98,-93,-94,57,-32,-104,-58,-25,57,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,57,-91,-77,-105,-27,-92,]),'DERIVATION':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,58,58,-14,-15,-16,-17,-18,-19,58,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,58,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,58,-53,-72,-98,-93,-94,58,-32,-104,-58,-25,58,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,58,-91,-77,-105,-27,-92,]),'COMPARATIVE':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,59,59,-14,-15,-16,-17,-18,-19,59,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,59,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,59,-53,-72,-98,-93,-94,59,-32,-104,-58,-25,59,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,59,-91,-77,-105,-27,-92,]),'EXTERNALDEPENDENCE':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,60,60,-14,-15,-16,-17,-18,-19,60,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,60,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,60,-53,-72,-98,-93,-94,60,-32,-104,-58,-25,60,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,60,-91,-77,-105,-27,-92,]),'COMPONENTOF':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,61,61,-14,-15,-16,-17,-18,-19,61,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,61,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,61,-53,-72,-98,-93,-94,61,-32,-104,-58,-25,61,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,61,-91,-77,-105,-27,-92,]),'MEMBEROF':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,62,62,-14,-15,-16,-17,-18,-19,62,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,62,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,62,-53,-72,-98,-93,-94,62,-32,-104,-58,-25,62,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,62,-91,-77,-105,-27,-92,]),'SUBCOLLECTIONOF':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,63,63,-14,-15,-16,-17,-18,-19,63,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,63,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,63,-53,-72,-98,-93,-94,63,-32,-104,-58,-25,63,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,63,-91,-77,-105,-27,-92,]),'SUBQUALITYOF':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,64,64,-14,-15,-16,-17,-18,-19,64,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,64,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,64,-53,-72,-98,-93,-94,64,-32,-104,-58,-25,64,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,64,-91,-77,-105,-27,-92,]),'INSTANTIATION':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,65,65,-14,-15,-16,-17,-18,-19,65,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,65,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,65,-53,-72,-98,-93,-94,65,-32,-104,-58,-25,65,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,65,-91,-77,-105,-27,-92,]),'TERMINATION':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,66,66,-14,-15,-16,-17,-18,-19,66,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,66,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,66,-53,-72,-98,-93,-94,66,-32,-104,-58,-25,66,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,66,-91,-77,-105,-27,-92,]),'PARTICIPATIONAL':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,67,67,-14,-15,-16,-17,-18,-19,67,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,67,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,67,-53,-72,-98,-93,-94,67,-32,-104,-58,-25,67,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,67,-91,-77,-105,-27,-92,]),'PARTICIPATION':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,68,68,-14,-15,-16,-17,-18,-19,68,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,68,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,68,-53,-72,-98,-93,-94,68,-32,-104,-58,-25,68,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,68,-91,-77,-105,-27,-92,]),'HISTORICALDEPENDENCE':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,69,69,-14,-15,-16,-17,-18,-19,69,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,69,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,69,-53,-72,-98,-93,-94,69,-32,-104,-58,-25,69,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,69,-91,-77,-105,-27,-92,]),'CREATION':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,70,70,-14,-15,-16,-17,-18,-19,70,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,70,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,70,-53,-72,-98,-93,-94,70,-32,-104,-58,-25,70,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,70,-91,-77,-105,-27,-92,]),'MANIFESTATION':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,71,71,-14,-15,-16,-17,-18,-19,71,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,71,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,71,-53,-72,-98,-93,-94,71,-32,-104,-58,-25,71,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,71,-91,-77,-105,-27,-92,]),'BRINGSABOUT':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,72,72,-14,-15,-16,-17,-18,-19,72,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,72,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,72,-53,-72,-98,-93,-94,72,-32,-104,-58,-25,72,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,72,-91,-77,-105,-27,-92,]),'TRIGGERS':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,73,73,-14,-15,-16,-17,-18,-19,73,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,73,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,73,-53,-72,-98,-93,-94,73,-32,-104,-58,-25,73,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,73,-91,-77,-105,-27,-92,]),'COMPOSITION':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,74,74,-14,-15,-16,-17,-18,-19,74,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,74,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,74,-53,-72,-98,-93,-94,74,-32,-104,-58,-25,74,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,74,-91,-77,-105,-27,-92,]),'AGGREGATION':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,75,75,-14,-15,-16,-17,-18,-19,75,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,75,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,75,-53,-72,-98,-93,-94,75,-32,-104,-58,-25,75,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,75,-91,-77,-105,-27,-92,]),'INHERENCE':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,76,76,-14,-15,-16,-17,-18,-19,76,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,76,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,76,-53,-72,-98,-93,-94,76,-32,-104,-58,-25,76,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,76,-91,-77,-105,-27,-92,]),'VALUE':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,77,77,-14,-15,-16,-17,-18,-19,77,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,77,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,77,-53,-72,-98,-93,-94,77,-32,-104,-58,-25,77,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,77,-91,-77,-105,-27,-92,]),'FORMAL':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,78,78,-14,-15,-16,-17,-18,-19,78,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,78,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,78,-53,-72,-98,-93,-94,78,-32,-104,-58,-25,78,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,78,-91,-77,-105,-27,-92,]),'CONSTITUTION':([13,14,15,16,17,18,19,20,21,22,23,24,29,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,92,106,107,108,109,110,111,112,113,123,125,128,130,131,132,133,134,138,140,142,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,203,204,206,],[-13,-11,-12,-13,79,79,-14,-15,-16,-17,-18,-19,79,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-53,-31,-21,79,-24,-28,-29,-30,-69,-108,-109,-53,-22,-54,-55,-56,-57,79,-53,-72,-98,-93,-94,79,-32,-104,-58,-25,79,-59,-61,-62,-63,-64,-65,-66,-67,-68,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,79,-91,-77,-105,-27,-92,]),'GENSET':([13,14,15,16,17,18,19,20,21,22,23,24,28,51,52,53,54,81,87,88,89,90,106,107,109,110,111,112,113,123,125,130,142,150,155,162,175,178,179,180,183,190,200,201,203,204,206,],[-13,-11,-12,-13,-81,-81,-14,-15,-16,-17,-18,-19,84,-82,-83,-84,-85,-20,-86,-87,-88,-89,-31,-21,-24,-28,-29,-30,-69,-108,-109,-22,-72,-98,-32,-25,-78,-106,-107,-97,-23,-26,-91,-77,-105,-27,-92,]),'RBRACE':([16,18,19,20,21,22,23,24,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,82,92,94,106,107,108,109,110,111,112,113,114,116,117,118,119,123,125,128,130,131,132,133,134,140,142,145,150,151,152,154,155,156,161,162,163,164,165,166,167,168,169,170,171,172,173,175,178,179,180,183,184,187,188,189,190,191,195,196,197,198,199,200,201,202,203,204,206,],[-13,80,-14,-15,-16,-17,-18,-19,-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-20,-70,-53,113,-31,-21,130,-24,-28,-29,-30,-69,-71,-75,142,-73,-76,-108,-109,-53,-22,-54,-55,-56,-57,-53,-72,175,-98,-93,-94,183,-32,-104,-58,-25,190,-59,-61,-62,-63,-64,-65,-66,-67,-68,-74,-78,-106,-107,-97,-23,-99,-101,-103,-53,-26,-60,-95,-96,-100,-102,204,-91,-77,-90,-105,-27,-92,]),'RELATION':([55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,85,],[-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,99,]),'LBRACKET':([55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,86,92,103,104,105,108,122,124,128,131,132,133,134,136,140,150,151,152,154,156,158,161,163,164,165,166,167,168,169,170,171,172,177,180,184,187,188,189,191,195,196,197,198,199,],[-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,102,-53,-135,-136,-137,102,102,102,-53,-54,-55,-56,-57,102,-53,-98,-93,-94,102,-104,102,-58,102,102,-61,-62,-63,-64,-65,-66,-67,-68,102,-97,-99,-101,-103,-53,-60,-95,-96,-100,-102,102,]),'ARROW_LEFT':([55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,86,92,100,108,122,128,131,132,133,134,135,136,140,147,150,151,152,154,156,157,158,160,161,163,164,165,166,167,168,169,170,171,172,180,184,185,187,188,189,191,194,195,196,197,198,199,],[-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,103,-53,103,103,103,-53,-54,-55,-56,-57,103,103,-53,103,-98,-93,-94,103,-104,103,103,103,-58,103,-59,-61,-62,-63,-64,-65,-66,-67,-68,-97,-99,103,-101,-103,-53,-60,103,-95,-96,-100,-102,103,]),'ARROW_RIGHT':([55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,86,92,100,108,122,128,131,132,133,134,135,136,140,147,150,151,152,154,156,157,158,160,161,163,164,165,166,167,168,169,170,171,172,180,184,185,187,188,189,191,194,195,196,197,198,199,],[-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,104,-53,104,104,104,-53,-54,-55,-56,-57,104,104,-53,104,-98,-93,-94,104,-104,104,104,104,-58,104,-59,-61,-62,-63,-64,-65,-66,-67,-68,-97,-99,104,-101,-103,-53,-60,104,-95,-96,-100,-102,104,]),'ARROW':([55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,86,92,100,108,122,128,131,132,133,134,135,136,140,147,150,151,152,154,156,157,158,160,161,163,164,165,166,167,168,169,170,171,172,180,184,185,187,188,189,191,194,195,196,197,198,199,],[-110,-111,-112,-113,-114,-115,-116,-117,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,105,-53,105,105,105,-53,-54,-55,-56,-57,105,105,-53,105,-98,-93,-94,105,-104,105,105,105,-58,105,-59,-61,-62,-63,-64,-65,-66,-67,-68,-97,-99,105,-101,-103,-53,-60,105,-95,-96,-100,-102,105,]),'SPECIALIZES':([81,109,110,111,112,],[91,139,-28,-29,-30,]),'OF':([81,],[93,]),'FUNCTIONAL_COMPLEXES':([93,],[110,]),'RELATORS':([93,],[111,]),'INTRINSIC_MODES':([93,],[112,]),'INSTANCE_NAME':([95,143,],[119,119,]),'WHERE':([96,97,98,],[120,-79,-80,]),'ASTERISK':([102,153,],[126,182,]),'INTEGER':([102,153,],[127,181,]),'COMMA':([106,107,116,117,118,119,155,162,173,200,201,202,206,],[-31,129,-75,143,-73,-76,-32,129,-74,-91,205,205,-92,]),'COLON':([115,],[141,]),'GENERAL':([120,121,],[144,146,]),'RBRACKET':([126,127,181,182,],[151,152,195,196,]),'DOTDOT':([127,],[153,]),'NUMBER_TYPE':([141,],[165,]),'STRING_TYPE':([141,],[166,]),'BOOLEAN_TYPE':([141,],[167,]),'DATE_TYPE':([141,],[168,]),'TIME_TYPE':([141,],[169,]),'DATETIME_TYPE':([141,],[170,]),'SPECIFICS':([174,176,],[192,193,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'ontology':([0,],[1,]),'import_list':([0,],[2,]),'package_list':([0,2,],[3,8,]),'import_statement':([0,2,],[4,9,]),'package':([0,2,3,8,],[5,5,10,10,]),'declarations':([12,13,],[14,15,]),'declaration':([14,15,],[16,16,]),'class_declaration':([14,15,],[17,17,]),'datatype_declaration':([14,15,],[18,18,]),'enum_declaration':([14,15,],[19,19,]),'generalization_declaration':([14,15,],[20,20,]),'relation_declaration':([14,15,],[21,21,]),'class_stereotype':([14,15,],[22,22,]),'genset_modifiers':([14,15,],[25,25,]),'relation_stereotype':([14,15,26,102,124,137,],[27,27,82,122,143,122,]),'datatype_body':([79,],[90,]),'cardinality':([83,110,111,122,141,157,163,167,175,183,],[94,131,133,139,165,170,174,177,185,188,]),'arrow_symbol':([83,94,102,110,122,131,137,139,141,142,165,171,],[95,111,123,132,140,157,123,163,166,167,175,183,]),'parent_list':([88,],[101,]),'class_body':([89,115,],[102,137,]),'attribute_declaration':([90,102,137,],[104,119,119,]),'instance_list':([91,],[107,]),'class_member':([102,137,],[118,118,]),'internal_relation_declaration':([102,137,],[120,120,]),'standalone_stereotype':([102,137,],[121,121,]),'genset_body':([109,],[129,]),'type_reference':([125,],[144,]),'class_name_list':([168,169,],[180,181,]),}
+_lr_goto_items = {'ontology':([0,],[1,]),'import_list':([0,],[2,]),'package_list':([0,2,],[3,8,]),'import_statement':([0,2,],[4,9,]),'package':([0,2,3,8,],[5,5,10,10,]),'package_name':([7,],[13,]),'declarations':([13,16,],[17,18,]),'declaration':([17,18,],[19,19,]),'class_declaration':([17,18,],[20,20,]),'datatype_declaration':([17,18,],[21,21,]),'enum_declaration':([17,18,],[22,22,]),'generalization_declaration':([17,18,],[23,23,]),'relation_declaration':([17,18,],[24,24,]),'class_stereotype':([17,18,],[25,25,]),'genset_modifiers':([17,18,],[28,28,]),'relation_stereotype':([17,18,29,108,138,154,163,199,],[30,30,85,136,161,136,136,136,]),'datatype_body':([82,],[94,]),'genset_name':([84,],[96,]),'cardinality':([86,108,122,124,136,154,158,163,164,177,199,],[100,135,147,149,157,135,185,135,191,149,135,]),'arrow_symbol':([86,100,108,122,135,136,147,154,157,158,160,163,185,194,199,],[101,124,137,148,124,159,177,137,124,186,124,137,124,124,137,]),'parent_list':([91,139,],[107,162,]),'class_body':([92,128,140,189,],[108,154,163,199,]),'partition_name':([93,],[109,]),'attribute_declaration':([94,108,154,163,199,],[114,132,132,132,132,]),'instance_list':([95,],[117,]),'instance_name':([95,143,],[118,173,]),'relation_tail':([100,135,147,157,160,185,194,],[123,156,178,184,188,197,203,]),'class_member':([108,154,163,199,],[131,131,131,131,]),'internal_relation_declaration':([108,154,163,199,],[133,133,133,133,]),'standalone_stereotype':([108,154,163,199,],[134,134,134,134,]),'genset_body':([121,],[145,]),'type_reference':([141,],[164,]),'class_name_list':([192,193,],[201,202,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,125 +27,141 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> ontology","S'",1,None,None,None),
-  ('ontology -> import_list package_list','ontology',2,'p_ontology','parser.py',69),
-  ('ontology -> package_list','ontology',1,'p_ontology','parser.py',70),
-  ('import_list -> import_statement','import_list',1,'p_import_list','parser.py',78),
-  ('import_list -> import_list import_statement','import_list',2,'p_import_list','parser.py',79),
-  ('import_statement -> IMPORT CLASS_NAME','import_statement',2,'p_import_statement','parser.py',86),
-  ('package_list -> package','package_list',1,'p_package_list','parser.py',95),
-  ('package_list -> package_list package','package_list',2,'p_package_list','parser.py',96),
-  ('package -> PACKAGE CLASS_NAME LBRACE declarations RBRACE','package',5,'p_package_with_braces','parser.py',104),
-  ('package -> PACKAGE CLASS_NAME declarations','package',3,'p_package_without_braces','parser.py',114),
-  ('declarations -> <empty>','declarations',0,'p_declarations_empty','parser.py',124),
-  ('declarations -> declarations declaration','declarations',2,'p_declarations_list','parser.py',128),
-  ('declaration -> class_declaration','declaration',1,'p_declaration','parser.py',132),
-  ('declaration -> datatype_declaration','declaration',1,'p_declaration','parser.py',133),
-  ('declaration -> enum_declaration','declaration',1,'p_declaration','parser.py',134),
-  ('declaration -> generalization_declaration','declaration',1,'p_declaration','parser.py',135),
-  ('declaration -> relation_declaration','declaration',1,'p_declaration','parser.py',136),
-  ('class_declaration -> class_stereotype CLASS_NAME','class_declaration',2,'p_class_declaration_simple','parser.py',141),
-  ('class_declaration -> class_stereotype CLASS_NAME SPECIALIZES parent_list','class_declaration',4,'p_class_declaration_with_specializes','parser.py',153),
-  ('class_declaration -> class_stereotype CLASS_NAME LBRACE class_body RBRACE','class_declaration',5,'p_class_declaration_with_body','parser.py',165),
-  ('class_declaration -> class_stereotype CLASS_NAME SPECIALIZES parent_list LBRACE class_body RBRACE','class_declaration',7,'p_class_declaration_with_specializes_and_body','parser.py',177),
-  ('parent_list -> CLASS_NAME','parent_list',1,'p_parent_list_single','parser.py',190),
-  ('parent_list -> parent_list COMMA CLASS_NAME','parent_list',3,'p_parent_list_multiple','parser.py',194),
-  ('class_stereotype -> KIND','class_stereotype',1,'p_class_stereotype','parser.py',198),
-  ('class_stereotype -> SUBKIND','class_stereotype',1,'p_class_stereotype','parser.py',199),
-  ('class_stereotype -> ROLE','class_stereotype',1,'p_class_stereotype','parser.py',200),
-  ('class_stereotype -> PHASE','class_stereotype',1,'p_class_stereotype','parser.py',201),
-  ('class_stereotype -> CATEGORY','class_stereotype',1,'p_class_stereotype','parser.py',202),
-  ('class_stereotype -> MIXIN','class_stereotype',1,'p_class_stereotype','parser.py',203),
-  ('class_stereotype -> PHASEMIXIN','class_stereotype',1,'p_class_stereotype','parser.py',204),
-  ('class_stereotype -> ROLEMIXIN','class_stereotype',1,'p_class_stereotype','parser.py',205),
-  ('class_stereotype -> HISTORICALROLEMIXIN','class_stereotype',1,'p_class_stereotype','parser.py',206),
-  ('class_stereotype -> COLLECTIVE','class_stereotype',1,'p_class_stereotype','parser.py',207),
-  ('class_stereotype -> QUANTITY','class_stereotype',1,'p_class_stereotype','parser.py',208),
-  ('class_stereotype -> QUALITY','class_stereotype',1,'p_class_stereotype','parser.py',209),
-  ('class_stereotype -> MODE','class_stereotype',1,'p_class_stereotype','parser.py',210),
-  ('class_stereotype -> INTRINSICMODE','class_stereotype',1,'p_class_stereotype','parser.py',211),
-  ('class_stereotype -> EXTRINSICMODE','class_stereotype',1,'p_class_stereotype','parser.py',212),
-  ('class_stereotype -> EVENT','class_stereotype',1,'p_class_stereotype','parser.py',213),
-  ('class_stereotype -> SITUATION','class_stereotype',1,'p_class_stereotype','parser.py',214),
-  ('class_stereotype -> PROCESS','class_stereotype',1,'p_class_stereotype','parser.py',215),
-  ('class_stereotype -> HISTORICALROLE','class_stereotype',1,'p_class_stereotype','parser.py',216),
-  ('class_stereotype -> RELATOR','class_stereotype',1,'p_class_stereotype','parser.py',217),
-  ('class_body -> <empty>','class_body',0,'p_class_body_empty','parser.py',221),
-  ('class_body -> class_body class_member','class_body',2,'p_class_body_list','parser.py',225),
-  ('class_member -> attribute_declaration','class_member',1,'p_class_member','parser.py',229),
-  ('class_member -> internal_relation_declaration','class_member',1,'p_class_member','parser.py',230),
-  ('class_member -> standalone_stereotype','class_member',1,'p_class_member','parser.py',231),
-  ('standalone_stereotype -> AT relation_stereotype','standalone_stereotype',2,'p_standalone_stereotype','parser.py',235),
-  ('attribute_declaration -> RELATION_NAME COLON type_reference','attribute_declaration',3,'p_attribute_declaration','parser.py',244),
-  ('type_reference -> NUMBER_TYPE','type_reference',1,'p_type_reference','parser.py',254),
-  ('type_reference -> STRING_TYPE','type_reference',1,'p_type_reference','parser.py',255),
-  ('type_reference -> BOOLEAN_TYPE','type_reference',1,'p_type_reference','parser.py',256),
-  ('type_reference -> DATE_TYPE','type_reference',1,'p_type_reference','parser.py',257),
-  ('type_reference -> TIME_TYPE','type_reference',1,'p_type_reference','parser.py',258),
-  ('type_reference -> DATETIME_TYPE','type_reference',1,'p_type_reference','parser.py',259),
-  ('type_reference -> CLASS_NAME','type_reference',1,'p_type_reference','parser.py',260),
-  ('type_reference -> CUSTOM_DATATYPE','type_reference',1,'p_type_reference','parser.py',261),
-  ('datatype_declaration -> CUSTOM_DATATYPE LBRACE datatype_body RBRACE','datatype_declaration',4,'p_datatype_declaration','parser.py',266),
-  ('datatype_body -> <empty>','datatype_body',0,'p_datatype_body_empty','parser.py',276),
-  ('datatype_body -> datatype_body attribute_declaration','datatype_body',2,'p_datatype_body_list','parser.py',280),
-  ('enum_declaration -> ENUM CLASS_NAME LBRACE instance_list RBRACE','enum_declaration',5,'p_enum_declaration','parser.py',285),
-  ('instance_list -> CLASS_NAME','instance_list',1,'p_instance_list_single','parser.py',295),
-  ('instance_list -> instance_list COMMA CLASS_NAME','instance_list',3,'p_instance_list_multiple','parser.py',299),
-  ('generalization_declaration -> genset_modifiers GENSET CLASS_NAME WHERE GENERAL CLASS_NAME SPECIFICS class_name_list','generalization_declaration',8,'p_generalization_simple','parser.py',306),
-  ('generalization_declaration -> genset_modifiers GENSET CLASS_NAME LBRACE genset_body RBRACE','generalization_declaration',6,'p_generalization_complete','parser.py',319),
-  ('genset_modifiers -> <empty>','genset_modifiers',0,'p_genset_modifiers_empty','parser.py',331),
-  ('genset_modifiers -> DISJOINT','genset_modifiers',1,'p_genset_modifiers_disjoint','parser.py',335),
-  ('genset_modifiers -> COMPLETE','genset_modifiers',1,'p_genset_modifiers_complete','parser.py',339),
-  ('genset_modifiers -> OVERLAPPING','genset_modifiers',1,'p_genset_modifiers_overlapping','parser.py',343),
-  ('genset_modifiers -> INCOMPLETE','genset_modifiers',1,'p_genset_modifiers_incomplete','parser.py',347),
-  ('genset_modifiers -> DISJOINT COMPLETE','genset_modifiers',2,'p_genset_modifiers_disjoint_complete','parser.py',351),
-  ('genset_modifiers -> COMPLETE DISJOINT','genset_modifiers',2,'p_genset_modifiers_disjoint_complete','parser.py',352),
-  ('genset_modifiers -> OVERLAPPING INCOMPLETE','genset_modifiers',2,'p_genset_modifiers_overlapping_incomplete','parser.py',356),
-  ('genset_modifiers -> INCOMPLETE OVERLAPPING','genset_modifiers',2,'p_genset_modifiers_overlapping_incomplete','parser.py',357),
-  ('genset_body -> GENERAL CLASS_NAME SPECIFICS class_name_list','genset_body',4,'p_genset_body','parser.py',361),
-  ('class_name_list -> CLASS_NAME','class_name_list',1,'p_class_name_list_single','parser.py',368),
-  ('class_name_list -> class_name_list COMMA CLASS_NAME','class_name_list',3,'p_class_name_list_multiple','parser.py',372),
-  ('cardinality -> LBRACKET ASTERISK RBRACKET','cardinality',3,'p_cardinality_asterisk','parser.py',377),
-  ('cardinality -> LBRACKET INTEGER RBRACKET','cardinality',3,'p_cardinality_single','parser.py',381),
-  ('cardinality -> LBRACKET INTEGER DOTDOT INTEGER RBRACKET','cardinality',5,'p_cardinality_range','parser.py',385),
-  ('cardinality -> LBRACKET INTEGER DOTDOT ASTERISK RBRACKET','cardinality',5,'p_cardinality_range_asterisk','parser.py',389),
-  ('cardinality -> <empty>','cardinality',0,'p_cardinality_optional','parser.py',393),
-  ('internal_relation_declaration -> relation_stereotype cardinality arrow_symbol cardinality CLASS_NAME','internal_relation_declaration',5,'p_internal_relation_declaration','parser.py',400),
-  ('internal_relation_declaration -> relation_stereotype RELATION_NAME cardinality arrow_symbol cardinality CLASS_NAME','internal_relation_declaration',6,'p_internal_relation_declaration','parser.py',401),
-  ('internal_relation_declaration -> relation_stereotype arrow_symbol CLASS_NAME','internal_relation_declaration',3,'p_internal_relation_declaration','parser.py',402),
-  ('internal_relation_declaration -> relation_stereotype RELATION_NAME arrow_symbol CLASS_NAME','internal_relation_declaration',4,'p_internal_relation_declaration','parser.py',403),
-  ('internal_relation_declaration -> arrow_symbol RELATION_NAME arrow_symbol cardinality CLASS_NAME','internal_relation_declaration',5,'p_internal_relation_declaration','parser.py',404),
-  ('internal_relation_declaration -> arrow_symbol RELATION_NAME arrow_symbol CLASS_NAME','internal_relation_declaration',4,'p_internal_relation_declaration','parser.py',405),
-  ('relation_declaration -> AT relation_stereotype RELATION CLASS_NAME cardinality arrow_symbol RELATION_NAME arrow_symbol cardinality CLASS_NAME','relation_declaration',10,'p_relation_declaration','parser.py',490),
-  ('relation_declaration -> AT relation_stereotype RELATION CLASS_NAME cardinality arrow_symbol cardinality CLASS_NAME','relation_declaration',8,'p_relation_declaration','parser.py',491),
-  ('relation_declaration -> AT relation_stereotype RELATION CLASS_NAME arrow_symbol CLASS_NAME','relation_declaration',6,'p_relation_declaration','parser.py',492),
-  ('relation_declaration -> relation_stereotype CLASS_NAME cardinality arrow_symbol cardinality CLASS_NAME','relation_declaration',6,'p_relation_declaration','parser.py',493),
-  ('relation_declaration -> relation_stereotype CLASS_NAME arrow_symbol CLASS_NAME','relation_declaration',4,'p_relation_declaration','parser.py',494),
-  ('relation_stereotype -> MATERIAL','relation_stereotype',1,'p_relation_stereotype','parser.py',561),
-  ('relation_stereotype -> MEDIATION','relation_stereotype',1,'p_relation_stereotype','parser.py',562),
-  ('relation_stereotype -> CHARACTERIZATION','relation_stereotype',1,'p_relation_stereotype','parser.py',563),
-  ('relation_stereotype -> DERIVATION','relation_stereotype',1,'p_relation_stereotype','parser.py',564),
-  ('relation_stereotype -> COMPARATIVE','relation_stereotype',1,'p_relation_stereotype','parser.py',565),
-  ('relation_stereotype -> EXTERNALDEPENDENCE','relation_stereotype',1,'p_relation_stereotype','parser.py',566),
-  ('relation_stereotype -> COMPONENTOF','relation_stereotype',1,'p_relation_stereotype','parser.py',567),
-  ('relation_stereotype -> MEMBEROF','relation_stereotype',1,'p_relation_stereotype','parser.py',568),
-  ('relation_stereotype -> SUBCOLLECTIONOF','relation_stereotype',1,'p_relation_stereotype','parser.py',569),
-  ('relation_stereotype -> SUBQUALITYOF','relation_stereotype',1,'p_relation_stereotype','parser.py',570),
-  ('relation_stereotype -> INSTANTIATION','relation_stereotype',1,'p_relation_stereotype','parser.py',571),
-  ('relation_stereotype -> TERMINATION','relation_stereotype',1,'p_relation_stereotype','parser.py',572),
-  ('relation_stereotype -> PARTICIPATIONAL','relation_stereotype',1,'p_relation_stereotype','parser.py',573),
-  ('relation_stereotype -> PARTICIPATION','relation_stereotype',1,'p_relation_stereotype','parser.py',574),
-  ('relation_stereotype -> HISTORICALDEPENDENCE','relation_stereotype',1,'p_relation_stereotype','parser.py',575),
-  ('relation_stereotype -> CREATION','relation_stereotype',1,'p_relation_stereotype','parser.py',576),
-  ('relation_stereotype -> MANIFESTATION','relation_stereotype',1,'p_relation_stereotype','parser.py',577),
-  ('relation_stereotype -> BRINGSABOUT','relation_stereotype',1,'p_relation_stereotype','parser.py',578),
-  ('relation_stereotype -> TRIGGERS','relation_stereotype',1,'p_relation_stereotype','parser.py',579),
-  ('relation_stereotype -> COMPOSITION','relation_stereotype',1,'p_relation_stereotype','parser.py',580),
-  ('relation_stereotype -> AGGREGATION','relation_stereotype',1,'p_relation_stereotype','parser.py',581),
-  ('relation_stereotype -> INHERENCE','relation_stereotype',1,'p_relation_stereotype','parser.py',582),
-  ('relation_stereotype -> VALUE','relation_stereotype',1,'p_relation_stereotype','parser.py',583),
-  ('relation_stereotype -> FORMAL','relation_stereotype',1,'p_relation_stereotype','parser.py',584),
-  ('relation_stereotype -> CONSTITUTION','relation_stereotype',1,'p_relation_stereotype','parser.py',585),
-  ('arrow_symbol -> ARROW_LEFT','arrow_symbol',1,'p_arrow_symbol','parser.py',589),
-  ('arrow_symbol -> ARROW_RIGHT','arrow_symbol',1,'p_arrow_symbol','parser.py',590),
-  ('arrow_symbol -> ARROW','arrow_symbol',1,'p_arrow_symbol','parser.py',591),
+  ('ontology -> import_list package_list','ontology',2,'p_ontology','parser.py',213),
+  ('ontology -> package_list','ontology',1,'p_ontology','parser.py',214),
+  ('import_list -> import_statement','import_list',1,'p_import_list','parser.py',222),
+  ('import_list -> import_list import_statement','import_list',2,'p_import_list','parser.py',223),
+  ('import_statement -> IMPORT CLASS_NAME','import_statement',2,'p_import_statement','parser.py',230),
+  ('import_statement -> IMPORT RELATION_NAME','import_statement',2,'p_import_statement','parser.py',231),
+  ('package_list -> package','package_list',1,'p_package_list','parser.py',240),
+  ('package_list -> package_list package','package_list',2,'p_package_list','parser.py',241),
+  ('package -> PACKAGE package_name LBRACE declarations RBRACE','package',5,'p_package_with_braces','parser.py',249),
+  ('package -> PACKAGE package_name declarations','package',3,'p_package_without_braces','parser.py',260),
+  ('package_name -> CLASS_NAME','package_name',1,'p_package_name','parser.py',271),
+  ('package_name -> RELATION_NAME','package_name',1,'p_package_name','parser.py',272),
+  ('declarations -> <empty>','declarations',0,'p_declarations_empty','parser.py',276),
+  ('declarations -> declarations declaration','declarations',2,'p_declarations_list','parser.py',280),
+  ('declaration -> class_declaration','declaration',1,'p_declaration','parser.py',284),
+  ('declaration -> datatype_declaration','declaration',1,'p_declaration','parser.py',285),
+  ('declaration -> enum_declaration','declaration',1,'p_declaration','parser.py',286),
+  ('declaration -> generalization_declaration','declaration',1,'p_declaration','parser.py',287),
+  ('declaration -> relation_declaration','declaration',1,'p_declaration','parser.py',288),
+  ('class_declaration -> class_stereotype CLASS_NAME','class_declaration',2,'p_class_declaration_simple','parser.py',293),
+  ('class_declaration -> class_stereotype CLASS_NAME SPECIALIZES parent_list','class_declaration',4,'p_class_declaration_with_specializes','parser.py',305),
+  ('class_declaration -> class_stereotype CLASS_NAME LBRACE class_body RBRACE','class_declaration',5,'p_class_declaration_with_body','parser.py',317),
+  ('class_declaration -> class_stereotype CLASS_NAME SPECIALIZES parent_list LBRACE class_body RBRACE','class_declaration',7,'p_class_declaration_with_specializes_and_body','parser.py',332),
+  ('class_declaration -> class_stereotype CLASS_NAME OF partition_name','class_declaration',4,'p_class_declaration_with_partition','parser.py',348),
+  ('class_declaration -> class_stereotype CLASS_NAME OF partition_name SPECIALIZES parent_list','class_declaration',6,'p_class_declaration_with_partition_and_specializes','parser.py',361),
+  ('class_declaration -> class_stereotype CLASS_NAME OF partition_name LBRACE class_body RBRACE','class_declaration',7,'p_class_declaration_with_partition_and_body','parser.py',374),
+  ('class_declaration -> class_stereotype CLASS_NAME OF partition_name SPECIALIZES parent_list LBRACE class_body RBRACE','class_declaration',9,'p_class_declaration_with_partition_specializes_and_body','parser.py',389),
+  ('partition_name -> FUNCTIONAL_COMPLEXES','partition_name',1,'p_partition_name','parser.py',404),
+  ('partition_name -> RELATORS','partition_name',1,'p_partition_name','parser.py',405),
+  ('partition_name -> INTRINSIC_MODES','partition_name',1,'p_partition_name','parser.py',406),
+  ('parent_list -> CLASS_NAME','parent_list',1,'p_parent_list_single','parser.py',411),
+  ('parent_list -> parent_list COMMA CLASS_NAME','parent_list',3,'p_parent_list_multiple','parser.py',415),
+  ('class_stereotype -> KIND','class_stereotype',1,'p_class_stereotype','parser.py',419),
+  ('class_stereotype -> SUBKIND','class_stereotype',1,'p_class_stereotype','parser.py',420),
+  ('class_stereotype -> ROLE','class_stereotype',1,'p_class_stereotype','parser.py',421),
+  ('class_stereotype -> PHASE','class_stereotype',1,'p_class_stereotype','parser.py',422),
+  ('class_stereotype -> CATEGORY','class_stereotype',1,'p_class_stereotype','parser.py',423),
+  ('class_stereotype -> MIXIN','class_stereotype',1,'p_class_stereotype','parser.py',424),
+  ('class_stereotype -> PHASEMIXIN','class_stereotype',1,'p_class_stereotype','parser.py',425),
+  ('class_stereotype -> ROLEMIXIN','class_stereotype',1,'p_class_stereotype','parser.py',426),
+  ('class_stereotype -> HISTORICALROLEMIXIN','class_stereotype',1,'p_class_stereotype','parser.py',427),
+  ('class_stereotype -> COLLECTIVE','class_stereotype',1,'p_class_stereotype','parser.py',428),
+  ('class_stereotype -> QUANTITY','class_stereotype',1,'p_class_stereotype','parser.py',429),
+  ('class_stereotype -> QUALITY','class_stereotype',1,'p_class_stereotype','parser.py',430),
+  ('class_stereotype -> MODE','class_stereotype',1,'p_class_stereotype','parser.py',431),
+  ('class_stereotype -> INTRINSICMODE','class_stereotype',1,'p_class_stereotype','parser.py',432),
+  ('class_stereotype -> EXTRINSICMODE','class_stereotype',1,'p_class_stereotype','parser.py',433),
+  ('class_stereotype -> EVENT','class_stereotype',1,'p_class_stereotype','parser.py',434),
+  ('class_stereotype -> SITUATION','class_stereotype',1,'p_class_stereotype','parser.py',435),
+  ('class_stereotype -> PROCESS','class_stereotype',1,'p_class_stereotype','parser.py',436),
+  ('class_stereotype -> HISTORICALROLE','class_stereotype',1,'p_class_stereotype','parser.py',437),
+  ('class_stereotype -> RELATOR','class_stereotype',1,'p_class_stereotype','parser.py',438),
+  ('class_body -> <empty>','class_body',0,'p_class_body_empty','parser.py',442),
+  ('class_body -> class_body class_member','class_body',2,'p_class_body_list','parser.py',446),
+  ('class_member -> attribute_declaration','class_member',1,'p_class_member','parser.py',450),
+  ('class_member -> internal_relation_declaration','class_member',1,'p_class_member','parser.py',451),
+  ('class_member -> standalone_stereotype','class_member',1,'p_class_member','parser.py',452),
+  ('standalone_stereotype -> AT relation_stereotype','standalone_stereotype',2,'p_standalone_stereotype','parser.py',456),
+  ('attribute_declaration -> RELATION_NAME COLON type_reference','attribute_declaration',3,'p_attribute_declaration','parser.py',465),
+  ('attribute_declaration -> RELATION_NAME COLON type_reference cardinality','attribute_declaration',4,'p_attribute_declaration','parser.py',466),
+  ('type_reference -> NUMBER_TYPE','type_reference',1,'p_type_reference','parser.py',477),
+  ('type_reference -> STRING_TYPE','type_reference',1,'p_type_reference','parser.py',478),
+  ('type_reference -> BOOLEAN_TYPE','type_reference',1,'p_type_reference','parser.py',479),
+  ('type_reference -> DATE_TYPE','type_reference',1,'p_type_reference','parser.py',480),
+  ('type_reference -> TIME_TYPE','type_reference',1,'p_type_reference','parser.py',481),
+  ('type_reference -> DATETIME_TYPE','type_reference',1,'p_type_reference','parser.py',482),
+  ('type_reference -> CLASS_NAME','type_reference',1,'p_type_reference','parser.py',483),
+  ('type_reference -> CUSTOM_DATATYPE','type_reference',1,'p_type_reference','parser.py',484),
+  ('datatype_declaration -> CUSTOM_DATATYPE LBRACE datatype_body RBRACE','datatype_declaration',4,'p_datatype_declaration','parser.py',489),
+  ('datatype_body -> <empty>','datatype_body',0,'p_datatype_body_empty','parser.py',499),
+  ('datatype_body -> datatype_body attribute_declaration','datatype_body',2,'p_datatype_body_list','parser.py',503),
+  ('enum_declaration -> ENUM CLASS_NAME LBRACE instance_list RBRACE','enum_declaration',5,'p_enum_declaration','parser.py',508),
+  ('instance_list -> instance_name','instance_list',1,'p_instance_list_single','parser.py',518),
+  ('instance_list -> instance_list COMMA instance_name','instance_list',3,'p_instance_list_multiple','parser.py',522),
+  ('instance_name -> CLASS_NAME','instance_name',1,'p_instance_name','parser.py',526),
+  ('instance_name -> INSTANCE_NAME','instance_name',1,'p_instance_name','parser.py',527),
+  ('generalization_declaration -> genset_modifiers GENSET genset_name WHERE GENERAL CLASS_NAME SPECIFICS class_name_list','generalization_declaration',8,'p_generalization_simple','parser.py',534),
+  ('generalization_declaration -> genset_modifiers GENSET genset_name LBRACE genset_body RBRACE','generalization_declaration',6,'p_generalization_complete','parser.py',547),
+  ('genset_name -> CLASS_NAME','genset_name',1,'p_genset_name','parser.py',559),
+  ('genset_name -> RELATION_NAME','genset_name',1,'p_genset_name','parser.py',560),
+  ('genset_modifiers -> <empty>','genset_modifiers',0,'p_genset_modifiers_empty','parser.py',564),
+  ('genset_modifiers -> DISJOINT','genset_modifiers',1,'p_genset_modifiers_disjoint','parser.py',568),
+  ('genset_modifiers -> COMPLETE','genset_modifiers',1,'p_genset_modifiers_complete','parser.py',572),
+  ('genset_modifiers -> OVERLAPPING','genset_modifiers',1,'p_genset_modifiers_overlapping','parser.py',576),
+  ('genset_modifiers -> INCOMPLETE','genset_modifiers',1,'p_genset_modifiers_incomplete','parser.py',580),
+  ('genset_modifiers -> DISJOINT COMPLETE','genset_modifiers',2,'p_genset_modifiers_disjoint_complete','parser.py',584),
+  ('genset_modifiers -> COMPLETE DISJOINT','genset_modifiers',2,'p_genset_modifiers_disjoint_complete','parser.py',585),
+  ('genset_modifiers -> OVERLAPPING INCOMPLETE','genset_modifiers',2,'p_genset_modifiers_overlapping_incomplete','parser.py',589),
+  ('genset_modifiers -> INCOMPLETE OVERLAPPING','genset_modifiers',2,'p_genset_modifiers_overlapping_incomplete','parser.py',590),
+  ('genset_body -> GENERAL CLASS_NAME SPECIFICS class_name_list','genset_body',4,'p_genset_body','parser.py',594),
+  ('class_name_list -> CLASS_NAME','class_name_list',1,'p_class_name_list_single','parser.py',601),
+  ('class_name_list -> class_name_list COMMA CLASS_NAME','class_name_list',3,'p_class_name_list_multiple','parser.py',605),
+  ('cardinality -> LBRACKET ASTERISK RBRACKET','cardinality',3,'p_cardinality_asterisk','parser.py',610),
+  ('cardinality -> LBRACKET INTEGER RBRACKET','cardinality',3,'p_cardinality_single','parser.py',614),
+  ('cardinality -> LBRACKET INTEGER DOTDOT INTEGER RBRACKET','cardinality',5,'p_cardinality_range','parser.py',618),
+  ('cardinality -> LBRACKET INTEGER DOTDOT ASTERISK RBRACKET','cardinality',5,'p_cardinality_range_asterisk','parser.py',622),
+  ('relation_tail -> arrow_symbol cardinality CLASS_NAME','relation_tail',3,'p_relation_tail_with_cardinality','parser.py',633),
+  ('relation_tail -> arrow_symbol CLASS_NAME','relation_tail',2,'p_relation_tail','parser.py',638),
+  ('internal_relation_declaration -> relation_stereotype cardinality relation_tail','internal_relation_declaration',3,'p_internal_relation_stereotype_cardinality','parser.py',658),
+  ('internal_relation_declaration -> relation_stereotype RELATION_NAME cardinality relation_tail','internal_relation_declaration',4,'p_internal_relation_stereotype_name_cardinality','parser.py',663),
+  ('internal_relation_declaration -> relation_stereotype arrow_symbol CLASS_NAME','internal_relation_declaration',3,'p_internal_relation_stereotype','parser.py',668),
+  ('internal_relation_declaration -> relation_stereotype RELATION_NAME arrow_symbol CLASS_NAME','internal_relation_declaration',4,'p_internal_relation_stereotype_name','parser.py',673),
+  ('internal_relation_declaration -> arrow_symbol RELATION_NAME relation_tail','internal_relation_declaration',3,'p_internal_relation_named','parser.py',678),
+  ('internal_relation_declaration -> cardinality relation_tail','internal_relation_declaration',2,'p_internal_relation_cardinality','parser.py',683),
+  ('relation_declaration -> AT relation_stereotype RELATION CLASS_NAME cardinality arrow_symbol RELATION_NAME relation_tail','relation_declaration',8,'p_relation_declaration_named','parser.py',710),
+  ('relation_declaration -> AT relation_stereotype RELATION CLASS_NAME cardinality relation_tail','relation_declaration',6,'p_relation_declaration_cardinality','parser.py',715),
+  ('relation_declaration -> AT relation_stereotype RELATION CLASS_NAME arrow_symbol CLASS_NAME','relation_declaration',6,'p_relation_declaration_simple','parser.py',721),
+  ('relation_declaration -> relation_stereotype CLASS_NAME cardinality relation_tail','relation_declaration',4,'p_relation_declaration_short_cardinality','parser.py',726),
+  ('relation_declaration -> relation_stereotype CLASS_NAME arrow_symbol CLASS_NAME','relation_declaration',4,'p_relation_declaration_short','parser.py',732),
+  ('relation_stereotype -> MATERIAL','relation_stereotype',1,'p_relation_stereotype','parser.py',737),
+  ('relation_stereotype -> MEDIATION','relation_stereotype',1,'p_relation_stereotype','parser.py',738),
+  ('relation_stereotype -> CHARACTERIZATION','relation_stereotype',1,'p_relation_stereotype','parser.py',739),
+  ('relation_stereotype -> DERIVATION','relation_stereotype',1,'p_relation_stereotype','parser.py',740),
+  ('relation_stereotype -> COMPARATIVE','relation_stereotype',1,'p_relation_stereotype','parser.py',741),
+  ('relation_stereotype -> EXTERNALDEPENDENCE','relation_stereotype',1,'p_relation_stereotype','parser.py',742),
+  ('relation_stereotype -> COMPONENTOF','relation_stereotype',1,'p_relation_stereotype','parser.py',743),
+  ('relation_stereotype -> MEMBEROF','relation_stereotype',1,'p_relation_stereotype','parser.py',744),
+  ('relation_stereotype -> SUBCOLLECTIONOF','relation_stereotype',1,'p_relation_stereotype','parser.py',745),
+  ('relation_stereotype -> SUBQUALITYOF','relation_stereotype',1,'p_relation_stereotype','parser.py',746),
+  ('relation_stereotype -> INSTANTIATION','relation_stereotype',1,'p_relation_stereotype','parser.py',747),
+  ('relation_stereotype -> TERMINATION','relation_stereotype',1,'p_relation_stereotype','parser.py',748),
+  ('relation_stereotype -> PARTICIPATIONAL','relation_stereotype',1,'p_relation_stereotype','parser.py',749),
+  ('relation_stereotype -> PARTICIPATION','relation_stereotype',1,'p_relation_stereotype','parser.py',750),
+  ('relation_stereotype -> HISTORICALDEPENDENCE','relation_stereotype',1,'p_relation_stereotype','parser.py',751),
+  ('relation_stereotype -> CREATION','relation_stereotype',1,'p_relation_stereotype','parser.py',752),
+  ('relation_stereotype -> MANIFESTATION','relation_stereotype',1,'p_relation_stereotype','parser.py',753),
+  ('relation_stereotype -> BRINGSABOUT','relation_stereotype',1,'p_relation_stereotype','parser.py',754),
+  ('relation_stereotype -> TRIGGERS','relation_stereotype',1,'p_relation_stereotype','parser.py',755),
+  ('relation_stereotype -> COMPOSITION','relation_stereotype',1,'p_relation_stereotype','parser.py',756),
+  ('relation_stereotype -> AGGREGATION','relation_stereotype',1,'p_relation_stereotype','parser.py',757),
+  ('relation_stereotype -> INHERENCE','relation_stereotype',1,'p_relation_stereotype','parser.py',758),
+  ('relation_stereotype -> VALUE','relation_stereotype',1,'p_relation_stereotype','parser.py',759),
+  ('relation_stereotype -> FORMAL','relation_stereotype',1,'p_relation_stereotype','parser.py',760),
+  ('relation_stereotype -> CONSTITUTION','relation_stereotype',1,'p_relation_stereotype','parser.py',761),
+  ('arrow_symbol -> ARROW_LEFT','arrow_symbol',1,'p_arrow_symbol','parser.py',765),
+  ('arrow_symbol -> ARROW_RIGHT','arrow_symbol',1,'p_arrow_symbol','parser.py',766),
+  ('arrow_symbol -> ARROW','arrow_symbol',1,'p_arrow_symbol','parser.py',767),
 ]
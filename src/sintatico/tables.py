@@ -0,0 +1,119 @@
+"""
+Compilação das tabelas LALR do PLY para um array denso de inteiros
+
+O PLY guarda as tabelas de ação e desvio como dicionários aninhados
+(estado -> nome do símbolo -> ação). Aqui as duas viram uma única tabela
+com uma linha de largura fixa por estado:
+
+    [ações por terminal..., coluna de token desconhecido,
+     desvios por não terminal..., redução padrão]
+
+Estados são representados pelo deslocamento da sua linha (estado * largura),
+então o driver consulta ações e desvios com uma só soma, sem multiplicações.
+
+Codificação das células:
+    ERROR (0)         erro sintático (ou desvio inexistente)
+    ACCEPT (1)        aceita a entrada
+    > 1               empilha / desvia para a linha que começa nesse deslocamento
+    -r                reduz pela produção r
+Na coluna de redução padrão, -r indica que o estado reduz por r sem
+consultar o lookahead (como os "defaulted states" do PLY) e 0 que não reduz.
+"""
+import dis
+from array import array
+
+
+ERROR = 0
+ACCEPT = 1
+
+
+def _pass_through(self, p):
+    p[0] = p[1]
+
+
+def _instructions(function):
+    return [(instruction.opname, instruction.argval)
+            for instruction in dis.get_instructions(function)
+            if instruction.opname not in ('RESUME', 'NOP', 'CACHE')]
+
+
+_PASS_THROUGH = _instructions(_pass_through)
+
+
+def is_pass_through(function):
+    """True se a regra apenas repassa o valor do único símbolo (p[0] = p[1])"""
+    return function is not None and _instructions(function) == _PASS_THROUGH
+
+
+def compile_tables(lr_parser):
+    """
+    Converte as tabelas de um ply.yacc.LRParser em um dicionário com:
+
+    table            array('i') com n_states * width células
+    width            largura de cada linha
+    terminals        nomes dos terminais na ordem das colunas ('$end' é a 0)
+    token_ids        nome do terminal -> coluna
+    unknown          coluna usada para tipos de token sem ação em nenhum estado
+    nonterminals     nomes dos não terminais na ordem das colunas de desvio
+    default_column   coluna da redução padrão
+    rule_goto        array('i') produção -> coluna de desvio do não terminal gerado
+    rule_len         array('i') produção -> número de símbolos do lado direito
+    rule_action      lista produção -> função p_* (None na produção inicial)
+    rule_pass        array('b') produção -> 1 se a regra só repassa p[1] (o driver
+                     troca o estado sem chamar a função)
+    rule_name        lista produção -> nome do não terminal gerado
+    n_states         número de estados
+    """
+    actions = lr_parser.action
+    gotos = lr_parser.goto
+    productions = lr_parser.productions
+
+    n_states = max(actions) + 1
+
+    terminals = ['$end'] + sorted({name for row in actions.values() for name in row} - {'$end'})
+    if 'error' in terminals:
+        # O driver reproduz a recuperação de erros do PLY apenas para
+        # gramáticas sem produções com o token 'error'
+        raise ValueError("Gramáticas com produções de recuperação ('error') não são suportadas")
+    token_ids = {name: column for column, name in enumerate(terminals)}
+    unknown = len(terminals)
+
+    nonterminals = sorted({p.name for p in productions[1:]})
+    first_goto = unknown + 1
+    goto_columns = {name: first_goto + index for index, name in enumerate(nonterminals)}
+    default_column = first_goto + len(nonterminals)
+    width = default_column + 1
+
+    table = array('i', [ERROR]) * (n_states * width)
+    for state, row in actions.items():
+        base = state * width
+        for name, value in row.items():
+            if value > 0:
+                value *= width          # Empilha: deslocamento da linha de destino
+            elif value == 0:
+                value = ACCEPT
+            table[base + token_ids[name]] = value
+
+    for state, row in gotos.items():
+        base = state * width
+        for name, target in row.items():
+            table[base + goto_columns[name]] = target * width
+
+    for state, value in lr_parser.defaulted_states.items():
+        table[state * width + default_column] = value
+
+    return {
+        'table': table,
+        'width': width,
+        'terminals': terminals,
+        'token_ids': token_ids,
+        'unknown': unknown,
+        'nonterminals': nonterminals,
+        'default_column': default_column,
+        'rule_goto': array('i', [goto_columns.get(p.name, ERROR) for p in productions]),
+        'rule_len': array('i', [p.len for p in productions]),
+        'rule_action': [p.callable for p in productions],
+        'rule_pass': array('b', [p.len == 1 and is_pass_through(p.callable) for p in productions]),
+        'rule_name': [p.name for p in productions],
+        'n_states': n_states,
+    }